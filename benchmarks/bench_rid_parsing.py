@@ -0,0 +1,55 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Measures ResourceIdentifier parse/str round trips per second for a listing-like workload where few distinct rids
+repeat (as the transaction rid of every file in a transaction does), with and without the parse cache.
+
+Usage: python benchmarks/bench_rid_parsing.py [num_rids] [num_distinct]
+"""
+
+import sys
+import time
+import uuid
+
+from palantir.core import types
+from palantir.core.types import ResourceIdentifier
+
+
+def _run(name, values):
+    start = time.perf_counter()
+    for value in values:
+        str(ResourceIdentifier.from_string(value))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {len(values) / elapsed:12.1f} round trips/sec")
+
+
+def main():
+    num_rids = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    num_distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    distinct = [
+        f"ri.foundry.main.transaction.{uuid.uuid4()}" for _ in range(num_distinct)
+    ]
+    values = [distinct[i % num_distinct] for i in range(num_rids)]
+
+    cached = types._parse_rid  # pylint: disable=protected-access
+    types._parse_rid = cached.__wrapped__  # pylint: disable=protected-access
+    try:
+        _run("uncached", values)
+    finally:
+        types._parse_rid = cached  # pylint: disable=protected-access
+    _run("cached", values)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Measures RPCs/sec against a local HTTP server, creating a fresh ``RequestsClient`` (and session) per RPC as the SDK
+used to, versus reusing the pooled session owned by :class:`palantir.core.rpc.ConjureClient`.
+
+Usage: python benchmarks/bench_rpc_pooling.py [num_rpcs]
+"""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from conjure_python_client import RequestsClient, Service, ServiceConfiguration
+
+from palantir.core.rpc import ConjureClient, get_user_agent
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class PingService(Service):
+    def ping(self):
+        return self._request("GET", self._uri + "/ping").json()
+
+
+def _unpooled(uri: str) -> PingService:
+    config = ServiceConfiguration()
+    config.uris = [uri]
+    return RequestsClient.create(PingService, get_user_agent(), config)
+
+
+def _run(name, get_service, num_rpcs):
+    start = time.perf_counter()
+    for _ in range(num_rpcs):
+        get_service().ping()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {num_rpcs / elapsed:10.1f} RPCs/sec")
+
+
+def main():
+    num_rpcs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    uri = f"http://127.0.0.1:{server.server_address[1]}/api"
+
+    client = ConjureClient()
+    _run("unpooled", lambda: _unpooled(uri), num_rpcs)
+    _run("pooled", lambda: client.service(PingService, uri), num_rpcs)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Measures pandas_to_foundry_schema on a wide frame (many short columns) and a long frame (few columns of many rows,
+including object columns of strings, lists and leading nulls), whose inference time should not grow with the row count.
+
+Usage: python benchmarks/bench_schema_inference.py [num_rows] [num_columns]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from palantir.datasets.schema import pandas_to_foundry_schema
+
+
+def _run(name, df):
+    start = time.perf_counter()
+    schema = pandas_to_foundry_schema(df)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<6} {df.shape[0]:>10} rows {df.shape[1]:>6} columns "
+        f"{elapsed * 1000:10.2f} ms {len(schema.fields) / elapsed:12.1f} columns/sec"
+    )
+
+
+def main():
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    num_columns = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+
+    wide = pd.DataFrame(
+        {
+            f"c{i}": (np.arange(100) if i % 2 else np.arange(100).astype(str))
+            for i in range(num_columns)
+        }
+    )
+    _run("wide", wide)
+
+    strings = np.array(["value"] * num_rows, dtype=object)
+    strings[: num_rows // 2] = None
+    lists = np.empty(num_rows, dtype=object)
+    lists[:] = [[1, 2]] * num_rows
+    long = pd.DataFrame(
+        {
+            "ints": np.arange(num_rows),
+            "floats": np.random.rand(num_rows),
+            "timestamps": pd.date_range("2022-01-01", periods=num_rows, freq="s"),
+            "strings": strings,
+            "lists": lists,
+            "category": pd.Categorical(np.arange(num_rows) % 10),
+        }
+    )
+    _run("long", long)
+
+
+if __name__ == "__main__":
+    main()
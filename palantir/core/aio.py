@@ -0,0 +1,233 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import random
+import ssl
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from conjure_python_client import ServiceConfiguration
+
+from palantir.core.rpc import ConnectionPoolConfiguration, get_user_agent
+
+if TYPE_CHECKING:
+    import aiohttp
+
+AsyncServiceT = TypeVar("AsyncServiceT", bound="AsyncService")
+T = TypeVar("T")
+
+_RETRYABLE_STATUS_CODES = (308, 429, 503)
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError as exc:
+        raise ImportError(
+            "the asyncio clients require aiohttp, install palantir-sdk[async]"
+        ) from exc
+    return aiohttp
+
+
+class AsyncService:
+    """
+    The base of asyncio service stubs, issuing requests through the pooled session of an :class:`AsyncConjureClient`.
+    """
+
+    def __init__(self, client: "AsyncConjureClient", uri: str):
+        self._client = client
+        self._uri = uri
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Dict[str, Any] = None,
+        headers: Dict[str, Any] = None,
+        json: Any = None,
+        data: Any = None,
+    ) -> "aiohttp.ClientResponse":
+        return await self._client.request(
+            method, url, params=params, headers=headers, json=json, data=data
+        )
+
+
+class AsyncConjureClient:
+    """
+    Creates asyncio service stubs that share a single, lazily created :class:`aiohttp.ClientSession`, so that
+    connections are pooled and reused across every RPC made through this client.
+
+    The session is bound to the event loop it is first used from, and must be closed with :meth:`close` (or by using
+    the client as an async context manager) before that loop is closed.
+    """
+
+    def __init__(
+        self,
+        pool_config: ConnectionPoolConfiguration = None,
+        service_config: ServiceConfiguration = None,
+    ):
+        self.pool_config = pool_config or ConnectionPoolConfiguration()
+        self.service_config = service_config or ServiceConfiguration()
+        self._session: "Optional[aiohttp.ClientSession]" = None
+        self._services: Dict[Tuple[Type[AsyncService], str], AsyncService] = {}
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> "aiohttp.ClientSession":
+        aiohttp = _import_aiohttp()
+        security = self.service_config.security
+        ssl_context = (
+            ssl.create_default_context(cafile=security.trust_store_path)
+            if security is not None and security.trust_store_path
+            else None
+        )
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_config.pool_connections * self.pool_config.pool_maxsize,
+            limit_per_host=self.pool_config.pool_maxsize,
+            ssl=ssl_context,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": get_user_agent()},
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=self.service_config.connect_timeout,
+                sock_read=self.service_config.read_timeout,
+            ),
+        )
+
+    def service(self, service: Type[AsyncServiceT], uri: str) -> AsyncServiceT:
+        key = (service, uri)
+        stub = self._services.get(key)
+        if stub is None:
+            stub = service(self, uri)
+            self._services[key] = stub
+        return stub  # type: ignore
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Dict[str, Any] = None,
+        headers: Dict[str, Any] = None,
+        json: Any = None,
+        data: Any = None,
+    ) -> "aiohttp.ClientResponse":
+        """
+        Issues a request, retrying connection errors and throttling responses (308, 429 and 503) with exponential
+        backoff and jitter, as the synchronous client does. Requests with a streamed body are not retried.
+
+        Raises :class:`aiohttp.ClientResponseError` for error responses. The caller must read or release the returned
+        response.
+        """
+        aiohttp = _import_aiohttp()
+        retryable = data is None or isinstance(data, (bytes, bytearray, memoryview))
+        max_attempts = 1 + (self.service_config.max_num_retries if retryable else 0)
+        params = _encode_params(params)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self.session.request(
+                    method,
+                    url,
+                    params=params,
+                    headers=headers,
+                    json=json,
+                    data=data,
+                )
+            except aiohttp.ClientConnectionError:
+                if attempt >= max_attempts:
+                    raise
+            else:
+                if (
+                    response.status in _RETRYABLE_STATUS_CODES
+                    and attempt < max_attempts
+                ):
+                    response.release()
+                elif response.status >= 400:
+                    body = await response.text()
+                    response.release()
+                    raise aiohttp.ClientResponseError(
+                        response.request_info,
+                        response.history,
+                        status=response.status,
+                        message=f"{response.reason}: {body}",
+                        headers=response.headers,
+                    )
+                else:
+                    return response
+            slot = self.service_config.backoff_slot_size / 1000
+            await asyncio.sleep(random.uniform(0, slot * 2 ** (attempt - 1)))
+
+    async def close(self) -> None:
+        """Closes all pooled connections. The client can still be used afterwards, opening new connections."""
+        if self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncConjureClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+
+def _encode_params(params: Optional[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """Encodes query parameters as requests does, dropping absent values and repeating the key of list values."""
+    encoded: List[Tuple[str, str]] = []
+    for key, value in (params or {}).items():
+        for item in value if isinstance(value, (list, tuple, set)) else [value]:
+            if item is not None:
+                encoded.append((key, str(item)))
+    return encoded
+
+
+async def poll_until(
+    poll: Callable[[], Awaitable[T]],
+    initial_delay: float = 0.05,
+    max_delay: float = 2.0,
+    multiplier: float = 2.0,
+    timeout: Optional[float] = None,
+) -> T:
+    """The asyncio counterpart of :func:`palantir.core.util.poll_until`, awaiting `poll` until it returns a truthy value."""
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    delay = initial_delay
+    while True:
+        result = await poll()
+        if result:
+            return result
+        wait = delay
+        if deadline is not None:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeoutError(f"gave up polling after {timeout} seconds")
+            wait = min(wait, remaining)
+        await asyncio.sleep(wait)
+        delay = min(delay * multiplier, max_delay)
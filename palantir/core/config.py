@@ -12,16 +12,32 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import errno
+import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import NewType, Optional
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    NamedTuple,
+    NewType,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import requests
 import tomli
 
 AuthToken = NewType("AuthToken", str)  # TODO(ahiggins): is a custom type worth it?
 
+_logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class Config:
@@ -31,20 +47,64 @@ class Config:
 
 
 class ConfigLoader:
-    def __init__(self, namespace: str = None, path: Path = None):
+    """
+    Loads a namespace of the palantir configuration file.
+
+    The parsed file is cached, and is only parsed again once its modification time or size changed. The file is
+    checked for changes at most once every `refresh_interval` seconds, so that resolving the hostname and token on
+    every request does no file I/O.
+    """
+
+    def __init__(
+        self, namespace: str = None, path: Path = None, refresh_interval: float = 1.0
+    ):
         self.namespace = namespace or "default"
         self.path = path or Path.home() / ".palantir" / "config"
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._checked_at: Optional[float] = None
+        self._file_version: Optional[Tuple[int, int, int]] = None
+        self._raw_config: Optional[Dict[str, Any]] = None
 
     def load_config(self) -> Config:
-        with open(self.path, "rb") as file:
-            raw_config = tomli.load(file).get(self.namespace)
-            if raw_config is None:
-                raise ValueError(
-                    f"did not find '{self.namespace}' namespace in palantir configuration file"
-                )
-            return Config(
-                hostname=raw_config.get("hostname"), token=raw_config.get("token")
+        raw_config = self._load_file().get(self.namespace)
+        if raw_config is None:
+            raise ValueError(
+                f"did not find '{self.namespace}' namespace in palantir configuration file"
             )
+        return Config(
+            hostname=raw_config.get("hostname"), token=raw_config.get("token")
+        )
+
+    def _load_file(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._checked_at is None
+                or now - self._checked_at >= self.refresh_interval
+            ):
+                self._refresh()
+                self._checked_at = now
+            if self._raw_config is None:
+                raise FileNotFoundError(
+                    errno.ENOENT,
+                    "palantir configuration file not found",
+                    str(self.path),
+                )
+            return self._raw_config
+
+    def _refresh(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._file_version = None
+            self._raw_config = None
+            return
+        version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if version != self._file_version or self._raw_config is None:
+            with open(self.path, "rb") as file:
+                self._raw_config = tomli.load(file)
+            self._file_version = version
 
     def __eq__(self, other):
         return other is self or (
@@ -237,6 +297,184 @@ class DefaultTokenProviderChain(TokenProviderChain):
         super().__init__(EnvironmentTokenProvider(), ConfigFileTokenProvider())
 
 
+@dataclass(frozen=True)
+class ExpiringToken:
+    """A token valid for `expires_in` seconds after it was acquired, or indefinitely if `expires_in` is None."""
+
+    token: AuthToken
+    expires_in: Optional[float] = None
+
+
+class _CurrentToken(NamedTuple):
+    token: AuthToken
+    expires_at: Optional[float]
+    refresh_at: Optional[float]
+
+
+class RefreshingTokenProvider(TokenProvider):
+    """
+    Provides tokens acquired by a `refresh` callable, e.g. a :class:`ClientCredentialsGrant`, renewing them on a
+    background thread `refresh_margin` seconds before they expire (or halfway through their lifetime for short-lived
+    tokens). Only the first call to :meth:`get` waits for a token, later calls return the current one without
+    blocking, and only wait for a new token if background renewal kept failing until the current one expired.
+
+    Tokens are renewed at most every `min_refresh_interval` seconds in the background, however short their lifetime.
+    Tokens with a non-positive lifetime are not cached, and are instead acquired by every call to :meth:`get`.
+
+    Failed renewals are retried every `retry_interval` seconds. The background thread is a daemon, and is stopped by
+    :meth:`close`.
+
+    Examples:
+        >>> grant = ClientCredentialsGrant(
+        ...     "https://example.palantirfoundry.com/multipass/api/oauth2/token", client_id, client_secret
+        ... )
+        >>> ctx = PalantirContext(StaticHostnameProvider("example.palantirfoundry.com"), RefreshingTokenProvider(grant))
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[], ExpiringToken],
+        refresh_margin: float = 300.0,
+        retry_interval: float = 5.0,
+        min_refresh_interval: float = 1.0,
+    ):
+        self.refresh = refresh
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self.min_refresh_interval = min_refresh_interval
+        self._warned_not_cached = False
+        self._lock = threading.Lock()
+        self._current: Optional[_CurrentToken] = None
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def get(self) -> AuthToken:
+        current = self._current
+        if current is not None and not _is_expired(current):
+            return current.token
+        with self._lock:
+            # another caller may have renewed the token while this one waited for the lock
+            current = self._current
+            if current is None or _is_expired(current):
+                current = self._renew()
+            if self._thread is None and not self._closed.is_set():
+                self._thread = threading.Thread(
+                    target=self._run, name="token-refresh", daemon=True
+                )
+                self._thread.start()
+            return current.token
+
+    def close(self) -> None:
+        """Stops renewing tokens in the background."""
+        self._closed.set()
+
+    def _renew(self) -> _CurrentToken:
+        acquired_at = time.monotonic()
+        token = self.refresh()
+        if token.expires_in is None:
+            current = _CurrentToken(token.token, None, None)
+        elif token.expires_in <= 0:
+            if not self._warned_not_cached:
+                self._warned_not_cached = True
+                _logger.warning(
+                    "token expires in %s seconds, tokens are not cached and are refreshed on every use",
+                    token.expires_in,
+                )
+            # already expired, so that the next call to get renews it, and never renewed in the background
+            current = _CurrentToken(token.token, acquired_at, None)
+        else:
+            current = _CurrentToken(
+                token.token,
+                acquired_at + token.expires_in,
+                acquired_at
+                + max(
+                    token.expires_in - self.refresh_margin,
+                    token.expires_in / 2,
+                    self.min_refresh_interval,
+                ),
+            )
+        self._current = current
+        return current
+
+    def _run(self):
+        while True:
+            current = self._current
+            if current is None or current.expires_at is None:
+                delay = None
+            elif current.refresh_at is None:
+                # not cached, check again later whether a token with a positive lifetime was acquired since
+                delay = self.min_refresh_interval
+            else:
+                delay = max(0.0, current.refresh_at - time.monotonic())
+            if self._closed.wait(delay):
+                return
+            if current is not None and current.refresh_at is None:
+                continue
+            try:
+                with self._lock:
+                    self._renew()
+            except Exception:  # pylint: disable=broad-except
+                _logger.warning(
+                    "failed to refresh token, retrying in %s seconds",
+                    self.retry_interval,
+                    exc_info=True,
+                )
+                if self._closed.wait(self.retry_interval):
+                    return
+
+
+def _is_expired(current: _CurrentToken) -> bool:
+    return current.expires_at is not None and time.monotonic() >= current.expires_at
+
+
+class ClientCredentialsGrant:
+    """
+    Acquires tokens with the OAuth2 client credentials grant, to be used as the `refresh` callable of a
+    :class:`RefreshingTokenProvider`.
+
+    Args:
+        token_url: The token endpoint, e.g. `https://<hostname>/multipass/api/oauth2/token`.
+        client_id: The client id of the OAuth2 application.
+        client_secret: The client secret of the OAuth2 application.
+        scopes: Optional scopes to request.
+        timeout: The timeout in seconds of token requests.
+    """
+
+    def __init__(
+        self,
+        token_url: str,
+        client_id: str,
+        client_secret: str,
+        scopes: Sequence[str] = None,
+        timeout: float = 30.0,
+    ):
+        self.token_url = token_url
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.scopes = scopes
+        self.timeout = timeout
+
+    def __call__(self) -> ExpiringToken:
+        data = {
+            "grant_type": "client_credentials",
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+        }
+        if self.scopes:
+            data["scope"] = " ".join(self.scopes)
+        response = requests.post(self.token_url, data=data, timeout=self.timeout)
+        response.raise_for_status()
+        body = response.json()
+        expires_in = body.get("expires_in")
+        return ExpiringToken(
+            token=AuthToken(body["access_token"]),
+            expires_in=float(expires_in) if expires_in is not None else None,
+        )
+
+    def __repr__(self) -> str:
+        return f"ClientCredentialsGrant(token_url='{self.token_url}', client_id='{self.client_id}')"
+
+
 class OntologyRidProvider(ABC):
     @abstractmethod
     def get(self) -> str:
@@ -12,8 +12,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from conjure_python_client import RequestsClient, ServiceConfiguration, Service
-from typing import TypeVar, Type, Any
+import random
+import socket
+from dataclasses import dataclass
+from threading import Lock
+from typing import TypeVar, Type, Any, Dict, Optional, Tuple, cast
+
+import requests
+from conjure_python_client import ServiceConfiguration, Service
+from requests.adapters import CaseInsensitiveDict, HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
 from palantir._version import __version__
 
 ServiceT = TypeVar("ServiceT", bound=Service)
@@ -24,11 +34,119 @@ def get_user_agent() -> str:
     return " ".join(f"{name}/{version}" for name, version in USER_AGENT)
 
 
+@dataclass(frozen=True)
+class ConnectionPoolConfiguration:
+    """
+    Configures the HTTP connection pool shared by every service stub created from a :class:`ConjureClient`.
+
+    Args:
+        pool_connections: The number of per-host connection pools to keep.
+        pool_maxsize: The maximum number of connections kept open to a single host.
+        pool_block: Whether to block when more than `pool_maxsize` connections to a host are in use, rather than
+            opening (and then discarding) additional connections.
+        keep_alive: Whether to enable TCP keep-alive probes on pooled sockets, so that idle connections survive
+            long gaps between requests.
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 32
+    pool_block: bool = False
+    keep_alive: bool = True
+
+
+class _RetryWithJitter(Retry):
+    """Retries requests of any method, as conjure services are expected to be idempotent, with a uniform jitter."""
+
+    def get_backoff_time(self) -> float:
+        return random.random() * super().get_backoff_time()
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    __attrs__ = HTTPAdapter.__attrs__ + ["socket_keep_alive"]
+
+    def __init__(self, *args, socket_keep_alive: bool = False, **kwargs):
+        self.socket_keep_alive = socket_keep_alive
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.socket_keep_alive:
+            pool_kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+
 class ConjureClient:
+    """
+    Creates conjure service stubs that share a single, lazily created :class:`requests.Session`, so that TCP and TLS
+    connections are pooled and reused across every RPC made through this client.
+    """
+
+    def __init__(
+        self,
+        pool_config: Optional[ConnectionPoolConfiguration] = None,
+        service_config: Optional[ServiceConfiguration] = None,
+    ):
+        self.pool_config = pool_config or ConnectionPoolConfiguration()
+        self.service_config = service_config or ServiceConfiguration()
+        self._session: Optional[requests.Session] = None
+        self._services: Dict[Tuple[Type[Service], str], Service] = {}
+        self._lock = Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        # setup retry to match java remoting, as conjure_python_client.RequestsClient does
+        retry = _RetryWithJitter(
+            total=self.service_config.max_num_retries,
+            read=0,  # do not retry read errors
+            allowed_methods=None,  # retry every method
+            status_forcelist=[308, 429, 503],
+            backoff_factor=float(self.service_config.backoff_slot_size) / 1000,
+        )
+        adapter = _PooledHTTPAdapter(
+            max_retries=retry,
+            pool_connections=self.pool_config.pool_connections,
+            pool_maxsize=self.pool_config.pool_maxsize,
+            pool_block=self.pool_config.pool_block,
+            socket_keep_alive=self.pool_config.keep_alive,
+        )
+        session = requests.Session()
+        session.headers = CaseInsensitiveDict({"User-Agent": get_user_agent()})
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def service(self, service: Type[ServiceT], uri: str) -> ServiceT:
-        config = ServiceConfiguration()
-        config.uris = [uri]
-        return RequestsClient.create(service, get_user_agent(), config)
+        key = (service, uri)
+        stub = self._services.get(key)
+        if stub is None:
+            security = self.service_config.security
+            # without a trust store, verify is None so that requests verifies with its default certificates
+            verify = security.trust_store_path if security is not None else None
+            stub = service(
+                self.session,
+                [uri],
+                self.service_config.connect_timeout,
+                self.service_config.read_timeout,
+                cast(str, verify),
+            )
+            self._services[key] = stub
+        return stub  # type: ignore
+
+    def close(self) -> None:
+        """Closes all pooled connections. The client can still be used afterwards, opening new connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._services = {}
 
 
 def _is_collection(arg: Any, item_type: Type = object) -> bool:
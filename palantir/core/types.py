@@ -13,9 +13,11 @@
 #  limitations under the License.
 
 import re
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from re import Pattern
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Dict, TypeVar
 
 from palantir.core.config import (
     AuthToken,
@@ -23,10 +25,13 @@ from palantir.core.config import (
     TokenProvider,
     OntologyRidProvider
 )
+from palantir.core.rpc import ConjureClient
 
 if TYPE_CHECKING:
     from typing import Optional
 
+T = TypeVar("T")
+
 _rid_pattern: Pattern = re.compile(
     "ri"
     "\\.(?P<service>[a-z][a-z0-9\\-]*)"
@@ -41,15 +46,24 @@ class PalantirContext:
         self,
         hostname: HostnameProvider,
         auth: TokenProvider,
-        ontology_rid: OntologyRidProvider = None
+        ontology_rid: OntologyRidProvider = None,
+        conjure_client: ConjureClient = None,
     ):
         self.hostname_provider = hostname
         self.token_provider = auth
         self.ontology_rid_provider = ontology_rid
+        # shared by all service stubs created for this context so that connections are pooled across clients
+        self.conjure_client = conjure_client or ConjureClient()
+        self._hostname: "Optional[str]" = None
+        self._clients: Dict[Any, Any] = {}
+        self._clients_lock = threading.Lock()
 
     @property
     def hostname(self) -> str:
-        return self.hostname_provider.get()
+        """Returns the hostname, which is resolved once per context as service URIs are built from it."""
+        if self._hostname is None:
+            self._hostname = self.hostname_provider.get()
+        return self._hostname
 
     @property
     def auth_token(self) -> AuthToken:
@@ -62,6 +76,18 @@ class PalantirContext:
         else:
             return self.ontology_rid_provider.get()
 
+    def shared_client(self, key: Any, create: Callable[[], T]) -> T:
+        """
+        Returns the client stored on this context under `key`, creating it on first use, so that the module level
+        functions reuse one client, and its caches, per context.
+        """
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = create()
+                self._clients[key] = client
+            return client
+
     def __eq__(self, other: object):
         return other is self or (
             isinstance(other, PalantirContext)
@@ -73,26 +99,40 @@ class PalantirContext:
 
 @dataclass(frozen=True)
 class ResourceIdentifier:
+    # no per-instance __dict__, as many rids are held when listing large datasets
+    __slots__ = ("service", "instance", "type", "locator", "_str")
+
     service: str
     instance: str
     type: str
     locator: str
 
     def __str__(self):
-        return f"ri.{self.service}.{self.instance}.{self.type}.{self.locator}"
+        try:
+            return self._str
+        except AttributeError:
+            value = f"ri.{self.service}.{self.instance}.{self.type}.{self.locator}"
+            object.__setattr__(self, "_str", value)
+            return value
 
     def __repr__(self):
         return str(self)
 
+    def __reduce__(self):
+        # frozen instances cannot be restored by setting their slots
+        return ResourceIdentifier, (
+            self.service,
+            self.instance,
+            self.type,
+            self.locator,
+        )
+
     @classmethod
     def try_parse(cls, value: str) -> "Optional[ResourceIdentifier]":
         """
         Returns a ResourceIdentifier object if the value can be parsed as a resource identifier.
         """
-        try:
-            return cls.from_string(value)
-        except ValueError:
-            return None
+        return _parse_rid(value)
 
     @classmethod
     def from_string(cls, value: str) -> "ResourceIdentifier":
@@ -100,14 +140,24 @@ class ResourceIdentifier:
         Returns a ResourceIdentifier object if the value can be parsed as a resource identifier
         or raises an error.
         """
-        match = _rid_pattern.match(value)
-        if match:
-            return ResourceIdentifier(
-                service=match.group("service"),
-                instance=match.group("instance"),
-                type=match.group("type"),
-                locator=match.group("locator"),
-            )
-        raise ValueError("value could not be parsed as a ResourceIdentifier")
-
-
+        rid = _parse_rid(value)
+        if rid is None:
+            raise ValueError("value could not be parsed as a ResourceIdentifier")
+        return rid
+
+
+@lru_cache(maxsize=4096)
+def _parse_rid(value: str) -> "Optional[ResourceIdentifier]":
+    """
+    Parses a rid, returning the same immutable instance for recently parsed values since rids repeat heavily, e.g. the
+    transaction rid of every file in a listing.
+    """
+    match = _rid_pattern.match(value)
+    if match is None:
+        return None
+    return ResourceIdentifier(
+        service=match.group("service"),
+        instance=match.group("instance"),
+        type=match.group("type"),
+        locator=match.group("locator"),
+    )
@@ -12,9 +12,28 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from dataclasses import fields
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 
-from typing import Any, Dict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
 
 
 def dataclass_from_dict(klass: Any, dikt: Dict[str, Any]):
@@ -46,16 +65,171 @@ def alias(ignore_case=False):
     return Alias()
 
 
-def page_results(values_extractor, token_extractor, page_supplier, page_token=None):
-    def process_page(page):
-        values = values_extractor(page)
-        next_page_token = token_extractor(page)
+def page_results(
+    values_extractor: Callable[[Any], Iterable[T]],
+    token_extractor: Callable[[Any], Optional[str]],
+    page_supplier: Callable[[Optional[str]], Any],
+    page_token: Optional[str] = None,
+    prefetch: bool = False,
+) -> Generator[T, None, None]:
+    """
+    Yields the values of consecutive pages, requesting each page with the token extracted from the previous one until
+    a page has no next page token.
+
+    If `prefetch` is true, the next page is requested on a background thread while the values of the current page
+    are consumed, so that slow consumers and round-trips overlap. At most one page is requested ahead, and
+    `page_supplier` is never called concurrently with itself.
+    """
+    if not prefetch:
+        while True:
+            page = page_supplier(page_token)
+            yield from values_extractor(page)
+            page_token = token_extractor(page)
+            if page_token is None:
+                return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch")
+    try:
+        page = page_supplier(page_token)
+        while True:
+            page_token = token_extractor(page)
+            next_page = (
+                executor.submit(page_supplier, page_token)
+                if page_token is not None
+                else None
+            )
+            try:
+                yield from values_extractor(page)
+            except GeneratorExit:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+            if next_page is None:
+                return
+            page = next_page.result()
+    finally:
+        executor.shutdown(wait=False)
+
+
+def poll_until(
+    poll: Callable[[], T],
+    initial_delay: float = 0.05,
+    max_delay: float = 2.0,
+    multiplier: float = 2.0,
+    timeout: Optional[float] = None,
+) -> T:
+    """
+    Calls `poll` until it returns a truthy value, which is returned. Waits `initial_delay` seconds after the first call
+    and multiplies the delay by `multiplier` after each subsequent call, up to `max_delay`, so that short operations
+    are noticed quickly while long ones are not polled aggressively.
+
+    Raises TimeoutError if `poll` has not succeeded `timeout` seconds after the first call.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        result = poll()
+        if result:
+            return result
+        wait = delay
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"gave up polling after {timeout} seconds")
+            wait = min(wait, remaining)
+        time.sleep(wait)
+        delay = min(delay * multiplier, max_delay)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Reports the activity of a cache since it was created. `size` is the total size of the entries, in bytes for
+    on-disk caches and in entries for in-memory caches.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache(Generic[K, V]):
+    """
+    A thread-safe in-memory cache holding at most `maxsize` entries, evicting the least recently used ones, whose
+    entries expire `ttl` seconds after they were stored (or never if `ttl` is None).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[K, Tuple[V, Optional[float]]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Returns the value cached for the key, or `default` if it is absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[1] is None or time.monotonic() < entry[1]):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return default
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_load(self, key: K, loader: Callable[[], V]) -> V:
+        """
+        Returns the value cached for the key, or loads, caches and returns it. The lock is not held while loading, so
+        concurrent misses for the same key may each load it.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.put(key, value)
+        return value  # type: ignore
+
+    def invalidate(self, predicate: Callable[[K], bool] = None) -> None:
+        """Removes the entries whose key matches `predicate`, or all entries if it is None."""
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if predicate(key)]:
+                    del self._entries[key]
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=len(self._entries),
+            )
 
-        for value in values:
-            yield value
+    def __len__(self) -> int:
+        return len(self._entries)
 
-        if next_page_token is not None:
-            for value in process_page(page_supplier(next_page_token)):
-                yield value
 
-    return process_page(page_supplier(page_token))
+_MISSING: Any = object()
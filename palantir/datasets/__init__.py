@@ -12,4 +12,6 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from .types import ColumnFilter, FilterOperator, QueryConfig
 from .functions import dataset
+from .cache import FileCache
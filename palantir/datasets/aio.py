@@ -0,0 +1,807 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+asyncio counterparts of :class:`DatasetsClient` and :class:`Dataset`, so that a single event loop can drive many
+concurrent dataset operations. Requires the ``async`` extra (aiohttp).
+
+Examples:
+    >>> async with AsyncDatasetsClient(AsyncDatasetServices(context())) as client:
+    ...     ds = await client.dataset("/MyOrg/MyProject/Path/To/Dataset")
+    ...     async for file in ds.list_files():
+    ...         content = await file.read()
+"""
+
+import asyncio
+import io
+from datetime import datetime
+from os.path import relpath
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from dateutil.parser import isoparse
+
+from palantir.core.aio import AsyncConjureClient, _import_aiohttp, poll_until
+from palantir.core.types import PalantirContext, ResourceIdentifier
+from palantir.datasets.client import (
+    ConcatenationTaskTerminationVisitor,
+    _IsQueryStatusTerminalVisitor,
+)
+from palantir.datasets.errors import TransactionAbortedError
+from palantir.datasets.io import _chunk
+from palantir.datasets.query import Filter, select_query
+from palantir.datasets.rpc.aio import (
+    AsyncCatalogService,
+    AsyncDataProxyConcatenationService,
+    AsyncDataProxyService,
+    AsyncPathService,
+    AsyncSqlQueryService,
+)
+from palantir.datasets.rpc.catalog import (
+    CloseTransactionRequest,
+    StartTransactionRequest,
+    TransactionType as ConjureTransactionType,
+)
+from palantir.datasets.rpc.data_proxy import StartConcatenationTaskRequest
+from palantir.datasets.rpc.sql import (
+    SerializationProtocol,
+    SqlDialect,
+    SqlExecuteRequest,
+    SqlQuery,
+)
+from palantir.datasets.types import (
+    DatasetLocator,
+    FileLocator,
+    PartUpload,
+    QueryConfig,
+    TransactionStatus,
+    TransactionType,
+    UploadConfig,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+AsyncFileContent = Union[bytes, bytearray, memoryview, AsyncGenerator[bytes, None]]
+
+
+def _is_retryable(error: Exception) -> bool:
+    aiohttp = _import_aiohttp()
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500
+    return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+async def _iter_parts(
+    content: AsyncFileContent, part_size: int
+) -> AsyncGenerator[Any, None]:
+    """
+    The asyncio counterpart of :func:`palantir.datasets.io._iter_parts`: in-memory content is sliced without
+    copying, streamed content is buffered one part at a time.
+    """
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        for part in _chunk(memoryview(content).cast("B"), part_size):
+            yield part
+        return
+    buffer = bytearray()
+    async for data in content:
+        buffer += data
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _chain(
+    head: Iterable[Any], tail: AsyncIterator[Any]
+) -> AsyncGenerator[Any, None]:
+    for item in head:
+        yield item
+    async for item in tail:
+        yield item
+
+
+async def _next(iterator: AsyncIterator[Any], default: Any) -> Any:
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return default
+
+
+class _StreamReader(io.RawIOBase):
+    """
+    A blocking reader over the body of an aiohttp response, for use from a worker thread while the event loop
+    `loop` receives the body, so that synchronous decoders can consume it as it arrives.
+    """
+
+    def __init__(self, content: Any, loop: asyncio.AbstractEventLoop):
+        super().__init__()
+        self._content = content
+        self._loop = loop
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = asyncio.run_coroutine_threadsafe(
+            self._content.read(len(buffer)), self._loop
+        ).result()
+        buffer[: len(data)] = data
+        return len(data)
+
+
+class AsyncDatasetServices:
+    def __init__(
+        self, ctx: PalantirContext, conjure_client: Optional[AsyncConjureClient] = None
+    ):
+        self.factory = conjure_client or AsyncConjureClient()
+        self.ctx = ctx
+
+    @property
+    def catalog_service(self) -> AsyncCatalogService:
+        return self.factory.service(
+            AsyncCatalogService,
+            f"https://{self.ctx.hostname}/foundry-catalog/api",
+        )
+
+    @property
+    def data_proxy_service(self) -> AsyncDataProxyService:
+        return self.factory.service(
+            AsyncDataProxyService,
+            f"https://{self.ctx.hostname}/foundry-data-proxy/api",
+        )
+
+    @property
+    def data_proxy_concatenation_service(self) -> AsyncDataProxyConcatenationService:
+        return self.factory.service(
+            AsyncDataProxyConcatenationService,
+            f"https://{self.ctx.hostname}/foundry-data-proxy/api",
+        )
+
+    @property
+    def path_service(self) -> AsyncPathService:
+        return self.factory.service(
+            AsyncPathService, f"https://{self.ctx.hostname}/compass/api"
+        )
+
+    @property
+    def sql_query_service(self) -> AsyncSqlQueryService:
+        return self.factory.service(
+            AsyncSqlQueryService,
+            f"https://{self.ctx.hostname}/foundry-sql-server/api",
+        )
+
+
+class AsyncDatasetsClient:
+    """
+    An asyncio client for datasets. Its connections are pooled in a session bound to the event loop it is first used
+    from, which must be closed with :meth:`close` or by using the client as an async context manager.
+    """
+
+    def __init__(
+        self,
+        services: AsyncDatasetServices,
+        query_config: Optional[QueryConfig] = None,
+        upload_config: Optional[UploadConfig] = None,
+    ):
+        self.services = services
+        self.ctx = services.ctx
+        self.query_config = query_config or QueryConfig()
+        self.upload_config = upload_config or UploadConfig()
+
+    @property
+    def _catalog_service(self) -> AsyncCatalogService:
+        return self.services.catalog_service
+
+    @property
+    def _data_proxy_service(self) -> AsyncDataProxyService:
+        return self.services.data_proxy_service
+
+    @property
+    def _data_proxy_concatenation_service(self) -> AsyncDataProxyConcatenationService:
+        return self.services.data_proxy_concatenation_service
+
+    @property
+    def _path_service(self) -> AsyncPathService:
+        return self.services.path_service
+
+    @property
+    def _sql_query_service(self) -> AsyncSqlQueryService:
+        return self.services.sql_query_service
+
+    async def dataset(
+        self,
+        dataset_ref: str,
+        branch: Optional[str] = None,
+        transaction_range: Optional[Tuple[str, str]] = None,
+    ) -> "AsyncDataset":
+        """
+        Resolves a dataset, see :func:`palantir.datasets.dataset`.
+
+        Args:
+            dataset_ref: The path to a Dataset, or a Dataset Resource Identifier.
+            branch: Defaults to "master"
+            transaction_range: A tuple containing a start and end transaction rid.
+
+        Returns: An :class:`AsyncDataset` resolved to the view at the specified transaction range or at the latest
+        transaction range.
+        """
+        rid = await self.get_dataset(dataset_ref)
+        if not rid:
+            raise ValueError(f"could not resolve dataset_ref '{dataset_ref}'")
+        dataset = AsyncDataset(
+            self, DatasetLocator(rid=rid, branch_id=branch or "master")
+        )
+        await dataset.update_view(transaction_range)
+        return dataset
+
+    async def get_dataset(self, dataset_ref: str) -> Optional[ResourceIdentifier]:
+        rid = ResourceIdentifier.try_parse(dataset_ref)
+        if rid is not None:
+            if rid.service == "foundry" and rid.type == "dataset":
+                return rid
+            raise ValueError(f"'{rid}' is not a dataset rid")
+
+        dataset_resource = await self._path_service.get_resource_by_path(
+            auth_header=self.ctx.auth_token,
+            path=dataset_ref,
+        )
+        return (
+            ResourceIdentifier.from_string(dataset_resource.rid)
+            if dataset_resource
+            else None
+        )
+
+    async def get_transaction_range(
+        self,
+        dataset_rid: ResourceIdentifier,
+        branch_id: str,
+        include_open_transaction: bool = False,
+    ) -> Union[Tuple[str, str], Tuple[None, None]]:
+        transaction_range = await self._catalog_service.get_dataset_view_range2(
+            auth_header=self.ctx.auth_token,
+            dataset_rid=str(dataset_rid),
+            end_ref=branch_id,
+            include_open_exclusive_transaction=include_open_transaction,
+        )
+        return (
+            (
+                transaction_range.start_transaction_rid,
+                transaction_range.end_transaction_rid,
+            )
+            if transaction_range is not None
+            else (None, None)
+        )
+
+    async def list_files(
+        self,
+        dataset: "AsyncDataset",
+        path: Optional[str] = None,
+        include_open_transaction: bool = False,
+        page_size: int = 100,
+    ) -> AsyncGenerator["AsyncFile", None]:
+        if dataset.locator.end_transaction_rid is None:
+            return
+        next_page_token = None
+        while True:
+            page = await self._catalog_service.get_dataset_view_files2(
+                auth_header=self.ctx.auth_token,
+                dataset_rid=str(dataset.rid),
+                start_transaction_rid=str(dataset.locator.start_transaction_rid)
+                if dataset.locator.start_transaction_rid
+                else None,
+                end_ref=str(dataset.locator.end_transaction_rid),
+                logical_path=None if path is None else relpath(path),
+                include_open_exclusive_transaction=include_open_transaction,
+                page_size=page_size,
+                page_start_logical_path=next_page_token,
+                exclude_hidden_files=True,
+            )
+            for file in page.values:
+                yield AsyncFile(
+                    dataset=dataset,
+                    path=file.logical_path,
+                    modified=isoparse(file.time_modified),
+                    transaction_rid=ResourceIdentifier.from_string(
+                        file.transaction_rid
+                    ),
+                    length=file.file_metadata.length
+                    if file.file_metadata is not None
+                    else None,
+                    client=self,
+                )
+            next_page_token = page.next_page_token
+            if next_page_token is None:
+                return
+
+    async def read_file(self, locator: FileLocator) -> bytes:
+        response = await self._get_file_in_view(locator)
+        async with response:
+            return await response.read()
+
+    async def iter_file(
+        self, locator: FileLocator, chunk_size: int = 1024 * 1024
+    ) -> AsyncGenerator[bytes, None]:
+        """Streams the content of a file in chunks of at most `chunk_size` bytes."""
+        response = await self._get_file_in_view(locator)
+        async with response:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
+    async def _get_file_in_view(self, locator: FileLocator):
+        return await self._data_proxy_service.get_file_in_view(
+            auth_header=self.ctx.auth_token,
+            dataset_rid=str(locator.dataset_rid),
+            end_ref=locator.end_ref,
+            logical_path=relpath(locator.logical_path),
+            start_transaction_rid=locator.start_transaction_rid,
+        )
+
+    async def put_file(
+        self,
+        locator: FileLocator,
+        content: AsyncFileContent,
+        on_part_uploaded: Optional[Callable[[PartUpload], None]] = None,
+    ) -> None:
+        """
+        Uploads content to a file, see :meth:`palantir.datasets.client.DatasetsClient.put_file`. Content of at least
+        :attr:`UploadConfig.part_size` bytes is uploaded as concurrent parts, which are then concatenated into the
+        destination file. Streamed content is buffered one part at a time.
+
+        :param locator: the file to write, whose end_ref is the rid of an open transaction
+        :param content: the binary content of the file, as a buffer or an async generator of bytes
+        :param on_part_uploaded: an optional callback invoked with a :class:`PartUpload` report for each uploaded part
+        """
+        part_size = self.upload_config.part_size
+        if (
+            isinstance(content, (bytes, bytearray, memoryview))
+            and memoryview(content).nbytes < part_size
+        ):
+            await self._put_file(locator, content)
+            return
+
+        parts = _iter_parts(content, part_size)
+        first = await _next(parts, b"")
+        second = await _next(parts, None)
+        if second is None:
+            await self._put_file(locator, first)
+        else:
+            await self._put_file_chunked(
+                locator, _chain([first, second], parts), on_part_uploaded
+            )
+
+    async def _put_file(self, locator: FileLocator, content: Any) -> None:
+        await self._data_proxy_service.put_file(
+            auth_header=self.ctx.auth_token,
+            dataset_rid=str(locator.dataset_rid),
+            transaction_rid=locator.end_ref,
+            logical_path=relpath(locator.logical_path),
+            file_data=content,
+        )
+
+    async def _put_part(
+        self, locator: FileLocator, idx: int, content: Any
+    ) -> PartUpload:
+        aiohttp = _import_aiohttp()
+        config = self.upload_config
+        chunk_path = f"{relpath(locator.logical_path)}.{idx}"
+        start = perf_counter()
+        attempt = 1
+        while True:
+            try:
+                await self._data_proxy_service.put_file(
+                    auth_header=self.ctx.auth_token,
+                    dataset_rid=str(locator.dataset_rid),
+                    transaction_rid=locator.end_ref,
+                    logical_path=chunk_path,
+                    file_data=content,
+                )
+                break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                if attempt >= config.max_attempts or not _is_retryable(error):
+                    raise
+                await asyncio.sleep(config.retry_backoff * 2 ** (attempt - 1))
+                attempt += 1
+        return PartUpload(
+            index=idx,
+            logical_path=chunk_path,
+            size=memoryview(content).nbytes,
+            elapsed=perf_counter() - start,
+            attempts=attempt,
+        )
+
+    async def _put_file_chunked(
+        self,
+        locator: FileLocator,
+        parts: AsyncIterator[Any],
+        on_part_uploaded: Optional[Callable[[PartUpload], None]] = None,
+    ) -> None:
+        # at most max_workers parts are buffered or in flight, as with the thread pool of the synchronous client
+        slots = asyncio.Semaphore(self.upload_config.max_workers)
+        failed = asyncio.Event()
+
+        async def upload(idx: int, content: Any) -> PartUpload:
+            try:
+                part = await self._put_part(locator, idx, content)
+            except BaseException:
+                failed.set()
+                raise
+            finally:
+                slots.release()
+            if on_part_uploaded is not None:
+                on_part_uploaded(part)
+            return part
+
+        tasks: List["asyncio.Future[PartUpload]"] = []
+        try:
+            idx = 0
+            async for content in parts:
+                await slots.acquire()
+                if failed.is_set():
+                    # the upload cannot succeed anymore, so no further parts are read or uploaded
+                    slots.release()
+                    break
+                tasks.append(asyncio.ensure_future(upload(idx, content)))
+                idx += 1
+            uploaded = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        response = (
+            await self._data_proxy_concatenation_service.start_concatenation_task(
+                auth_header=self.ctx.auth_token,
+                dataset_rid=str(locator.dataset_rid),
+                transaction_rid=locator.end_ref,
+                request=StartConcatenationTaskRequest(
+                    destination_path=relpath(locator.logical_path),
+                    source_paths=[part.logical_path for part in uploaded],
+                ),
+            )
+        )
+
+        async def is_terminal() -> bool:
+            status = await self._data_proxy_concatenation_service.get_concatenation_task_status(
+                auth_header=self.ctx.auth_token,
+                concatenation_task_id=response.concatenation_task_id,
+            )
+            return status.status.accept(ConcatenationTaskTerminationVisitor())
+
+        await poll_until(is_terminal)
+
+    async def start_transaction(
+        self,
+        dataset: "AsyncDataset",
+        txn_type: TransactionType,
+    ) -> "AsyncTransaction":
+        txn = await self._catalog_service.start_transaction(
+            auth_header=self.ctx.auth_token,
+            dataset_rid=str(dataset.rid),
+            request=StartTransactionRequest(branch_id=dataset.branch, record={}),
+        )
+        if txn_type != TransactionType.APPEND:
+            txn = await self._catalog_service.set_transaction_type(
+                auth_header=self.ctx.auth_token,
+                dataset_rid=str(dataset.rid),
+                transaction_rid=txn.rid,
+                txn_type=ConjureTransactionType(txn_type.name),
+            )
+        return AsyncTransaction(
+            dataset=dataset,
+            rid=ResourceIdentifier.from_string(txn.rid),
+            status=TransactionStatus(txn.status.value),
+            txn_type=TransactionType(txn.type.value),
+            client=self,
+        )
+
+    async def commit_transaction(self, txn: "AsyncTransaction") -> None:
+        await self._catalog_service.commit_transaction(
+            auth_header=self.ctx.auth_token,
+            dataset_rid=str(txn.dataset.rid),
+            transaction_rid=str(txn.rid),
+            request=CloseTransactionRequest(record={}),
+        )
+
+    async def abort_transaction(self, txn: "AsyncTransaction") -> None:
+        await self._catalog_service.abort_transaction(
+            auth_header=self.ctx.auth_token,
+            dataset_rid=str(txn.dataset.rid),
+            transaction_rid=str(txn.rid),
+            request=CloseTransactionRequest(record={}),
+        )
+
+    async def read_dataset(
+        self,
+        locator: DatasetLocator,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+    ) -> "pa.Table":
+        if locator.end_transaction_rid is None:
+            raise ValueError("read failed. unresolved end transaction rid")
+
+        config = self.query_config
+        response = await self._sql_query_service.execute(
+            auth_header=self.ctx.auth_token,
+            request=SqlExecuteRequest(
+                dialect=SqlDialect.ANSI,  # type: ignore
+                fallback_branch_ids=[],
+                query=SqlQuery(select_query(locator, columns, filters)),
+                serialization_protocol=SerializationProtocol.ARROW,  # type: ignore
+                timeout=None if config.timeout is None else int(config.timeout * 1000),
+            ),
+        )
+
+        async def is_terminal() -> bool:
+            status = await self._sql_query_service.get_status(
+                auth_header=self.ctx.auth_token, query_id=response.query_id
+            )
+            return status.status.accept(_IsQueryStatusTerminalVisitor())
+
+        if not response.status.accept(_IsQueryStatusTerminalVisitor()):
+            await poll_until(
+                is_terminal,
+                initial_delay=config.initial_poll_interval,
+                max_delay=config.max_poll_interval,
+                timeout=config.timeout,
+            )
+
+        results = await self._sql_query_service.get_results(
+            auth_header=self.ctx.auth_token, query_id=response.query_id
+        )
+        import pyarrow as pa
+
+        async with results:
+            # see DatasetsClient.read_dataset, the results start with a control character that should be 'A'
+            control = await results.content.readexactly(1)
+            assert control == b"A"
+            # the batches are decoded on a worker thread as the event loop receives them, so that the raw results are
+            # never held in memory in addition to the table
+            stream = io.BufferedReader(
+                _StreamReader(results.content, asyncio.get_running_loop())
+            )
+            return await asyncio.get_running_loop().run_in_executor(
+                None, lambda: pa.ipc.open_stream(stream).read_all()
+            )
+
+    async def close(self) -> None:
+        """Closes all pooled connections."""
+        await self.services.factory.close()
+
+    async def __aenter__(self) -> "AsyncDatasetsClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+
+class AsyncDataset:
+    """An asyncio reference to a Foundry Dataset, see :class:`palantir.datasets.core.Dataset`."""
+
+    def __init__(self, client: AsyncDatasetsClient, locator: DatasetLocator):
+        self.client = client
+        self.locator = locator
+
+    @property
+    def rid(self) -> ResourceIdentifier:
+        return self.locator.rid
+
+    @property
+    def branch(self) -> str:
+        return self.locator.branch_id
+
+    def list_files(
+        self, path: Optional[str] = None
+    ) -> AsyncGenerator["AsyncFile", None]:
+        """
+        Args:
+            path: An optional path prefix to use to filter when listing files.
+
+        Returns: An async generator over the :class:`AsyncFile` objects in the current view and branch.
+        """
+        return self.client.list_files(dataset=self, path=path)
+
+    def file(self, file_ref: str) -> "AsyncFile":
+        return AsyncFile(dataset=self, path=file_ref, client=self.client)
+
+    async def read_arrow(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+    ) -> "pa.Table":
+        """See :meth:`palantir.datasets.core.Dataset.read_arrow`."""
+        return await self.client.read_dataset(
+            self.locator, columns=columns, filters=filters
+        )
+
+    async def read_pandas(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+    ) -> "pd.DataFrame":
+        """See :meth:`palantir.datasets.core.Dataset.read_pandas`."""
+        return (await self.read_arrow(columns=columns, filters=filters)).to_pandas()
+
+    async def start_transaction(
+        self, txn_type: Optional[Union[str, TransactionType]] = None
+    ) -> "AsyncTransaction":
+        """
+        Starts a transaction, which can be used as an async context manager to commit on success and abort on error.
+
+        Args:
+            txn_type: Transaction Type, Defaults to `TransactionType.UPDATE`.
+        """
+        return await self.client.start_transaction(
+            self,
+            TransactionType.UPDATE
+            if txn_type is None
+            else txn_type
+            if isinstance(txn_type, TransactionType)
+            else TransactionType[txn_type.upper()],
+        )
+
+    async def update_view(
+        self, transaction_range: Optional[Tuple[str, str]] = None
+    ) -> None:
+        """Updates the current dataset view. Retrieves the latest view when parameters are not specified."""
+        (start_transaction_rid, end_transaction_rid,) = (
+            transaction_range
+            if transaction_range is not None
+            else await self.client.get_transaction_range(self.rid, self.branch)
+        )
+        self.locator = self.locator.with_updated(
+            start_transaction_rid=ResourceIdentifier.from_string(start_transaction_rid)
+            if start_transaction_rid
+            else None,
+            end_transaction_rid=ResourceIdentifier.from_string(end_transaction_rid)
+            if end_transaction_rid
+            else None,
+        )
+
+    def __repr__(self):
+        return (
+            f'AsyncDataset(rid="{self.locator.rid}", branch="{self.locator.branch_id}")'
+        )
+
+
+class AsyncTransaction:
+    def __init__(
+        self,
+        dataset: AsyncDataset,
+        rid: ResourceIdentifier,
+        status: TransactionStatus,
+        txn_type: TransactionType,
+        client: AsyncDatasetsClient,
+    ):
+        self.dataset = dataset
+        self.rid = rid
+        self.status = status
+        self.txn_type = txn_type
+        self.client = client
+
+    async def commit(self) -> None:
+        """Commits the open transaction, updates the attached :class:`AsyncDataset` object's view range."""
+        await self.client.commit_transaction(self)
+        self.status = TransactionStatus.COMMITTED
+        if self.txn_type == TransactionType.SNAPSHOT:
+            self.dataset.locator = self.dataset.locator.with_updated(
+                start_transaction_rid=self.rid,
+                end_transaction_rid=self.rid,
+            )
+        else:
+            self.dataset.locator = self.dataset.locator.with_updated(
+                end_transaction_rid=self.rid
+            )
+
+    async def abort(self) -> None:
+        """Aborts the open transaction."""
+        await self.client.abort_transaction(self)
+        self.status = TransactionStatus.ABORTED
+
+    async def write(self, path: str, content: AsyncFileContent) -> None:
+        """
+        Writes content to a file in the transaction.
+
+        Args:
+            path: The path of the file to write to.
+            content: The binary content to upload, as a buffer or an async generator of bytes.
+        """
+        await self.client.put_file(
+            FileLocator(
+                dataset_rid=self.dataset.rid,
+                end_ref=str(self.rid),
+                logical_path=path,
+            ),
+            content,
+        )
+
+    async def __aenter__(self) -> "AsyncTransaction":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_val is not None:
+            await self.abort()
+            raise TransactionAbortedError(self) from exc_val
+        await self.commit()
+
+    def __repr__(self) -> str:
+        return f"AsyncTransaction(rid='{self.rid}', dataset_rid='{self.dataset.locator.rid}', type={self.txn_type}, status={self.status})"
+
+
+class AsyncFile:
+    def __init__(
+        self,
+        dataset: AsyncDataset,
+        path: str,
+        client: AsyncDatasetsClient,
+        modified: Optional[datetime] = None,
+        transaction_rid: Optional[ResourceIdentifier] = None,
+        length: Optional[int] = None,
+    ):
+        self.dataset = dataset
+        self.path = path
+        self.modified = modified
+        self.transaction_rid = transaction_rid
+        self.length = length
+        self.client = client
+
+    def locator(self) -> FileLocator:
+        return FileLocator(
+            dataset_rid=self.dataset.rid,
+            end_ref=str(self.transaction_rid)
+            if self.transaction_rid
+            else self.dataset.branch,
+            logical_path=self.path,
+        )
+
+    async def read(self) -> bytes:
+        """Returns: The full content of the file."""
+        return await self.client.read_file(self.locator())
+
+    def iter_chunks(self, chunk_size: int = 1024 * 1024) -> AsyncGenerator[bytes, None]:
+        """Returns: An async generator streaming the file content in chunks."""
+        return self.client.iter_file(self.locator(), chunk_size)
+
+    async def write(
+        self,
+        content: AsyncFileContent,
+        txn_type: Union[str, TransactionType] = TransactionType.UPDATE,
+    ) -> None:
+        """Writes the content to the file in a new transaction, which is committed."""
+        async with await self.dataset.start_transaction(txn_type) as txn:
+            await txn.write(self.path, content)
+
+    def __repr__(self):
+        return f'AsyncFile(dataset_rid="{self.dataset.rid}", path="{self.path}")'
+
+    def __eq__(self, other: object) -> bool:
+        return other is self or (
+            isinstance(other, AsyncFile)
+            and other.dataset.rid == self.dataset.rid
+            and other.path == self.path
+            and other.transaction_rid == self.transaction_rid
+        )
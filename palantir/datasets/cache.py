@@ -0,0 +1,186 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+from palantir.core.util import CacheStats
+from palantir.datasets.types import FileLocator
+
+_TEMP_SUFFIX = ".tmp"
+
+
+class FileCache:
+    """
+    A size-bounded on-disk cache of the content of files in committed transactions, which are immutable. Entries are
+    keyed by a hash of the dataset rid, transaction range and logical path, and the least recently used entries are
+    evicted once the cache exceeds `max_bytes`.
+
+    The cache directory can be shared by several processes. Each process tracks recency in memory and records it in
+    the modification time of the cached files, so that the order survives restarts.
+
+    Parameters
+    ----------
+    directory : str or os.PathLike, optional
+        The directory holding cached files. Defaults to ``~/.palantir/cache/files``.
+    max_bytes : int, optional
+        The maximum total size in bytes of cached files. Defaults to 10 GiB.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike] = None,
+        max_bytes: int = 10 * 1024 * 1024 * 1024,
+    ):
+        self.directory = Path(
+            directory or Path.home() / ".palantir" / "cache" / "files"
+        )
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    @staticmethod
+    def key(locator: FileLocator) -> str:
+        """Returns the cache key of a file."""
+        return hashlib.sha256(
+            "\0".join(
+                (
+                    str(locator.dataset_rid),
+                    locator.start_transaction_rid or "",
+                    locator.end_ref,
+                    locator.logical_path,
+                )
+            ).encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[io.BufferedReader]:
+        """Returns a reader of the cached content for the key, or None if it is not cached."""
+        path = self.directory / key
+        with self._lock:
+            try:
+                # returned open, the caller closes it
+                file = open(path, "rb")  # pylint: disable=consider-using-with
+            except FileNotFoundError:
+                # possibly evicted by another process
+                self._forget(key)
+                self._misses += 1
+                return None
+            self._hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:
+                self._add(key, os.fstat(file.fileno()).st_size)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return file
+
+    def put(self, key: str, stream: io.IOBase) -> io.BufferedReader:
+        """
+        Caches the content of a stream under the key, evicting least recently used entries if the cache is full.
+
+        Returns: A reader of the cached content.
+        """
+        path = self.directory / key
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=_TEMP_SUFFIX)
+        try:
+            with open(fd, "wb") as temp:
+                shutil.copyfileobj(stream, temp)
+            os.replace(temp_path, path)
+        finally:
+            # the temporary file is only left if the write failed or was interrupted
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+        # opened before evicting so that the content can be read even if it is larger than the cache, and returned
+        # open, the caller closes it
+        file = open(path, "rb")  # pylint: disable=consider-using-with
+        try:
+            with self._lock:
+                self._forget(key)
+                self._add(key, os.fstat(file.fileno()).st_size)
+                self._evict()
+        except BaseException:
+            file.close()
+            raise
+        return file
+
+    def stats(self) -> CacheStats:
+        """Returns a :class:`CacheStats` report of the cache activity."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+            )
+
+    def clear(self) -> None:
+        """Removes all cached files."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _load(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(_TEMP_SUFFIX):
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._add(key, size)
+        self._evict()
+
+    def _add(self, key: str, size: int):
+        self._entries[key] = size
+        self._size += size
+
+    def _forget(self, key: str):
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._size -= size
+
+    def _remove(self, key: str):
+        self._forget(key)
+        try:
+            os.unlink(self.directory / key)
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        while self._size > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def __repr__(self) -> str:
+        return f"FileCache(directory='{self.directory}', max_bytes={self.max_bytes})"
@@ -13,16 +13,42 @@
 #  limitations under the License.
 
 import io
+import itertools
+import os
+from contextlib import closing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from os.path import relpath
-from time import sleep
-from typing import TYPE_CHECKING, Generator, Optional, Tuple, Any, Union, Dict
+from time import perf_counter, sleep
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Any,
+    Union,
+    cast,
+)
 
 from dateutil.parser import isoparse
+import requests
 
 import palantir
-from palantir.core.rpc import ConjureClient
 from palantir.core.types import PalantirContext, ResourceIdentifier
-from palantir.core.util import page_results
+from palantir.core.util import TTLCache, page_results, poll_until
+from palantir.datasets.cache import FileCache
+from palantir.datasets.io import (
+    FileContent,
+    _CountingReader,
+    _RangedReader,
+    _iter_parts,
+    _map_file,
+)
+from palantir.datasets.query import Filter, select_query
 from palantir.datasets.rpc.catalog import (
     CatalogService,
     Transaction as ConjureTransaction,
@@ -33,6 +59,7 @@ from palantir.datasets.rpc.catalog import (
     Dataset as ConjureDataset,
     CreateDatasetRequest,
     CreateBranchRequest,
+    FileResource,
 )
 from palantir.datasets.rpc.data_proxy import (
     DataProxyService,
@@ -49,8 +76,6 @@ from palantir.datasets.rpc.path import PathService, DecoratedResource
 from palantir.datasets.rpc.schema import (
     FoundrySchema as ConjureFoundrySchema,
     SchemaService,
-    FoundryFieldSchema,
-    FoundryFieldType,
 )
 from palantir.datasets.rpc.sql import (
     SqlQueryService,
@@ -60,44 +85,116 @@ from palantir.datasets.rpc.sql import (
     SqlQuery,
     QueryStatusVisitor,
 )
+from palantir.datasets.schema import (
+    _get_conjure_field_schema,
+    _get_data_frame_reader_class,
+    _get_sdk_schema,
+    _prune_absent_values,
+)
 from palantir.datasets.types import (
     FileLocator,
     DatasetLocator,
+    PartUpload,
+    QueryConfig,
+    QueryStats,
+    TransferStats,
+    UploadConfig,
     TransactionType,
     TransactionStatus,
-    FileFormat,
-    FieldType,
-    DecimalFieldType,
-    ArrayFieldType,
-    MapFieldType,
-    StructFieldType,
-    BinaryFieldType,
-    BooleanFieldType,
-    ByteFieldType,
-    DateFieldType,
-    DoubleFieldType,
-    FloatFieldType,
-    IntegerFieldType,
-    LongFieldType,
-    ShortFieldType,
-    StringFieldType,
-    TimestampFieldType,
     FoundrySchema,
 )
 
 if TYPE_CHECKING:
     from palantir.datasets.core import File, Transaction, Dataset
     import pyarrow as pa
+    from urllib3.response import HTTPResponse
+
+
+_MIN_LIST_PAGE_SIZE = 100
+_MAX_LIST_PAGE_SIZE = 1000
+
+
+def _growing_page_sizes(initial: int, maximum: int) -> Iterator[int]:
+    size = initial
+    while True:
+        yield size
+        size = min(size * 2, maximum)
+
+
+def _parse_timestamps(values: List[str]) -> "pa.Array":
+    """Parses ISO 8601 timestamps into a UTC timestamp array, in bulk unless some value is not fully specified."""
+    import pyarrow as pa
+
+    timestamp = pa.timestamp("us", tz="UTC")
+    try:
+        return pa.array(values, pa.string()).cast(timestamp)
+    except pa.ArrowInvalid:
+        return pa.array([isoparse(value) for value in values], timestamp)
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and error.response.status_code >= 500
+    return isinstance(
+        error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    )
 
 
-def _chunk(content, chunk_size):
-    for offset in range(0, len(content), chunk_size):
-        yield content[offset : offset + chunk_size]
+def _is_transaction(ref: str) -> bool:
+    rid = ResourceIdentifier.try_parse(ref)
+    return rid is not None and rid.type == "transaction"
+
+
+def _run_bounded(
+    task: Callable[[int, Any], Any],
+    items: Iterable[Any],
+    max_workers: int,
+    on_done: Callable[[Any], None] = None,
+) -> List[Any]:
+    """
+    Runs `task(index, item)` for each item on a bounded thread pool, keeping at most `max_workers` items in flight so
+    that `items` can be produced lazily. Reports each result from the calling thread, and returns the results in
+    completion order.
+    """
+    results: List[Any] = []
+
+    def collect(futures: Set[Future]):
+        for future in futures:
+            result = future.result()
+            results.append(result)
+            if on_done is not None:
+                on_done(result)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Set[Future] = set()
+        try:
+            for idx, item in enumerate(items):
+                if len(pending) >= max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(executor.submit(task, idx, item))
+            collect(wait(pending).done)
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+    return results
+
+
+def _upload_parts(
+    upload_part: Callable[[int, Any], PartUpload],
+    parts: Iterable[Any],
+    max_workers: int,
+    on_part_uploaded: Callable[[PartUpload], None] = None,
+) -> List[PartUpload]:
+    """Uploads parts on a bounded thread pool, returning the reports ordered by index."""
+    uploaded = _run_bounded(upload_part, parts, max_workers, on_part_uploaded)
+    return sorted(uploaded, key=lambda part: part.index)
 
 
 class DatasetServices:
     def __init__(self, ctx: PalantirContext):
-        self.factory = ConjureClient()
+        self.factory = ctx.conjure_client
         self.ctx = ctx
 
     @property
@@ -142,9 +239,23 @@ class DatasetServices:
 
 
 class DatasetsClient:
-    def __init__(self, services: DatasetServices):
+    def __init__(
+        self,
+        services: DatasetServices,
+        upload_config: UploadConfig = None,
+        file_cache: FileCache = None,
+        query_config: QueryConfig = None,
+        schema_cache_size: int = 256,
+    ):
         self.services = services
         self.ctx = services.ctx
+        self.upload_config = upload_config or UploadConfig()
+        self.file_cache = file_cache
+        self.query_config = query_config or QueryConfig()
+        # schemas do not change once a transaction is committed, so entries never expire
+        self._schema_cache: TTLCache[Tuple[str, str, str], FoundrySchema] = TTLCache(
+            maxsize=schema_cache_size, ttl=None
+        )
 
     @property
     def _catalog_service(self) -> CatalogService:
@@ -239,11 +350,80 @@ class DatasetsClient:
         dataset: "Dataset",
         path: str = None,
         include_open_transaction: bool = False,
-        page_size: int = 100,
+        page_size: int = None,
     ) -> Generator["File", None, None]:
+        """
+        Lists the files in the view of a dataset, prefetching the next page while the current one is consumed.
+
+        :param page_size: the number of files requested per page. Defaults to pages growing from 100 up to 1000 files,
+            so that short listings return quickly while long ones need fewer round-trips.
+        """
+        for file in self._list_file_resources(
+            dataset, path, include_open_transaction, page_size
+        ):
+            yield palantir.datasets.core.File(
+                dataset=dataset,
+                path=file.logical_path,
+                # parsed lazily, as most callers only need paths
+                modified=file.time_modified,
+                transaction_rid=file.transaction_rid,
+                length=file.file_metadata.length
+                if file.file_metadata is not None
+                else None,
+                client=self,
+            )
+
+    def list_files_table(
+        self,
+        dataset: "Dataset",
+        path: str = None,
+        include_open_transaction: bool = False,
+        page_size: int = None,
+    ) -> "pa.Table":
+        """
+        Lists the files in the view of a dataset as an Arrow table, with one row per file and the columns `path`,
+        `length`, `modified` and `transaction_rid`. Timestamps are parsed in bulk and no object is created per file,
+        so that large listings need little CPU and memory.
+        """
+        import pyarrow as pa
+
+        paths: List[str] = []
+        lengths: List[Optional[int]] = []
+        modified: List[str] = []
+        transaction_rids: List[str] = []
+        for file in self._list_file_resources(
+            dataset, path, include_open_transaction, page_size
+        ):
+            paths.append(file.logical_path)
+            lengths.append(
+                file.file_metadata.length if file.file_metadata is not None else None
+            )
+            modified.append(file.time_modified)
+            transaction_rids.append(file.transaction_rid)
+        return pa.table(
+            {
+                "path": pa.array(paths, pa.string()),
+                "length": pa.array(lengths, pa.int64()),
+                "modified": _parse_timestamps(modified),
+                "transaction_rid": pa.array(transaction_rids, pa.string()),
+            }
+        )
+
+    def _list_file_resources(
+        self,
+        dataset: "Dataset",
+        path: Optional[str],
+        include_open_transaction: bool,
+        page_size: Optional[int],
+    ) -> Generator[FileResource, None, None]:
         if dataset.locator.end_transaction_rid is None:
             return
-        for file in page_results(
+        page_sizes = (
+            itertools.repeat(page_size)
+            if page_size is not None
+            else _growing_page_sizes(_MIN_LIST_PAGE_SIZE, _MAX_LIST_PAGE_SIZE)
+        )
+        yield from page_results(
             values_extractor=lambda page: page.values,
             token_extractor=lambda page: page.next_page_token,
             page_supplier=lambda next_page_token: self._catalog_service.get_dataset_view_files2(
@@ -259,23 +439,31 @@ class DatasetsClient:
                 else "master",
                 logical_path=None if path is None else relpath(path),
                 include_open_exclusive_transaction=include_open_transaction,
-                page_size=page_size,
+                page_size=next(page_sizes),
                 page_start_logical_path=next_page_token,
                 exclude_hidden_files=True,
             ),
-        ):
-            yield palantir.datasets.core.File(
-                dataset=dataset,
-                path=file.logical_path,
-                modified=isoparse(file.time_modified),
-                transaction_rid=ResourceIdentifier.from_string(file.transaction_rid),
-                length=file.file_metadata.length
-                if file.file_metadata is not None
-                else None,
-                client=self,
-            )
+            prefetch=True,
+        )
 
     def read_file(self, locator: FileLocator) -> io.IOBase:
+        """
+        Reads a file. If a :class:`FileCache` is configured and the file is read at a transaction, which is
+        immutable, the content is served from and stored in the cache.
+
+        :param locator: the file to read
+        :return: a binary stream of the file content
+        """
+        if self.file_cache is not None and _is_transaction(locator.end_ref):
+            key = FileCache.key(locator)
+            cached = self.file_cache.get(key)
+            if cached is not None:
+                return cached
+            with closing(self._get_file_in_view(locator)) as stream:
+                return self.file_cache.put(key, stream)
+        return self._get_file_in_view(locator)
+
+    def _get_file_in_view(self, locator: FileLocator) -> io.IOBase:
         return self._data_proxy_service.get_file_in_view(
             auth_header=self.ctx.auth_token,
             dataset_rid=str(locator.dataset_rid),
@@ -284,6 +472,84 @@ class DatasetsClient:
             start_transaction_rid=locator.start_transaction_rid,
         )
 
+    def read_file_range(
+        self, locator: FileLocator, start: int, end: Optional[int] = None
+    ) -> "HTTPResponse":
+        """
+        Reads a range of bytes of a file with an HTTP Range request.
+
+        :param locator: the file to read
+        :param start: the offset of the first byte to read
+        :param end: the offset of the last byte to read, inclusive, or None to read to the end of the file
+        :return: a binary stream of the requested bytes
+        """
+        stream = self._data_proxy_service.get_file_in_view(
+            auth_header=self.ctx.auth_token,
+            dataset_rid=str(locator.dataset_rid),
+            end_ref=locator.end_ref,
+            logical_path=relpath(locator.logical_path),
+            start_transaction_rid=locator.start_transaction_rid,
+            byte_range=f"bytes={start}-{'' if end is None else end}",
+        )
+        # the raw urllib3 response, whose headers describe the returned range
+        return cast("HTTPResponse", stream)
+
+    def open_file(
+        self,
+        locator: FileLocator,
+        seekable: bool = False,
+        size: Optional[int] = None,
+        buffer_size: int = 1024 * 1024,
+    ) -> io.BufferedReader:
+        """
+        Opens a file for buffered streaming reads.
+
+        :param locator: the file to read
+        :param seekable: whether the returned reader is seekable, in which case each buffer fill is fetched with an
+            HTTP Range request rather than streaming the whole file in a single request
+        :param size: the size of the file if known, saves a request when seeking relative to the end of the file
+        :param buffer_size: the size of the read buffer
+        :return: a buffered binary reader of the file content
+        """
+        raw: io.IOBase
+        if self.file_cache is not None and _is_transaction(locator.end_ref):
+            # served from a local file, which is seekable
+            raw = self.read_file(locator)
+        elif seekable:
+            raw = _RangedReader(
+                lambda start, end: self.read_file_range(locator, start, end), size
+            )
+        else:
+            raw = self.read_file(locator)
+        return io.BufferedReader(cast(io.RawIOBase, raw), buffer_size)
+
+    def read_files(
+        self,
+        locators: Iterable[FileLocator],
+        consumer: Callable[[FileLocator, io.IOBase], None],
+        max_workers: int = 8,
+    ) -> TransferStats:
+        """
+        Reads files concurrently, keeping at most `max_workers` downloads in flight.
+
+        :param locators: the files to read, which may be produced lazily
+        :param consumer: called from a worker thread with the locator and binary stream of each file, which it must
+            consume before returning. The stream is closed once the consumer returns or raises
+        :param max_workers: the maximum number of files read concurrently
+        :return: a :class:`TransferStats` report of the bytes read
+        """
+        start = perf_counter()
+
+        def read(_: int, locator: FileLocator) -> int:
+            with _CountingReader(self.read_file(locator)) as stream:
+                consumer(locator, stream)
+                return stream.bytes_read
+
+        sizes = _run_bounded(read, locators, max_workers)
+        return TransferStats(
+            files=len(sizes), size=sum(sizes), elapsed=perf_counter() - start
+        )
+
     def start_transaction(
         self,
         dataset: "Dataset",
@@ -326,6 +592,39 @@ class DatasetsClient:
             request=CloseTransactionRequest(record={}),
         )
 
+    def get_schema(self, dataset: "Dataset") -> Optional[FoundrySchema]:
+        """
+        Schemas of views ending at a transaction are cached by dataset, branch and end transaction, as they do not
+        change unless replaced, which :meth:`put_schema` accounts for.
+
+        :param dataset: the dataset whose schema to get, at the end transaction of its view
+        :return: the schema of the dataset, or None if it has no schema
+        """
+        end_transaction_rid = dataset.locator.end_transaction_rid
+        if end_transaction_rid is None:
+            return self._get_schema(dataset)
+        key = (str(dataset.rid), dataset.branch, str(end_transaction_rid))
+        schema = self._schema_cache.get(key)
+        if schema is None:
+            schema = self._get_schema(dataset)
+            if schema is not None:
+                self._schema_cache.put(key, schema)
+        return schema
+
+    def _get_schema(self, dataset: "Dataset") -> Optional[FoundrySchema]:
+        end_transaction_rid = dataset.locator.end_transaction_rid
+        versioned_schema = self._schema_service.get_schema(
+            auth_header=self.ctx.auth_token,
+            dataset_rid=str(dataset.rid),
+            branch_id=dataset.branch,
+            end_transaction_rid=str(end_transaction_rid)
+            if end_transaction_rid
+            else None,
+        )
+        if versioned_schema is None:
+            return None
+        return _get_sdk_schema(versioned_schema.schema)
+
     def put_schema(self, dataset: "Dataset", schema: FoundrySchema) -> None:
         data_frame_reader_class, dataset_format = _get_data_frame_reader_class(
             schema.format
@@ -353,16 +652,64 @@ class DatasetsClient:
                 ),
             ),
         )
+        self._schema_cache.invalidate(
+            lambda key: key[0] == str(dataset.rid) and key[1] == dataset.branch
+        )
+
+    def put_file(
+        self,
+        locator: FileLocator,
+        content: FileContent,
+        on_part_uploaded: Callable[[PartUpload], None] = None,
+    ) -> None:
+        """
+        Uploads content to a file. Content of at least :attr:`UploadConfig.part_size` bytes is uploaded as parts in
+        parallel, which are then concatenated into the destination file. Content that is not already in memory is
+        streamed, holding at most a few parts in memory at a time.
 
-    def put_file(self, locator: FileLocator, content: bytes) -> None:
-        megabyte = 1024 * 1024
-        max_chunk_size = 50 * megabyte
-        if len(content) < max_chunk_size:
+        :param locator: the file to write, whose end_ref is the rid of an open transaction
+        :param content: the content to upload, see :data:`FileContent`
+        :param on_part_uploaded: an optional callback invoked with a :class:`PartUpload` report for each uploaded part
+        """
+        part_size = self.upload_config.part_size
+        if isinstance(content, os.PathLike):
+            self.upload_file(locator, content, on_part_uploaded)
+            return
+        if (
+            isinstance(content, (bytes, bytearray, memoryview))
+            and memoryview(content).nbytes < part_size
+        ):
             self._put_file(locator, content)
+            return
+
+        parts = _iter_parts(content, part_size)
+        first = next(parts, b"")
+        second = next(parts, None)
+        if second is None:
+            self._put_file(locator, first)
         else:
-            self._put_file_chunked(locator, content, max_chunk_size)
+            self._put_file_chunked(
+                locator, itertools.chain([first, second], parts), on_part_uploaded
+            )
+
+    def upload_file(
+        self,
+        locator: FileLocator,
+        local_path: Union[str, os.PathLike],
+        on_part_uploaded: Callable[[PartUpload], None] = None,
+    ) -> None:
+        """
+        Uploads a local file. The file is memory-mapped and uploaded from slices of the mapping, so its content is
+        never copied into Python bytes objects.
 
-    def _put_file(self, locator: FileLocator, content: bytes) -> None:
+        :param locator: the file to write, whose end_ref is the rid of an open transaction
+        :param local_path: the path of the local file to upload
+        :param on_part_uploaded: an optional callback invoked with a :class:`PartUpload` report for each uploaded part
+        """
+        with _map_file(local_path) as view:
+            self.put_file(locator, view, on_part_uploaded)
+
+    def _put_file(self, locator: FileLocator, content: Any) -> None:
         self._data_proxy_service.put_file(
             auth_header=self.ctx.auth_token,
             dataset_rid=str(locator.dataset_rid),
@@ -371,20 +718,47 @@ class DatasetsClient:
             file_data=content,
         )
 
+    def _put_part(self, locator: FileLocator, idx: int, content: Any) -> PartUpload:
+        config = self.upload_config
+        chunk_path = f"{relpath(locator.logical_path)}.{idx}"
+        start = perf_counter()
+        attempt = 1
+        while True:
+            try:
+                self._data_proxy_service.put_file(
+                    auth_header=self.ctx.auth_token,
+                    dataset_rid=str(locator.dataset_rid),
+                    transaction_rid=locator.end_ref,
+                    logical_path=chunk_path,
+                    file_data=content,
+                )
+                break
+            except requests.exceptions.RequestException as error:
+                if attempt >= config.max_attempts or not _is_retryable(error):
+                    raise
+                sleep(config.retry_backoff * 2 ** (attempt - 1))
+                attempt += 1
+        return PartUpload(
+            index=idx,
+            logical_path=chunk_path,
+            size=memoryview(content).nbytes,
+            elapsed=perf_counter() - start,
+            attempts=attempt,
+        )
+
     def _put_file_chunked(
-        self, locator: FileLocator, content: bytes, chunk_size: int
+        self,
+        locator: FileLocator,
+        parts: Iterable[Any],
+        on_part_uploaded: Callable[[PartUpload], None] = None,
     ) -> None:
-        chunk_paths = []
-        for idx, chunk_content in enumerate(_chunk(content, chunk_size)):
-            chunk_path = f"{relpath(locator.logical_path)}.{idx}"
-            self._data_proxy_service.put_file(
-                auth_header=self.ctx.auth_token,
-                dataset_rid=str(locator.dataset_rid),
-                transaction_rid=locator.end_ref,
-                logical_path=chunk_path,
-                file_data=chunk_content,
-            )
-            chunk_paths.append(chunk_path)
+        uploaded = _upload_parts(
+            lambda idx, content: self._put_part(locator, idx, content),
+            parts,
+            self.upload_config.max_workers,
+            on_part_uploaded,
+        )
+        chunk_paths = [part.logical_path for part in uploaded]
 
         response: StartConcatenationTaskResponse = (
             self._data_proxy_concatenation_service.start_concatenation_task(
@@ -404,19 +778,60 @@ class DatasetsClient:
                 concatenation_task_id=response.concatenation_task_id,
             ).status.accept(ConcatenationTaskTerminationVisitor())
 
-        while not is_terminal():
-            sleep(0.5)
+        poll_until(is_terminal)
 
     def read_dataset(
         self,
         locator: DatasetLocator,
+        columns: List[str] = None,
+        filters: List[Filter] = None,
+        on_query_stats: Callable[[QueryStats], None] = None,
     ) -> "pa.Table":
+        import pyarrow as pa
+
+        query = self._query_dataset(locator, columns, filters)
+        with query.stream as stream:
+            table = pa.ipc.open_stream(stream).read_all()
+        query.report(on_query_stats)
+        return table
+
+    def read_dataset_batches(
+        self,
+        locator: DatasetLocator,
+        columns: List[str] = None,
+        filters: List[Filter] = None,
+        on_query_stats: Callable[[QueryStats], None] = None,
+    ) -> Generator["pa.RecordBatch", None, None]:
+        """
+        Reads a dataset as a stream of Arrow record batches, decoded from the query results as they arrive so that
+        only one batch is held in memory at a time.
+
+        :param locator: the dataset view to read
+        :param columns: the columns to read, all columns if None
+        :param filters: conditions that the rows to read must all match
+        :param on_query_stats: an optional callback invoked with a :class:`QueryStats` report once all batches are read
+        :return: a generator over the record batches of the dataset
+        """
+        import pyarrow as pa
+
+        query = self._query_dataset(locator, columns, filters)
+        with query.stream as stream:
+            yield from pa.ipc.open_stream(stream)
+        query.report(on_query_stats)
+
+    def _query_dataset(
+        self,
+        locator: DatasetLocator,
+        columns: List[str] = None,
+        filters: List[Filter] = None,
+    ) -> "_QueryResults":
+        """Queries the content of a dataset, returning the stream of Arrow IPC results once the query is ready."""
         if locator.end_transaction_rid is None:
             raise ValueError("read failed. unresolved end transaction rid")
 
-        query = SqlQuery(
-            f'SELECT * FROM "{locator.end_transaction_rid}@{locator.branch_id}"."{locator.rid}"'
-        )
+        config = self.query_config
+        start = perf_counter()
+        query = SqlQuery(select_query(locator, columns, filters))
         response = self._sql_query_service.execute(
             auth_header=self.ctx.auth_token,
             request=SqlExecuteRequest(
@@ -424,15 +839,21 @@ class DatasetsClient:
                 fallback_branch_ids=[],
                 query=query,
                 serialization_protocol=SerializationProtocol.ARROW,  # type: ignore
+                timeout=None if config.timeout is None else int(config.timeout * 1000),
             ),
         )
-        query_status = response.status
-
-        while not query_status.accept(_IsQueryStatusTerminalVisitor()):
-            sleep(1)
-            query_status = self._sql_query_service.get_status(
-                auth_header=self.ctx.auth_token, query_id=response.query_id
-            ).status
+        submitted = perf_counter()
+
+        if not response.status.accept(_IsQueryStatusTerminalVisitor()):
+            poll_until(
+                lambda: self._sql_query_service.get_status(
+                    auth_header=self.ctx.auth_token, query_id=response.query_id
+                ).status.accept(_IsQueryStatusTerminalVisitor()),
+                initial_delay=config.initial_poll_interval,
+                max_delay=config.max_poll_interval,
+                timeout=config.timeout,
+            )
+        ready = perf_counter()
 
         stream = self._sql_query_service.get_results(
             auth_header=self.ctx.auth_token, query_id=response.query_id
@@ -441,13 +862,38 @@ class DatasetsClient:
         # the BufferedReader will close the underlying stream when it is closed
         stream.auto_close = False  # type: ignore
 
-        # N.B. we assume since the query is a simple select star that we are direct read eligible, if the stack is not
-        # properly configured for direct read this will fail
+        # N.B. we assume since the query is a simple select with optional projection and filters that we are direct
+        # read eligible, if the stack is not properly configured for direct read this will fail
         control = stream.read(1)  # control character that should be 'A'
         assert control == b"A"
-        import pyarrow as pa
+        return _QueryResults(
+            response.query_id,
+            stream,
+            submit=submitted - start,
+            running=ready - submitted,
+        )
 
-        return pa.ipc.open_stream(stream).read_all()
+
+class _QueryResults:
+    """The results stream of a ready query, with the timings of the query up to the start of the transfer."""
+
+    def __init__(self, query_id: str, stream: io.IOBase, submit: float, running: float):
+        self.query_id = query_id
+        self.stream = stream
+        self.submit = submit
+        self.running = running
+        self.transfer_start = perf_counter()
+
+    def report(self, on_query_stats: Optional[Callable[[QueryStats], None]]) -> None:
+        if on_query_stats is not None:
+            on_query_stats(
+                QueryStats(
+                    query_id=self.query_id,
+                    submit=self.submit,
+                    running=self.running,
+                    transfer=perf_counter() - self.transfer_start,
+                )
+            )
 
 
 class _IsQueryStatusTerminalVisitor(QueryStatusVisitor):
@@ -493,86 +939,3 @@ class ConcatenationTaskTerminationVisitor(ConcatenationTaskStatusVisitor):
 
     def in_progress(self, in_progress: ConcatenationTaskInProgress):
         return False
-
-
-def _get_data_frame_reader_class(file_format: FileFormat) -> Tuple[str, Optional[str]]:
-    if file_format == FileFormat.AVRO:
-        return "com.palantir.foundry.spark.input.AvroDataFrameReader", "avro"
-    if file_format == FileFormat.CSV:
-        return "com.palantir.foundry.spark.input.TextDataFrameReader", None
-    if file_format == FileFormat.PARQUET:
-        return "com.palantir.foundry.spark.input.ParquetDataFrameReader", "parquet"
-    if file_format == FileFormat.SOHO:
-        return "com.palantir.foundry.spark.input.DataSourceDataFrameReader", "soho"
-    raise ValueError(f"unknown file format: {file_format}")
-
-
-def _get_conjure_field_schema(
-    field_type: FieldType,
-    name: Optional[str] = None,
-    nullable: bool = True,
-    metadata: Dict[str, Any] = None,
-) -> FoundryFieldSchema:
-    foundry_field_type = _get_conjure_field_type(field_type)
-    array_subtype = None
-    map_key_type = None
-    map_value_type = None
-    sub_schemas = None
-    precision = None
-    scale = None
-
-    if isinstance(field_type, DecimalFieldType):
-        precision = field_type.precision
-        scale = field_type.scale
-    elif isinstance(field_type, ArrayFieldType):
-        array_subtype = _get_conjure_field_schema(field_type.element_type)
-    elif isinstance(field_type, MapFieldType):
-        map_key_type = _get_conjure_field_schema(field_type.key_type, nullable=False)
-        map_value_type = _get_conjure_field_schema(field_type.value_type)
-    elif isinstance(field_type, StructFieldType):
-        sub_schemas = [_get_conjure_field_schema(child) for child in field_type.fields]
-
-    return FoundryFieldSchema(
-        field_type=foundry_field_type,
-        name=name,
-        nullable=nullable,
-        custom_metadata={} if metadata is None else metadata,
-        array_subtype=array_subtype,
-        map_key_type=map_key_type,
-        map_value_type=map_value_type,
-        sub_schemas=sub_schemas,
-        precision=precision,
-        scale=scale,
-    )
-
-
-def _get_conjure_field_type(field_type: FieldType) -> FoundryFieldType:
-    sdk_to_conjure = {
-        ArrayFieldType: FoundryFieldType.ARRAY,
-        BinaryFieldType: FoundryFieldType.BINARY,
-        BooleanFieldType: FoundryFieldType.BOOLEAN,
-        ByteFieldType: FoundryFieldType.BYTE,
-        DateFieldType: FoundryFieldType.DATE,
-        DecimalFieldType: FoundryFieldType.DECIMAL,
-        DoubleFieldType: FoundryFieldType.DOUBLE,
-        FloatFieldType: FoundryFieldType.FLOAT,
-        IntegerFieldType: FoundryFieldType.INTEGER,
-        LongFieldType: FoundryFieldType.LONG,
-        MapFieldType: FoundryFieldType.MAP,
-        ShortFieldType: FoundryFieldType.SHORT,
-        StringFieldType: FoundryFieldType.STRING,
-        StructFieldType: FoundryFieldType.STRUCT,
-        TimestampFieldType: FoundryFieldType.TIMESTAMP,
-    }
-    conjure_field_type = sdk_to_conjure.get(type(field_type))
-    if conjure_field_type is not None:
-        return conjure_field_type
-    raise ValueError(f"Unknown FoundryFieldType: {field_type}")
-
-
-def _prune_absent_values(dictionary):
-    return {
-        k: _prune_absent_values(v) if isinstance(v, dict) else v
-        for k, v in dictionary.items()
-        if v is not None
-    }
@@ -13,26 +13,112 @@
 #  limitations under the License.
 
 import io
+import os
+import shutil
+from contextlib import closing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Generator, Union, Tuple, TYPE_CHECKING, Optional
+from urllib.parse import quote
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Set,
+    Union,
+    Tuple,
+    TYPE_CHECKING,
+    Optional,
+)
+
+from dateutil.parser import isoparse
 
 from palantir.core import context
 from palantir.core.types import ResourceIdentifier
-from palantir.datasets.client import DatasetsClient, DatasetServices
+from palantir.datasets.client import DatasetsClient, DatasetServices, _run_bounded
 from palantir.datasets.errors import TransactionAbortedError
-from palantir.datasets.schema import pandas_to_foundry_schema
+from palantir.datasets.io import FileContent
+from palantir.datasets.query import Filter
+from palantir.datasets.schema import arrow_to_foundry_schema, pandas_to_foundry_schema
 from palantir.datasets.types import (
     FileLocator,
+    FoundrySchema,
     TransactionType,
     TransactionStatus,
+    TransferStats,
+    QueryStats,
 )
 
 if TYPE_CHECKING:
     import pandas as pd
     import pyarrow as pa
+    import pyarrow.parquet as pq
     from palantir.datasets.types import DatasetLocator
 
 
+_DEFAULT_BYTES_PER_FILE = 128 * 1024 * 1024
+_HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def _rows_per_file(
+    df: "pd.DataFrame", max_rows: Optional[int], max_bytes: Optional[int]
+) -> int:
+    rows = max_rows or max(len(df), 1)
+    if max_bytes and len(df) > 0:
+        # deep=False counts object columns by reference, which keeps the estimate cheap on very large frames
+        row_size = df.memory_usage(index=False, deep=False).sum() / len(df)
+        if row_size > 0:
+            rows = min(rows, max(int(max_bytes // row_size), 1))
+    return rows
+
+
+def _partition_dir(partition_cols: List[str], key) -> str:
+    import pandas as pd
+
+    values = key if isinstance(key, tuple) else (key,)
+    return "".join(
+        f"{col}={_HIVE_DEFAULT_PARTITION if pd.isna(value) else quote(str(value), safe='')}/"
+        for col, value in zip(partition_cols, values)
+    )
+
+
+def _dataframe_parts(
+    df: "pd.DataFrame", rows_per_file: int, partition_cols: List[str]
+) -> Generator[Tuple[str, "pd.DataFrame"], None, None]:
+    """Lazily splits a DataFrame into files of at most `rows_per_file` rows, under one directory per partition."""
+    if partition_cols:
+        # a single column is grouped by name, as the type of keys of a one element list changed across pandas versions
+        by = partition_cols[0] if len(partition_cols) == 1 else partition_cols
+        groups: Iterable[Tuple[str, "pd.DataFrame"]] = (
+            (_partition_dir(partition_cols, key), group)
+            for key, group in df.groupby(by, sort=False, dropna=False, observed=True)
+        )
+    else:
+        groups = [("", df)]
+    for directory, group in groups:
+        for idx, start in enumerate(range(0, max(len(group), 1), rows_per_file)):
+            yield f"{directory}part-{idx:05d}.parquet", group.iloc[
+                start : start + rows_per_file
+            ]
+
+
+def _size_bounded_batches(
+    data: Union["pa.RecordBatch", "pa.Table"], max_bytes: int
+) -> List["pa.RecordBatch"]:
+    """Splits data into record batches of at most about `max_bytes` bytes in memory, without copying."""
+    batches = data.to_batches() if hasattr(data, "to_batches") else [data]
+    slices: List["pa.RecordBatch"] = []
+    for batch in batches:
+        rows = batch.num_rows
+        if batch.nbytes > max_bytes and rows > 1:
+            rows = max(int(max_bytes // (batch.nbytes / batch.num_rows)), 1)
+        slices.extend(
+            batch.slice(offset, rows) for offset in range(0, batch.num_rows, rows)
+        )
+    return slices
+
+
 class Dataset:
     """A reference to a Foundry Dataset, resolved to a branch and view (i.e. Transaction Range)."""
 
@@ -58,16 +144,42 @@ class Dataset:
             self.locator.end_transaction_rid,
         )
 
-    def list_files(self, path: str = None) -> Generator["File", None, None]:
+    def list_files(
+        self, path: str = None, page_size: int = None
+    ) -> Generator["File", None, None]:
         """
-        Lists the files in the Dataset for the :prop:`view`.
+        Lists the files in the Dataset for the :prop:`view`. The next page of files is fetched in the background
+        while the current one is consumed.
 
         Args:
             path: An optional path prefix to use to filter when listing files.
+            page_size: An optional number of files to fetch per page. Defaults to pages growing from 100 to 1000 files.
 
         Returns: A generator over pages of :class:`File` objects in the current view and branch.
         """
-        return self.client.list_files(dataset=self, path=path)
+        return self.client.list_files(dataset=self, path=path, page_size=page_size)
+
+    def list_files_table(self, path: str = None, page_size: int = None) -> "pa.Table":
+        """
+        Lists the files in the Dataset for the :prop:`view` as an Arrow table, which is much cheaper than
+        :meth:`list_files` for large datasets.
+
+        Args:
+            path: An optional path prefix to use to filter when listing files.
+            page_size: An optional number of files to fetch per page. Defaults to pages growing from 100 to 1000 files.
+
+        Returns: A :class:`pyarrow.Table` with the columns `path`, `length`, `modified` and `transaction_rid`, and one
+        row per file in the current view and branch.
+        """
+        return self.client.list_files_table(
+            dataset=self, path=path, page_size=page_size
+        )
+
+    def get_schema(self) -> Optional[FoundrySchema]:
+        """
+        Returns: The :class:`FoundrySchema` of the Dataset at the current view, or None if the Dataset has no schema.
+        """
+        return self.client.get_schema(self)
 
     def file(self, file_ref: str) -> "File":
         """
@@ -87,34 +199,223 @@ class Dataset:
             client=self.client,
         )
 
-    def read_arrow(self) -> "pa.Table":
+    def download(
+        self, dest_dir: Union[str, os.PathLike], path: str = None, max_workers: int = 8
+    ) -> TransferStats:
+        """
+        Downloads the files in the Dataset for the :prop:`view` to a local directory, fetching up to `max_workers`
+        files concurrently. Files are streamed to disk and written at their logical path relative to `dest_dir`.
+
+        Args:
+            dest_dir: The local directory to download to, created if it does not exist.
+            path: An optional path prefix to use to filter the files to download.
+            max_workers: The maximum number of files downloaded concurrently.
+
+        Returns: A :class:`TransferStats` report of the downloaded files.
+        """
+        root = os.path.abspath(dest_dir)
+
+        def write(locator: FileLocator, stream: io.IOBase) -> None:
+            target = os.path.abspath(os.path.join(root, locator.logical_path))
+            if os.path.commonpath([root, target]) != root:
+                raise ValueError(
+                    f"file path '{locator.logical_path}' escapes the destination directory"
+                )
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as out:
+                shutil.copyfileobj(stream, out)
+
+        return self.client.read_files(
+            (file.locator() for file in self.list_files(path=path)),
+            write,
+            max_workers=max_workers,
+        )
+
+    def read_files(
+        self, paths: Iterable[str], max_workers: int = 8
+    ) -> Dict[str, bytes]:
+        """
+        Reads the content of many files in the Dataset, fetching up to `max_workers` files concurrently.
+
+        Args:
+            paths: The paths of the files to read.
+            max_workers: The maximum number of files read concurrently.
+
+        Returns: A dict from each path to the content of the file, in the order of `paths`.
         """
-        Returns: The full content of the Dataset at the current view as an Apache Arrow :class:`pa.Table`. The dataset
+        paths = list(paths)
+        content: Dict[str, bytes] = {}
+
+        def read(locator: FileLocator, stream: io.IOBase) -> None:
+            content[locator.logical_path] = stream.read()
+
+        self.client.read_files(
+            (self.file(path).locator() for path in paths),
+            read,
+            max_workers=max_workers,
+        )
+        return {path: content[path] for path in paths}
+
+    def iter_batches(
+        self,
+        columns: List[str] = None,
+        filters: List[Filter] = None,
+        on_query_stats: Callable[[QueryStats], None] = None,
+    ) -> Generator["pa.RecordBatch", None, None]:
+        """
+        Args:
+            columns: The columns to read. Defaults to all columns.
+            filters: :class:`ColumnFilter` conditions, or ``(column, operator, value)`` tuples, that the rows to read
+                must all match. Evaluated server side.
+            on_query_stats: An optional callback invoked with a :class:`QueryStats` latency breakdown of the read.
+
+        Returns: A generator over the content of the Dataset at the current view as Apache Arrow
+        :class:`pa.RecordBatch` objects, streamed so that datasets larger than memory can be processed. The dataset
         must have a schema and be tabular or this method will raise an Error.
         """
-        return self.client.read_dataset(self.locator)
+        return self.client.read_dataset_batches(
+            self.locator,
+            columns=columns,
+            filters=filters,
+            on_query_stats=on_query_stats,
+        )
 
-    def read_pandas(self) -> "pd.DataFrame":
+    def read_arrow(
+        self,
+        columns: List[str] = None,
+        filters: List[Filter] = None,
+        on_query_stats: Callable[[QueryStats], None] = None,
+    ) -> "pa.Table":
         """
-        Returns: The full content of the Dataset at the current view as a Pandas :class:`pd.DataFrame`. The dataset
+        Args:
+            columns: The columns to read. Defaults to all columns.
+            filters: :class:`ColumnFilter` conditions, or ``(column, operator, value)`` tuples, that the rows to read
+                must all match. Evaluated server side.
+            on_query_stats: An optional callback invoked with a :class:`QueryStats` latency breakdown of the read.
+
+        Returns: The content of the Dataset at the current view as an Apache Arrow :class:`pa.Table`. The dataset
         must have a schema and be tabular or this method will raise an Error.
+
+        Examples:
+            >>> ds.read_arrow(columns=["id", "date"], filters=[("date", ">=", datetime.date(2022, 1, 1))])
         """
-        return self.read_arrow().to_pandas()
+        return self.client.read_dataset(
+            self.locator,
+            columns=columns,
+            filters=filters,
+            on_query_stats=on_query_stats,
+        )
 
-    def write_pandas(self, df: "pd.DataFrame") -> None:
+    def read_pandas(
+        self,
+        columns: List[str] = None,
+        filters: List[Filter] = None,
+        on_query_stats: Callable[[QueryStats], None] = None,
+    ) -> "pd.DataFrame":
+        """
+        Args:
+            columns: The columns to read. Defaults to all columns.
+            filters: :class:`ColumnFilter` conditions, or ``(column, operator, value)`` tuples, that the rows to read
+                must all match. Evaluated server side.
+            on_query_stats: An optional callback invoked with a :class:`QueryStats` latency breakdown of the read.
+
+        Returns: The content of the Dataset at the current view as a Pandas :class:`pd.DataFrame`. The dataset
+        must have a schema and be tabular or this method will raise an Error.
+        """
+        return self.read_arrow(
+            columns=columns, filters=filters, on_query_stats=on_query_stats
+        ).to_pandas()
+
+    def write_pandas(
+        self,
+        df: "pd.DataFrame",
+        max_rows_per_file: int = None,
+        max_bytes_per_file: int = _DEFAULT_BYTES_PER_FILE,
+        partition_cols: List[str] = None,
+        max_workers: int = 4,
+    ) -> None:
         """
         Writes the content of the provided DataFrame to a new Snapshot transaction in the Dataset. Uses parquet as a
         serialization format. Updates the schema of the Dataset based on the type information of the DataFrame.
 
+        Large DataFrames are split into several parquet files, which are encoded and uploaded concurrently so that only
+        `max_workers` encoded files are held in memory at once. A DataFrame that fits in a single file is written to
+        ``dataframe.parquet``, otherwise files are named ``part-00000.parquet``, ``part-00001.parquet``, etc.
+
         Args:
             df: a Pandas :class:`pd.DataFrame`
+            max_rows_per_file: An optional maximum number of rows written to each file.
+            max_bytes_per_file: The maximum size of the rows written to each file, estimated from their size in memory.
+            partition_cols: Optional columns to partition the files by. The rows of each combination of values are
+                written under a ``col=value/`` directory, and keep the partition columns.
+            max_workers: The maximum number of files encoded and uploaded concurrently.
         """
-        with io.BytesIO() as buf:
-            df.to_parquet(buf)
-            buf.seek(0)
-            self.file("dataframe.parquet").write(buf.read(), TransactionType.SNAPSHOT)
+        rows_per_file = _rows_per_file(df, max_rows_per_file, max_bytes_per_file)
+        if not partition_cols and len(df) <= rows_per_file:
+            parts: Iterable[Tuple[str, "pd.DataFrame"]] = [("dataframe.parquet", df)]
+        else:
+            parts = _dataframe_parts(df, rows_per_file, partition_cols or [])
+
+        def write(_: int, part: Tuple[str, "pd.DataFrame"]) -> None:
+            path, frame = part
+            buf = io.BytesIO()
+            # the index is not part of the uploaded schema, and parts keep the index of their slice of the frame
+            frame.to_parquet(buf, index=False)
+            # uploaded straight from the encoding buffer, without copying it into a bytes object
+            txn.write(path, buf.getbuffer())
+
+        with self.client.start_transaction(self, TransactionType.SNAPSHOT) as txn:
+            _run_bounded(write, parts, max_workers)
         self.client.put_schema(self, pandas_to_foundry_schema(df))
 
+    def writer(
+        self,
+        txn_type: Union[str, TransactionType] = TransactionType.SNAPSHOT,
+        target_file_size: int = _DEFAULT_BYTES_PER_FILE,
+        max_workers: int = 4,
+    ) -> "DatasetWriter":
+        """
+        Opens a :class:`DatasetWriter` writing Arrow record batches to a new transaction in the Dataset.
+
+        Args:
+            txn_type: The type of transaction to open. Defaults to `TransactionType.SNAPSHOT`.
+            target_file_size: The size in bytes at which a parquet file is closed and uploaded.
+            max_workers: The maximum number of files uploaded concurrently.
+
+        Returns: A :class:`DatasetWriter`, to be used as a context manager.
+
+        Examples:
+            >>> with ds.writer() as writer:
+            ...     for batch in batches:
+            ...         writer.write(batch)
+        """
+        return DatasetWriter(self, txn_type, target_file_size, max_workers)
+
+    def write_arrow(
+        self,
+        data: Union["pa.Table", "pa.RecordBatch", Iterable["pa.RecordBatch"]],
+        target_file_size: int = _DEFAULT_BYTES_PER_FILE,
+        max_workers: int = 4,
+    ) -> None:
+        """
+        Writes Arrow data to a new Snapshot transaction in the Dataset, as parquet files of about `target_file_size`
+        bytes. Updates the schema of the Dataset based on the Arrow schema of the data.
+
+        Args:
+            data: A :class:`pa.Table`, a :class:`pa.RecordBatch` or an iterable of record batches sharing a schema,
+                such as a :class:`pa.RecordBatchReader`. Batches are consumed as they are written.
+            target_file_size: The size in bytes at which a parquet file is closed and uploaded.
+            max_workers: The maximum number of files uploaded concurrently.
+        """
+        import pyarrow as pa
+
+        batches = [data] if isinstance(data, (pa.Table, pa.RecordBatch)) else data
+        with self.writer(
+            TransactionType.SNAPSHOT, target_file_size, max_workers
+        ) as writer:
+            for batch in batches:
+                writer.write(batch)
+
     def start_transaction(
         self, txn_type: Union[str, TransactionType] = None
     ) -> "Transaction":
@@ -211,13 +512,14 @@ class Transaction:
         self.client.abort_transaction(self)
         self.status = TransactionStatus.ABORTED
 
-    def write(self, path: str, content: bytes) -> None:
+    def write(self, path: str, content: FileContent) -> None:
         """
         Writes content to a file in the transaction.
 
         Args:
             path: The path of the file to write to.
-            content: The binary content to upload.
+            content: The binary content to upload: bytes, a :class:`memoryview`, a :class:`pathlib.Path` to a local
+                file, a binary file object or an iterable of bytes. Content that is not already in memory is streamed.
         """
         file = FileLocator(
             dataset_rid=self.dataset.rid,
@@ -226,6 +528,21 @@ class Transaction:
         )
         self.client.put_file(file, content)
 
+    def upload(self, local_path: Union[str, os.PathLike], path: str = None) -> None:
+        """
+        Uploads a local file to the transaction. The file is memory-mapped rather than read into memory.
+
+        Args:
+            local_path: The path of the local file to upload.
+            path: The path of the file to write to. Defaults to the name of the local file.
+        """
+        file = FileLocator(
+            dataset_rid=self.dataset.rid,
+            end_ref=str(self.rid),
+            logical_path=path or os.path.basename(local_path),
+        )
+        self.client.upload_file(file, local_path)
+
     def __enter__(self):
         return self
 
@@ -248,39 +565,221 @@ class Transaction:
         return f"Transaction(rid='{self.rid}', dataset_rid='{self.dataset.locator.rid}', type={self.txn_type}, status={self.status})"
 
 
+class DatasetWriter:
+    """
+    Writes Arrow record batches to a new transaction in a Dataset as parquet files. Batches are appended to the current
+    file until it reaches `target_file_size` bytes, when it is closed and uploaded in the background while the next
+    file fills, with at most `max_workers` uploads in flight. Closing the writer waits for the uploads, commits the
+    transaction and updates the schema of the Dataset from the Arrow schema of the batches. Exiting the writer with an
+    error aborts the transaction.
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset,
+        txn_type: Union[str, TransactionType] = TransactionType.SNAPSHOT,
+        target_file_size: int = _DEFAULT_BYTES_PER_FILE,
+        max_workers: int = 4,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.dataset = dataset
+        self.target_file_size = target_file_size
+        self.max_workers = max_workers
+        self.schema: Optional["pa.Schema"] = None
+        self.files_written = 0
+        self._txn = dataset.start_transaction(txn_type)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._uploads: Set[Future] = set()
+        self._sink: Optional["pa.BufferOutputStream"] = None
+        self._writer: Optional["pq.ParquetWriter"] = None
+
+    def write(self, data: Union["pa.RecordBatch", "pa.Table"]) -> None:
+        """
+        Appends a record batch or table to the current file, uploading it once it reaches the target size.
+
+        Args:
+            data: A :class:`pa.RecordBatch` or :class:`pa.Table` with the same schema as previously written data.
+        """
+        import pyarrow as pa
+
+        if self.schema is None:
+            self.schema = data.schema
+        for batch in _size_bounded_batches(data, self.target_file_size):
+            self._open().write_table(pa.Table.from_batches([batch], self.schema))
+            if self._sink.tell() >= self.target_file_size:  # type: ignore
+                self._roll()
+
+    def close(self) -> None:
+        """
+        Uploads the last file, waits for all uploads, then commits the transaction and updates the schema.
+
+        Raises:
+            TransactionAbortedError: If the last file could not be written, an upload or the commit failed, in which
+                case the transaction is aborted.
+        """
+        try:
+            if self._writer is not None or (
+                self.schema is not None and self.files_written == 0
+            ):
+                # an empty file still records the schema of an empty table
+                self._open()
+                self._roll()
+            for upload in wait(self._uploads).done:
+                upload.result()
+            self._executor.shutdown()
+            self._txn.commit()
+        except BaseException as exc:
+            self.abort()
+            raise TransactionAbortedError(self._txn) from exc
+        if self.schema is not None:
+            self.dataset.client.put_schema(
+                self.dataset, arrow_to_foundry_schema(self.schema)
+            )
+
+    def abort(self) -> None:
+        """Discards pending uploads and aborts the transaction."""
+        for upload in self._uploads:
+            upload.cancel()
+        self._executor.shutdown()
+        self._txn.abort()
+
+    def _open(self) -> "pq.ParquetWriter":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            self._sink = pa.BufferOutputStream()
+            self._writer = pq.ParquetWriter(self._sink, self.schema)
+        return self._writer
+
+    def _roll(self) -> None:
+        self._writer.close()  # type: ignore
+        # uploaded straight from the arrow buffer, without copying it into a bytes object
+        content = memoryview(self._sink.getvalue())  # type: ignore
+        path = f"part-{self.files_written:05d}.parquet"
+        self._writer = self._sink = None
+        self.files_written += 1
+        if len(self._uploads) >= self.max_workers:
+            done, self._uploads = wait(self._uploads, return_when=FIRST_COMPLETED)
+            for upload in done:
+                upload.result()
+        self._uploads.add(self._executor.submit(self._txn.write, path, content))
+
+    def __enter__(self) -> "DatasetWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_val is not None:
+            self.abort()
+            raise TransactionAbortedError(self._txn) from exc_val
+        self.close()
+
+
 class File:
+    """
+    A File within a Dataset. The modification time and transaction rid may be given in their serialized form, as
+    listed by the catalog, in which case they are only parsed when accessed.
+    """
+
+    __slots__ = (
+        "dataset",
+        "path",
+        "length",
+        "client",
+        "_modified",
+        "_transaction_rid",
+    )
+
     def __init__(
         self,
         dataset: Dataset,
         path: str,
-        modified: datetime = None,
-        transaction_rid: ResourceIdentifier = None,
+        modified: Union[datetime, str] = None,
+        transaction_rid: Union[ResourceIdentifier, str] = None,
         length: int = None,
         client: "DatasetsClient" = None,
     ):
         self.dataset = dataset
         self.path = path
-        self.modified = modified
-        self.transaction_rid = transaction_rid
+        self._modified = modified
+        self._transaction_rid = transaction_rid
         self.length = length
         self.client = client or DatasetsClient(DatasetServices(context()))
 
+    @property
+    def modified(self) -> Optional[datetime]:
+        if isinstance(self._modified, str):
+            self._modified = isoparse(self._modified)
+        return self._modified
+
+    @modified.setter
+    def modified(self, modified: Union[datetime, str, None]):
+        self._modified = modified
+
+    @property
+    def transaction_rid(self) -> Optional[ResourceIdentifier]:
+        if isinstance(self._transaction_rid, str):
+            self._transaction_rid = ResourceIdentifier.from_string(
+                self._transaction_rid
+            )
+        return self._transaction_rid
+
+    @transaction_rid.setter
+    def transaction_rid(self, transaction_rid: Union[ResourceIdentifier, str, None]):
+        self._transaction_rid = transaction_rid
+
     def locator(self):
         return FileLocator(
             dataset_rid=self.dataset.rid,
-            end_ref=str(self.transaction_rid)
-            if self.transaction_rid
+            # the rid is formatted back to the same string, so it need not be parsed
+            end_ref=str(self._transaction_rid)
+            if self._transaction_rid
             else self.dataset.branch,
             logical_path=self.path,
         )
 
-    def read(self) -> io.IOBase:
-        """Returns: A binary stream of the file content."""
-        return self.client.read_file(self.locator()).read()
+    def read(self) -> bytes:
+        """Returns: The full content of the file. Use :meth:`open` or :meth:`iter_chunks` to stream large files."""
+        with closing(self.client.read_file(self.locator())) as stream:
+            return stream.read()
+
+    def open(
+        self, seekable: bool = False, buffer_size: int = 1024 * 1024
+    ) -> io.BufferedReader:
+        """
+        Opens the file for streaming reads.
+
+        Args:
+            seekable: If True, the returned reader is seekable and fetches each buffer with an HTTP Range request, so
+                parts of the file (e.g. parquet footers and row groups) can be read without downloading all of it.
+                Otherwise the file is streamed in a single request.
+            buffer_size: The size of the read buffer.
+
+        Returns: A buffered binary reader of the file content.
+        """
+        return self.client.open_file(
+            self.locator(), seekable=seekable, size=self.length, buffer_size=buffer_size
+        )
+
+    def iter_chunks(
+        self, chunk_size: int = 1024 * 1024
+    ) -> Generator[bytes, None, None]:
+        """
+        Streams the file content. The response is closed once the generator is exhausted or closed, so a consumer that
+        stops early should close it, e.g. with :func:`contextlib.closing`, rather than wait for it to be collected.
+
+        Args:
+            chunk_size: The maximum size of each chunk.
+
+        Returns: A generator over chunks of the file content.
+        """
+        with self.open(buffer_size=chunk_size) as file:
+            yield from iter(lambda: file.read(chunk_size), b"")
 
     def write(
         self,
-        content: bytes,
+        content: FileContent,
         txn_type: Union[str, TransactionType] = TransactionType.UPDATE,
     ):
         """
@@ -288,7 +787,8 @@ class File:
         the view on the parent :class:`Dataset` object.
 
         Args:
-            content: Binary content to upload.
+            content: Binary content to upload: bytes, a :class:`memoryview`, a :class:`pathlib.Path` to a local file, a
+                binary file object or an iterable of bytes. Content that is not already in memory is streamed.
             txn_type: Transaction Type, Defaults to `TransactionType.UPDATE`.
         """
         with self.client.start_transaction(
@@ -16,9 +16,10 @@ from typing import Tuple
 
 from palantir.core import context
 from palantir.core.types import PalantirContext, ResourceIdentifier
+from palantir.datasets.cache import FileCache
 from palantir.datasets.client import DatasetsClient, DatasetServices
 from palantir.datasets.core import Dataset
-from palantir.datasets.types import DatasetLocator
+from palantir.datasets.types import DatasetLocator, QueryConfig
 
 
 def dataset(
@@ -27,6 +28,8 @@ def dataset(
     transaction_range: Tuple[str, str] = None,
     create: bool = False,
     ctx: PalantirContext = None,
+    file_cache: FileCache = None,
+    query_config: QueryConfig = None,
 ) -> "Dataset":
     """
     Constructs a new Dataset object from the provided reference.
@@ -37,6 +40,8 @@ def dataset(
         transaction_range: A tuple containing a start and end transaction rid.
         create: Whether to create the Dataset if it does not already exist.
         ctx: An optional :class:`PalantirContext` (see :func:`palantir.core.context`) to override environment defaults.
+        file_cache: An optional :class:`FileCache` serving re-reads of files in committed transactions from local disk.
+        query_config: An optional :class:`QueryConfig` setting the timeout and status polling of dataset reads.
 
     Returns: A :class:`Dataset` object resolved to the view at the specified transaction range or at the latest
     transaction range at the time of initialization.
@@ -46,7 +51,11 @@ def dataset(
 
         >>> dataset("ri.foundry.main.dataset.3bb94822-d16f-4094-9834-f79a61a29859")
     """
-    client = DatasetsClient(DatasetServices(ctx or context()))
+    client = DatasetsClient(
+        DatasetServices(ctx or context()),
+        file_cache=file_cache,
+        query_config=query_config,
+    )
     rid = client.get_dataset(dataset_ref)
     branch_id = branch or "master"
     if not rid:
@@ -0,0 +1,244 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+    cast,
+)
+
+import requests
+
+if TYPE_CHECKING:
+    from urllib3.response import HTTPResponse
+
+
+FileContent = Union[
+    bytes, bytearray, memoryview, os.PathLike, BinaryIO, Iterable[bytes]
+]
+"""
+Content accepted by file uploads: an in-memory bytes-like object, a :class:`os.PathLike` local file path, a binary
+file-like object or an iterable of bytes.
+"""
+
+
+def _chunk(content, chunk_size):
+    for offset in range(0, len(content), chunk_size):
+        yield content[offset : offset + chunk_size]
+
+
+def _read_blocks(file: BinaryIO, block_size: int) -> Generator[bytes, None, None]:
+    while True:
+        block = file.read(block_size)
+        if not block:
+            return
+        while len(block) < block_size:
+            # raw streams may return short reads before the end of the stream
+            more = file.read(block_size - len(block))
+            if not more:
+                break
+            block += more
+        yield block
+
+
+def _rechunk(
+    iterable: Iterable[bytes], chunk_size: int
+) -> Generator[bytes, None, None]:
+    buffer = bytearray()
+    for data in iterable:
+        buffer += data
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def _iter_parts(content: FileContent, part_size: int) -> Iterator[Any]:
+    """
+    Lazily splits upload content into parts of at most `part_size` bytes. In-memory content is sliced without
+    copying, other content is read one part at a time so that only the parts being uploaded are held in memory.
+    """
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return _chunk(memoryview(content).cast("B"), part_size)
+    if hasattr(content, "read"):
+        return _read_blocks(content, part_size)  # type: ignore
+    if isinstance(content, str):
+        raise TypeError(
+            "str content is not supported, encode it to bytes or pass a pathlib.Path to upload a local file"
+        )
+    return _rechunk(content, part_size)
+
+
+@contextmanager
+def _map_file(path: Union[str, os.PathLike]) -> Generator[memoryview, None, None]:
+    """Memory-maps a local file read-only, exposing its content as a memoryview that can be sliced without copying."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # empty files cannot be mapped
+            yield memoryview(b"")
+            return
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            view.release()
+            try:
+                mapped.close()
+            except BufferError:
+                # slices of the mapping are still referenced, it is unmapped once they are garbage collected
+                pass
+
+
+class _CountingReader(io.RawIOBase):
+    """Wraps a binary stream, counting the bytes read from it."""
+
+    def __init__(self, stream: io.IOBase):
+        super().__init__()
+        # responses and cached files are both raw or buffered streams, which read into buffers
+        self._stream = cast(io.RawIOBase, stream)
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        read = self._stream.readinto(buffer)
+        self.bytes_read += read or 0
+        return read
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            super().close()
+
+
+class _RangedReader(io.RawIOBase):
+    """
+    A seekable reader over a remote file which fetches the bytes of each read with an HTTP Range request, so that
+    parts of a file can be read without downloading all of it.
+    """
+
+    def __init__(
+        self,
+        read_range: Callable[[int, Optional[int]], "HTTPResponse"],
+        size: Optional[int] = None,
+    ):
+        super().__init__()
+        self._read_range = read_range
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+        self._position = position
+        return position
+
+    @property
+    def size(self) -> int:
+        if self._size is None:
+            stream = self._open(0, 0)
+            if stream is None:
+                # even the first byte is past the end of the file, which is empty
+                self._size = 0
+            else:
+                try:
+                    headers = stream.headers
+                    content_range = headers.get("Content-Range")
+                    self._size = int(
+                        content_range.rsplit("/", 1)[1]
+                        if content_range
+                        else headers["Content-Length"]
+                    )
+                finally:
+                    stream.close()
+        return self._size
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        if not view.nbytes or (self._size is not None and self._position >= self._size):
+            return 0
+        stream = self._open(self._position, self._position + view.nbytes - 1)
+        if stream is None:
+            return 0
+        read = 0
+        try:
+            while read < view.nbytes:
+                count = stream.readinto(view[read:])
+                if not count:
+                    break
+                read += count
+        finally:
+            stream.close()
+        self._position += read
+        return read
+
+    def readall(self) -> bytes:
+        stream = self._open(self._position, None)
+        if stream is None:
+            return b""
+        try:
+            data = stream.read()
+        finally:
+            stream.close()
+        self._position += len(data)
+        return data
+
+    def _open(self, start: int, end: Optional[int]) -> Optional["HTTPResponse"]:
+        try:
+            stream = self._read_range(start, end)
+        except requests.exceptions.HTTPError as error:
+            if error.response is not None and error.response.status_code == 416:
+                # the range starts past the end of the file
+                return None
+            raise
+        if getattr(stream, "status", None) == 200 and start > 0:
+            # the range was ignored and the whole file returned, skip to the requested offset
+            while start > 0:
+                skipped = len(stream.read(min(start, io.DEFAULT_BUFFER_SIZE)))
+                if not skipped:
+                    break
+                start -= skipped
+        return stream
@@ -0,0 +1,101 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import math
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional, Union, Tuple, cast
+
+from palantir.datasets.types import DatasetLocator, ColumnFilter, FilterOperator
+
+Filter = Union[ColumnFilter, Tuple[str, Union[FilterOperator, str], Any]]
+
+
+def quote_identifier(name: str) -> str:
+    """Quotes a column name as an ANSI SQL delimited identifier."""
+    if not isinstance(name, str) or not name:
+        raise ValueError(f"invalid column name {name!r}")
+    return '"' + name.replace('"', '""') + '"'
+
+
+def to_literal(value: Any) -> str:
+    """Renders a Python value as an ANSI SQL literal, escaping strings."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError(f"cannot filter on non-finite value {value}")
+        return repr(value)
+    if isinstance(value, Decimal):
+        if not value.is_finite():
+            raise ValueError(f"cannot filter on non-finite value {value}")
+        return str(value)
+    # datetime is a subclass of date
+    if isinstance(value, datetime):
+        return f"TIMESTAMP '{value.isoformat(sep=' ')}'"
+    if isinstance(value, date):
+        return f"DATE '{value.isoformat()}'"
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    raise TypeError(f"unsupported filter value type {type(value).__name__}")
+
+
+def to_condition(column_filter: Filter) -> str:
+    """Renders a filter as an ANSI SQL boolean expression."""
+    if not isinstance(column_filter, ColumnFilter):
+        name, op, *value = column_filter
+        # an operator string is converted to its FilterOperator by ColumnFilter
+        column_filter = ColumnFilter(name, cast(FilterOperator, op), *value)
+    column = quote_identifier(column_filter.column)
+    operator = column_filter.operator
+    if operator in (FilterOperator.IS_NULL, FilterOperator.IS_NOT_NULL):
+        return f"{column} {operator.value}"
+    if column_filter.value is None:
+        raise ValueError(
+            f"filter on column '{column_filter.column}' compares to None, use FilterOperator.IS_NULL instead"
+        )
+    if operator == FilterOperator.IN:
+        if isinstance(column_filter.value, (str, bytes)):
+            raise TypeError("the value of an IN filter must be an iterable of values")
+        values = [to_literal(value) for value in column_filter.value]
+        if not values:
+            raise ValueError(
+                f"IN filter on column '{column_filter.column}' has no values"
+            )
+        return f"{column} IN ({', '.join(values)})"
+    return f"{column} {operator.value} {to_literal(column_filter.value)}"
+
+
+def select_query(
+    locator: DatasetLocator,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Filter]] = None,
+) -> str:
+    """
+    Builds the query reading a dataset view, selecting only `columns` if provided and the rows matching all of
+    `filters`.
+    """
+    projection = (
+        ", ".join(quote_identifier(column) for column in columns) if columns else "*"
+    )
+    query = f'SELECT {projection} FROM "{locator.end_transaction_rid}@{locator.branch_id}"."{locator.rid}"'
+    if filters:
+        query += " WHERE " + " AND ".join(
+            to_condition(column_filter) for column_filter in filters
+        )
+    return query
@@ -0,0 +1,430 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""asyncio counterparts of the dataset service stubs, sharing their conjure types."""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from conjure_python_client import ConjureDecoder, ConjureEncoder, OptionalTypeWrapper
+
+from palantir.core.aio import AsyncService
+from palantir.datasets.rpc.catalog import (
+    CloseTransactionRequest,
+    FileResourcesPage,
+    StartTransactionRequest,
+    Transaction,
+    TransactionRange,
+    TransactionType,
+)
+from palantir.datasets.rpc.data_proxy import (
+    ConcatenationTaskStatusReport,
+    StartConcatenationTaskRequest,
+    StartConcatenationTaskResponse,
+)
+from palantir.datasets.rpc.path import DecoratedResource
+from palantir.datasets.rpc.sql import (
+    SqlExecuteRequest,
+    SqlExecuteResponse,
+    SqlGetStatusResponse,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class AsyncCatalogService(AsyncService):
+    async def get_dataset_view_range2(
+        self,
+        auth_header: str,
+        dataset_rid: str,
+        end_ref: str,
+        include_open_exclusive_transaction: Optional[bool] = None,
+        start_transaction_rid: Optional[str] = None,
+    ) -> Optional[TransactionRange]:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _params: Dict[str, Any] = {
+            "startTransactionRid": start_transaction_rid,
+            "includeOpenExclusiveTransaction": include_open_exclusive_transaction,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "datasetRid": dataset_rid,
+            "endRef": end_ref,
+        }
+
+        _path = "/catalog/datasets/{datasetRid}/views2/{endRef}/range"
+        _path = _path.format(**_path_params)
+
+        async with await self._request(
+            "GET", self._uri + _path, params=_params, headers=_headers
+        ) as _response:
+            if _response.status == 204:
+                return None
+            return ConjureDecoder().decode(
+                await _response.json(), OptionalTypeWrapper[TransactionRange]
+            )
+
+    async def get_dataset_view_files2(
+        self,
+        auth_header: str,
+        dataset_rid: str,
+        end_ref: str,
+        page_size: int,
+        exclude_hidden_files: Optional[bool] = None,
+        include_open_exclusive_transaction: Optional[bool] = None,
+        logical_path: Optional[str] = None,
+        page_start_logical_path: Optional[str] = None,
+        start_transaction_rid: Optional[str] = None,
+    ) -> FileResourcesPage:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _params: Dict[str, Any] = {
+            "startTransactionRid": start_transaction_rid,
+            "logicalPath": logical_path,
+            "pageSize": page_size,
+            "pageStartLogicalPath": page_start_logical_path,
+            "includeOpenExclusiveTransaction": include_open_exclusive_transaction,
+            "excludeHiddenFiles": exclude_hidden_files,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "datasetRid": dataset_rid,
+            "endRef": end_ref,
+        }
+
+        _path = "/catalog/datasets/{datasetRid}/views2/{endRef}/files"
+        _path = _path.format(**_path_params)
+
+        async with await self._request(
+            "GET", self._uri + _path, params=_params, headers=_headers
+        ) as _response:
+            return ConjureDecoder().decode(await _response.json(), FileResourcesPage)
+
+    async def start_transaction(
+        self, auth_header: str, dataset_rid: str, request: StartTransactionRequest
+    ) -> Transaction:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "datasetRid": dataset_rid,
+        }
+
+        _json: Any = ConjureEncoder().default(request)
+
+        _path = "/catalog/datasets/{datasetRid}/transactions"
+        _path = _path.format(**_path_params)
+
+        async with await self._request(
+            "POST", self._uri + _path, headers=_headers, json=_json
+        ) as _response:
+            return ConjureDecoder().decode(await _response.json(), Transaction)
+
+    async def set_transaction_type(
+        self,
+        auth_header: str,
+        dataset_rid: str,
+        transaction_rid: str,
+        txn_type: TransactionType,
+    ) -> Transaction:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "datasetRid": dataset_rid,
+            "transactionRid": transaction_rid,
+        }
+
+        _json: Any = ConjureEncoder().default(txn_type)
+
+        _path = "/catalog/datasets/{datasetRid}/transactions/{transactionRid}"
+        _path = _path.format(**_path_params)
+
+        async with await self._request(
+            "POST", self._uri + _path, headers=_headers, json=_json
+        ) as _response:
+            return ConjureDecoder().decode(await _response.json(), Transaction)
+
+    async def commit_transaction(
+        self,
+        auth_header: str,
+        dataset_rid: str,
+        transaction_rid: str,
+        request: CloseTransactionRequest,
+    ) -> None:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "datasetRid": dataset_rid,
+            "transactionRid": transaction_rid,
+        }
+
+        _json: Any = ConjureEncoder().default(request)
+
+        _path = "/catalog/datasets/{datasetRid}/transactions/{transactionRid}/commit"
+        _path = _path.format(**_path_params)
+
+        (
+            await self._request("POST", self._uri + _path, headers=_headers, json=_json)
+        ).release()
+
+    async def abort_transaction(
+        self,
+        auth_header: str,
+        dataset_rid: str,
+        transaction_rid: str,
+        request: CloseTransactionRequest,
+    ) -> None:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "datasetRid": dataset_rid,
+            "transactionRid": transaction_rid,
+        }
+
+        _json: Any = ConjureEncoder().default(request)
+
+        _path = "/catalog/datasets/{datasetRid}/transactions/{transactionRid}/abortWithMetadata"
+        _path = _path.format(**_path_params)
+
+        (
+            await self._request("POST", self._uri + _path, headers=_headers, json=_json)
+        ).release()
+
+
+class AsyncDataProxyService(AsyncService):
+    async def get_file_in_view(
+        self,
+        auth_header: str,
+        dataset_rid: str,
+        end_ref: str,
+        logical_path: str,
+        start_transaction_rid: Optional[str] = None,
+    ) -> "aiohttp.ClientResponse":
+        """Returns the response streaming the file content, which the caller must read or release."""
+        _headers: Dict[str, Any] = {
+            "Accept": "application/octet-stream",
+            "Authorization": auth_header,
+        }
+
+        _params: Dict[str, Any] = {
+            "startTransactionRid": start_transaction_rid,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "datasetRid": dataset_rid,
+            "endRef": end_ref,
+            "logicalPath": logical_path,
+        }
+
+        _path = "/dataproxy/datasets/{datasetRid}/views/{endRef}/{logicalPath}"
+        _path = _path.format(**_path_params)
+
+        return await self._request(
+            "GET", self._uri + _path, params=_params, headers=_headers
+        )
+
+    async def put_file(
+        self,
+        auth_header: str,
+        dataset_rid: str,
+        file_data: Any,
+        logical_path: str,
+        transaction_rid: str,
+        overwrite: Optional[bool] = None,
+    ) -> None:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Content-Type": "application/octet-stream",
+            "Authorization": auth_header,
+        }
+
+        _params: Dict[str, Any] = {
+            "logicalPath": logical_path,
+            "overwrite": overwrite,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "datasetRid": dataset_rid,
+            "transactionRid": transaction_rid,
+        }
+        _path = "/dataproxy/datasets/{datasetRid}/transactions/{transactionRid}/putFile"
+        _path = _path.format(**_path_params)
+
+        (
+            await self._request(
+                "POST",
+                self._uri + _path,
+                params=_params,
+                headers=_headers,
+                data=file_data,
+            )
+        ).release()
+
+
+class AsyncDataProxyConcatenationService(AsyncService):
+    async def start_concatenation_task(
+        self,
+        auth_header: str,
+        dataset_rid: str,
+        request: StartConcatenationTaskRequest,
+        transaction_rid: str,
+    ) -> StartConcatenationTaskResponse:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "datasetRid": dataset_rid,
+            "transactionRid": transaction_rid,
+        }
+
+        _json: Any = ConjureEncoder().default(request)
+
+        _path = "/concatenation-tasks/datasets/{datasetRid}/transactions/{transactionRid}/start"
+        _path = _path.format(**_path_params)
+
+        async with await self._request(
+            "POST", self._uri + _path, headers=_headers, json=_json
+        ) as _response:
+            return ConjureDecoder().decode(
+                await _response.json(), StartConcatenationTaskResponse
+            )
+
+    async def get_concatenation_task_status(
+        self, auth_header: str, concatenation_task_id: str
+    ) -> ConcatenationTaskStatusReport:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "concatenationTaskId": concatenation_task_id,
+        }
+
+        _path = "/concatenation-tasks/tasks/{concatenationTaskId}/status-report"
+        _path = _path.format(**_path_params)
+
+        async with await self._request(
+            "GET", self._uri + _path, headers=_headers
+        ) as _response:
+            return ConjureDecoder().decode(
+                await _response.json(), ConcatenationTaskStatusReport
+            )
+
+
+class AsyncPathService(AsyncService):
+    async def get_resource_by_path(
+        self, auth_header: str, path: Optional[str] = None
+    ) -> Optional[DecoratedResource]:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _params: Dict[str, Any] = {
+            "path": path,
+            "decoration": [],
+        }
+
+        _path = "/resources"
+
+        async with await self._request(
+            "GET", self._uri + _path, params=_params, headers=_headers
+        ) as _response:
+            if _response.status == 204:
+                return None
+            return ConjureDecoder().decode(
+                await _response.json(), OptionalTypeWrapper[DecoratedResource]
+            )
+
+
+class AsyncSqlQueryService(AsyncService):
+    async def execute(
+        self, auth_header: str, request: SqlExecuteRequest
+    ) -> SqlExecuteResponse:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _json: Any = ConjureEncoder().default(request)
+
+        _path = "/queries/execute"
+
+        async with await self._request(
+            "POST", self._uri + _path, headers=_headers, json=_json
+        ) as _response:
+            return ConjureDecoder().decode(await _response.json(), SqlExecuteResponse)
+
+    async def get_status(self, auth_header: str, query_id: str) -> SqlGetStatusResponse:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "queryId": query_id,
+        }
+
+        _path = "/queries/{queryId}/status"
+        _path = _path.format(**_path_params)
+
+        async with await self._request(
+            "GET", self._uri + _path, headers=_headers
+        ) as _response:
+            return ConjureDecoder().decode(await _response.json(), SqlGetStatusResponse)
+
+    async def get_results(
+        self, auth_header: str, query_id: str
+    ) -> "aiohttp.ClientResponse":
+        """Returns the response streaming the query results, which the caller must read or release."""
+        _headers: Dict[str, Any] = {
+            "Accept": "application/octet-stream",
+            "Authorization": auth_header,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "queryId": query_id,
+        }
+
+        _path = "/queries/{queryId}/results"
+        _path = _path.format(**_path_params)
+
+        return await self._request("GET", self._uri + _path, headers=_headers)
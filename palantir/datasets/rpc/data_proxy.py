@@ -35,12 +35,15 @@ class DataProxyService(Service):
         end_ref: str,
         logical_path: str,
         start_transaction_rid: str = None,
+        byte_range: str = None,
     ) -> io.IOBase:
 
         _headers: Dict[str, Any] = {
             "Accept": "application/octet-stream",
             "Authorization": auth_header,
         }
+        if byte_range is not None:
+            _headers["Range"] = byte_range
 
         _params: Dict[str, Any] = {
             "startTransactionRid": start_transaction_rid,
@@ -60,7 +60,7 @@ class SchemaService(Service):
         auth_header: str,
         dataset_rid: str,
         branch_id: str,
-        end_transaction_rid: str,
+        end_transaction_rid: Optional[str],
         version_rid: Optional[str] = None,
     ) -> "Optional[VersionedFoundrySchema]":
         _headers: Mapping[str, Any] = {
@@ -79,36 +79,9 @@ class SchemaService(Service):
             "GET", self._uri + _path, params=_params, headers=_headers
         )
 
-        _decoder = ConjureDecoder()
-        return (
-            None
-            if _response.status_code == 204
-            else VersionedFoundrySchema(
-                branch_id=_response.json().get("branchId"),
-                transaction_rid=_response.json().get("transactionRid"),
-                version_id=_response.json().get("versionId"),
-                schema=FoundrySchema(
-                    field_schema_list=_decoder.decode(
-                        _response.json().get("schema").get("fieldSchemaList"),
-                        List[FoundryFieldSchema],
-                    ),
-                    primary_key=_decoder.decode(
-                        _response.json().get("schema").get("primaryKey"),
-                        OptionalTypeWrapper[PrimaryKey],
-                    ),
-                    data_frame_reader_class=_response.json()
-                    .get("schema")
-                    .get("dataFrameReaderClass"),
-                    custom_metadata=_response.json()
-                    .get("schema")
-                    .get("customMetadata"),
-                ),
-                attribution=_decoder.decode(
-                    _response.json().get("attribution"),
-                    Attribution,
-                ),
-            )
-        )
+        if _response.status_code == 204:
+            return None
+        return ConjureDecoder().decode(_response.json(), VersionedFoundrySchema)
 
 
 class VersionedFoundrySchema(ConjureBeanType):
@@ -179,7 +152,7 @@ class FoundrySchema(ConjureBeanType):
                 "dataFrameReaderClass", str
             ),
             "custom_metadata": ConjureFieldDefinition(
-                "customMetadata", DictType(str, Any)  # type: ignore
+                "customMetadata", DictType(str, object)
             ),
         }
 
@@ -187,7 +160,7 @@ class FoundrySchema(ConjureBeanType):
         self,
         field_schema_list: "List[FoundryFieldSchema]",
         data_frame_reader_class: str,
-        custom_metadata: Dict[str, Any] = None,
+        custom_metadata: Optional[Dict[str, Any]] = None,
         primary_key: "Optional[PrimaryKey]" = None,
     ):
         self._field_schema_list = field_schema_list
@@ -204,7 +177,7 @@ class FoundrySchema(ConjureBeanType):
         return self._data_frame_reader_class
 
     @property
-    def custom_metadata(self) -> Dict[str, Any]:
+    def custom_metadata(self) -> Optional[Dict[str, Any]]:
         return self._custom_metadata
 
     @property
@@ -233,14 +206,14 @@ class FoundryFieldSchema(ConjureBeanType):
     @classmethod
     def _fields(cls) -> Dict[str, ConjureFieldDefinition]:
         return {
-            "type": ConjureFieldDefinition("type", FoundryFieldType),
+            "field_type": ConjureFieldDefinition("type", FoundryFieldType),
             "name": ConjureFieldDefinition("name", OptionalTypeWrapper[str]),
             "nullable": ConjureFieldDefinition("nullable", OptionalTypeWrapper[bool]),
             "user_defined_type_class": ConjureFieldDefinition(
                 "userDefinedTypeClass", OptionalTypeWrapper[str]
             ),
             "custom_metadata": ConjureFieldDefinition(
-                "customMetadata", DictType(str, Any)  # type: ignore
+                "customMetadata", DictType(str, object)
             ),
             "array_subtype": ConjureFieldDefinition(
                 "arraySubtype",
@@ -279,15 +252,15 @@ class FoundryFieldSchema(ConjureBeanType):
         self,
         custom_metadata: Dict[str, Any],
         field_type: "FoundryFieldType",
-        array_subtype: "FoundryFieldSchema" = None,
-        map_key_type: "FoundryFieldSchema" = None,
-        map_value_type: "FoundryFieldSchema" = None,
-        name: str = None,
-        nullable: bool = None,
-        precision: int = None,
-        scale: int = None,
-        sub_schemas: "List[FoundryFieldSchema]" = None,
-        user_defined_type_class: str = None,
+        array_subtype: "Optional[FoundryFieldSchema]" = None,
+        map_key_type: "Optional[FoundryFieldSchema]" = None,
+        map_value_type: "Optional[FoundryFieldSchema]" = None,
+        name: Optional[str] = None,
+        nullable: Optional[bool] = None,
+        precision: Optional[int] = None,
+        scale: Optional[int] = None,
+        sub_schemas: "Optional[List[FoundryFieldSchema]]" = None,
+        user_defined_type_class: Optional[str] = None,
     ):
         self._type = field_type
         self._name = name
@@ -305,6 +278,10 @@ class FoundryFieldSchema(ConjureBeanType):
     def type(self) -> "FoundryFieldType":
         return self._type
 
+    @property
+    def field_type(self) -> "FoundryFieldType":
+        return self._type
+
     @property
     def name(self) -> Optional[str]:
         return self._name
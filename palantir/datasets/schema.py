@@ -12,77 +12,259 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from datetime import date
-from typing import TYPE_CHECKING, Any, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type
 
+from .rpc.schema import (
+    FoundryFieldSchema,
+    FoundryFieldType,
+    FoundrySchema as ConjureFoundrySchema,
+)
 from .types import (
     ArrayFieldType,
+    BinaryFieldType,
     BooleanFieldType,
     ByteFieldType,
     Field,
     FileFormat,
     DateFieldType,
+    DecimalFieldType,
     DoubleFieldType,
+    FieldType,
     FloatFieldType,
     FoundrySchema,
     IntegerFieldType,
     LongFieldType,
+    MapFieldType,
     ShortFieldType,
     StringFieldType,
+    StructFieldType,
     TimestampFieldType,
 )
 
 if TYPE_CHECKING:
     import numpy as np
     import pandas as pd
+    import pyarrow as pa
 
 
 def pandas_to_foundry_schema(df: "pd.DataFrame") -> FoundrySchema:
+    import pandas as pd
+
     return FoundrySchema(
-        fields=[_get_field(column, df[column]) for column in df.columns],
+        fields=[
+            # only the values of object columns are needed, the others are typed from their dtype
+            _get_field(
+                column,
+                df.iloc[:, idx] if pd.api.types.is_object_dtype(dtype) else dtype,
+            )
+            for idx, (column, dtype) in enumerate(df.dtypes.items())
+        ],
         file_format=FileFormat.PARQUET,
     )
 
 
+def arrow_to_foundry_schema(schema: "pa.Schema") -> FoundrySchema:
+    """
+    Derives a :class:`FoundrySchema` from an Arrow schema alone, without inspecting any data. Nested types are
+    converted recursively, and unsigned integers are widened to the signed type holding all their values as Spark
+    does when reading parquet.
+    """
+    return FoundrySchema(
+        fields=[_get_arrow_field(field) for field in schema],
+        file_format=FileFormat.PARQUET,
+    )
+
+
+def _get_arrow_field(field: "pa.Field") -> Field:
+    return Field(field.name, _get_arrow_field_type(field.type), field.nullable)
+
+
+def _get_arrow_field_type(  # pylint: disable=too-many-return-statements,too-many-branches
+    arrow_type: "pa.DataType",
+) -> FieldType:
+    import pyarrow as pa
+
+    if isinstance(arrow_type, pa.ExtensionType):
+        return _get_arrow_field_type(arrow_type.storage_type)
+    if pa.types.is_dictionary(arrow_type):
+        return _get_arrow_field_type(arrow_type.value_type)
+    if pa.types.is_boolean(arrow_type):
+        return BooleanFieldType()
+    if pa.types.is_int8(arrow_type):
+        return ByteFieldType()
+    if pa.types.is_int16(arrow_type) or pa.types.is_uint8(arrow_type):
+        return ShortFieldType()
+    if pa.types.is_int32(arrow_type) or pa.types.is_uint16(arrow_type):
+        return IntegerFieldType()
+    if pa.types.is_int64(arrow_type) or pa.types.is_uint32(arrow_type):
+        return LongFieldType()
+    if pa.types.is_uint64(arrow_type):
+        return DecimalFieldType(precision=20, scale=0)
+    if pa.types.is_float32(arrow_type):
+        return FloatFieldType()
+    if pa.types.is_float64(arrow_type):
+        return DoubleFieldType()
+    if pa.types.is_decimal(arrow_type):
+        return DecimalFieldType(precision=arrow_type.precision, scale=arrow_type.scale)
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return StringFieldType()
+    if (
+        pa.types.is_binary(arrow_type)
+        or pa.types.is_large_binary(arrow_type)
+        or pa.types.is_fixed_size_binary(arrow_type)
+    ):
+        return BinaryFieldType()
+    if pa.types.is_date(arrow_type):
+        return DateFieldType()
+    if pa.types.is_timestamp(arrow_type):
+        return TimestampFieldType()
+    if pa.types.is_map(arrow_type):
+        return MapFieldType(
+            key_type=_get_arrow_field_type(arrow_type.key_type),
+            value_type=_get_arrow_field_type(arrow_type.item_type),
+        )
+    if (
+        pa.types.is_list(arrow_type)
+        or pa.types.is_large_list(arrow_type)
+        or pa.types.is_fixed_size_list(arrow_type)
+    ):
+        return ArrayFieldType(element_type=_get_arrow_field_type(arrow_type.value_type))
+    if pa.types.is_struct(arrow_type):
+        return StructFieldType(fields=[_get_arrow_field(child) for child in arrow_type])
+    raise ValueError(f"Unsupported arrow type: {arrow_type}")
+
+
+_SAMPLE_SIZE = 1000
+
+_INFERRED_FIELD_TYPES: Dict[str, Type[FieldType]] = {
+    "string": StringFieldType,
+    "bytes": BinaryFieldType,
+    "boolean": BooleanFieldType,
+    "integer": LongFieldType,
+    "floating": DoubleFieldType,
+    "mixed-integer-float": DoubleFieldType,
+    "date": DateFieldType,
+    "datetime": TimestampFieldType,
+    "datetime64": TimestampFieldType,
+}
+
+
 def _get_field(  # pylint: disable=too-many-return-statements,too-many-branches
     name: Optional[str], obj: Any
 ) -> Field:
+    """
+    Infers the field of a column, given as values or a dtype, from its dtype. Only the values of object columns are
+    inspected, and then only a bounded sample of their non-null values. Columns that are not recognised are typed as
+    pyarrow would write them.
+    """
     import pandas as pd
     import numpy as np
+    import pyarrow as pa
 
-    dtype = _get_generic_type(obj)
+    if isinstance(obj, (np.dtype, pd.api.extensions.ExtensionDtype)):
+        dtype = obj
+    else:
+        dtype = obj.dtype if hasattr(obj, "dtype") else pd.Series(obj).dtype
+    pyarrow_dtype = getattr(dtype, "pyarrow_dtype", None)
+    if pyarrow_dtype is not None:
+        return Field(name, _get_arrow_field_type(pyarrow_dtype))
+    if isinstance(dtype, pd.CategoricalDtype):
+        return _get_field(name, dtype.categories)
+    if pd.api.types.is_object_dtype(dtype):
+        return Field(name, _infer_object_field_type(obj))
 
-    if _is_nested_list(obj):
-        return Field(
-            name=name,
-            field_type=ArrayFieldType(
-                element_type=_get_field(None, pd.Series(obj[0])).type
-            ),
-        )
+    generic_type = _get_generic_type(dtype)
     if pd.api.types.is_bool_dtype(dtype):
         return Field(name, BooleanFieldType())
+    if pd.api.types.is_unsigned_integer_dtype(dtype):
+        return Field(
+            name, _get_arrow_field_type(pa.from_numpy_dtype(np.dtype(generic_type)))
+        )
     if pd.api.types.is_integer_dtype(dtype):
-        if dtype == np.int8:
+        if generic_type == np.int8:
             return Field(name, ByteFieldType())
-        if dtype == np.int16:
+        if generic_type == np.int16:
             return Field(name, ShortFieldType())
-        if dtype == np.int32:
+        if generic_type == np.int32:
             return Field(name, IntegerFieldType())
-        if dtype == np.int64:
+        if generic_type == np.int64:
             return Field(name, LongFieldType())
     if pd.api.types.is_float_dtype(dtype):
-        if dtype == np.float32:
+        if generic_type == np.float32:
             return Field(name, FloatFieldType())
-        if dtype == np.float64:
+        if generic_type == np.float64:
             return Field(name, DoubleFieldType())
-    if pd.api.types.is_datetime64_dtype(dtype):
+    if pd.api.types.is_datetime64_any_dtype(dtype):
         return Field(name, TimestampFieldType())
-    if pd.api.types.is_object_dtype(dtype):
-        if isinstance(obj[0], date):
-            return Field(name, DateFieldType())
-        if pd.api.types.is_string_dtype(dtype):
-            return Field(name, StringFieldType())
-    raise ValueError(f"Unsupported dtype: {dtype}")
+    if pd.api.types.is_string_dtype(dtype):
+        return Field(name, StringFieldType())
+    return Field(
+        name,
+        _get_pandas_arrow_field_type(
+            obj if obj is not dtype else pd.Series([], dtype=dtype)
+        ),
+    )
+
+
+def _infer_object_field_type(obj: Any) -> FieldType:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+    sample = _non_null_sample(np.asarray(obj, dtype=object))
+    if len(sample) == 0:
+        raise ValueError("cannot infer the type of a column without non-null values")
+    if all(_is_list(value) for value in sample):
+        element = next((value for value in sample if len(value) > 0), None)
+        if element is None:
+            raise ValueError("cannot infer the element type of a column of empty lists")
+        return ArrayFieldType(element_type=_get_field(None, pd.Series(element)).type)
+
+    inferred = pd.api.types.infer_dtype(sample, skipna=True)
+    if inferred == "decimal":
+        decimal_type = pa.array(sample).type
+        return DecimalFieldType(
+            precision=decimal_type.precision, scale=decimal_type.scale
+        )
+    field_type = _INFERRED_FIELD_TYPES.get(inferred)
+    if field_type is None:
+        return _get_pandas_arrow_field_type(sample)
+    return field_type()
+
+
+def _get_pandas_arrow_field_type(values: Any) -> FieldType:
+    """Returns the field type of the Arrow type pyarrow converts the values to when writing them."""
+    import pandas as pd
+    import pyarrow as pa
+
+    schema = pa.Schema.from_pandas(
+        pd.DataFrame({"values": values}), preserve_index=False
+    )
+    return _get_arrow_field_type(schema.field("values").type)
+
+
+def _non_null_sample(values: "np.ndarray", size: int = _SAMPLE_SIZE) -> "np.ndarray":
+    """
+    Returns up to `size` leading non-null values of an array. Chunks of doubling length are scanned, so that a long run
+    of leading nulls is skipped in few vectorized passes.
+    """
+    import pandas as pd
+
+    start, chunk_size = 0, size
+    while start < len(values):
+        chunk = values[start : start + chunk_size]
+        non_null = chunk[~pd.isna(chunk)]
+        if len(non_null) > 0:
+            return non_null[:size]
+        start += chunk_size
+        chunk_size *= 2
+    return values[:0]
+
+
+def _is_list(value: Any) -> bool:
+    import pandas as pd
+
+    return pd.api.types.is_list_like(value) and not isinstance(value, dict)
 
 
 def _get_generic_type(obj_or_dtype: Any) -> Type:
@@ -106,12 +288,174 @@ def _get_generic_type(obj_or_dtype: Any) -> Type:
     return np.dtype(type(obj_or_dtype)).type
 
 
-def _is_nested_list(obj):
-    import pandas as pd
+def _get_data_frame_reader_class(file_format: FileFormat) -> Tuple[str, Optional[str]]:
+    if file_format == FileFormat.AVRO:
+        return "com.palantir.foundry.spark.input.AvroDataFrameReader", "avro"
+    if file_format == FileFormat.CSV:
+        return "com.palantir.foundry.spark.input.TextDataFrameReader", None
+    if file_format == FileFormat.PARQUET:
+        return "com.palantir.foundry.spark.input.ParquetDataFrameReader", "parquet"
+    if file_format == FileFormat.SOHO:
+        return "com.palantir.foundry.spark.input.DataSourceDataFrameReader", "soho"
+    raise ValueError(f"unknown file format: {file_format}")
+
+
+def _get_conjure_field_schema(
+    field_type: FieldType,
+    name: Optional[str] = None,
+    nullable: bool = True,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> FoundryFieldSchema:
+    foundry_field_type = _get_conjure_field_type(field_type)
+    array_subtype = None
+    map_key_type = None
+    map_value_type = None
+    sub_schemas = None
+    precision = None
+    scale = None
+
+    if isinstance(field_type, DecimalFieldType):
+        precision = field_type.precision
+        scale = field_type.scale
+    elif isinstance(field_type, ArrayFieldType):
+        array_subtype = _get_conjure_field_schema(field_type.element_type)
+    elif isinstance(field_type, MapFieldType):
+        map_key_type = _get_conjure_field_schema(field_type.key_type, nullable=False)
+        map_value_type = _get_conjure_field_schema(field_type.value_type)
+    elif isinstance(field_type, StructFieldType):
+        sub_schemas = [
+            _get_conjure_field_schema(
+                child.type, child.name, child.nullable, child.metadata
+            )
+            if isinstance(child, Field)
+            else _get_conjure_field_schema(child)
+            for child in field_type.fields
+        ]
+
+    return FoundryFieldSchema(
+        field_type=foundry_field_type,
+        name=name,
+        nullable=nullable,
+        custom_metadata={} if metadata is None else metadata,
+        array_subtype=array_subtype,
+        map_key_type=map_key_type,
+        map_value_type=map_value_type,
+        sub_schemas=sub_schemas,
+        precision=precision,
+        scale=scale,
+    )
+
+
+_SDK_TO_CONJURE_FIELD_TYPES = {
+    ArrayFieldType: FoundryFieldType.ARRAY,
+    BinaryFieldType: FoundryFieldType.BINARY,
+    BooleanFieldType: FoundryFieldType.BOOLEAN,
+    ByteFieldType: FoundryFieldType.BYTE,
+    DateFieldType: FoundryFieldType.DATE,
+    DecimalFieldType: FoundryFieldType.DECIMAL,
+    DoubleFieldType: FoundryFieldType.DOUBLE,
+    FloatFieldType: FoundryFieldType.FLOAT,
+    IntegerFieldType: FoundryFieldType.INTEGER,
+    LongFieldType: FoundryFieldType.LONG,
+    MapFieldType: FoundryFieldType.MAP,
+    ShortFieldType: FoundryFieldType.SHORT,
+    StringFieldType: FoundryFieldType.STRING,
+    StructFieldType: FoundryFieldType.STRUCT,
+    TimestampFieldType: FoundryFieldType.TIMESTAMP,
+}
+
+_CONJURE_TO_SDK_FIELD_TYPES = {
+    conjure_type: sdk_type
+    for sdk_type, conjure_type in _SDK_TO_CONJURE_FIELD_TYPES.items()
+}
+
 
-    return (
-        pd.api.types.is_list_like(obj)
-        and hasattr(obj, "__len__")
-        and len(obj) > 0
-        and all(pd.api.types.is_list_like(item) or item is None for item in obj)
+def _get_conjure_field_type(field_type: FieldType) -> FoundryFieldType:
+    conjure_field_type = _SDK_TO_CONJURE_FIELD_TYPES.get(type(field_type))
+    if conjure_field_type is not None:
+        return conjure_field_type
+    raise ValueError(f"Unknown FoundryFieldType: {field_type}")
+
+
+def _get_file_format(
+    data_frame_reader_class: str, metadata: Dict[str, Any]
+) -> FileFormat:
+    for file_format in FileFormat:
+        if _get_data_frame_reader_class(file_format)[0] == data_frame_reader_class:
+            return file_format
+    # schemas written by other clients may use other readers, whose format is described by the metadata if at all
+    dataset_format = str(metadata.get("format", "")).upper()
+    if dataset_format in FileFormat.__members__:
+        return FileFormat[dataset_format]
+    return FileFormat.PARQUET
+
+
+def _get_sdk_schema(schema: ConjureFoundrySchema) -> FoundrySchema:
+    custom_metadata = schema.custom_metadata or {}
+    metadata = {
+        key: value
+        for key, value in custom_metadata.items()
+        # the format is derived from the data frame reader class, put_schema adds it back
+        if key != "format"
+    }
+    return FoundrySchema(
+        fields=[
+            _get_sdk_field(field_schema) for field_schema in schema.field_schema_list
+        ],
+        file_format=_get_file_format(schema.data_frame_reader_class, custom_metadata),
+        metadata=metadata or None,
     )
+
+
+def _get_sdk_field(field_schema: FoundryFieldSchema) -> Field:
+    return Field(
+        field_schema.name,
+        _get_sdk_field_type(field_schema),
+        True if field_schema.nullable is None else field_schema.nullable,
+        field_schema.custom_metadata or None,
+    )
+
+
+def _get_sdk_field_type(field_schema: FoundryFieldSchema) -> FieldType:
+    conjure_type = field_schema.type
+    if conjure_type == FoundryFieldType.DECIMAL:
+        default = DecimalFieldType()
+        return DecimalFieldType(
+            precision=default.precision
+            if field_schema.precision is None
+            else field_schema.precision,
+            scale=default.scale if field_schema.scale is None else field_schema.scale,
+        )
+    if conjure_type == FoundryFieldType.ARRAY:
+        return ArrayFieldType(
+            _get_sdk_field_type(_nested(field_schema.array_subtype, conjure_type))
+        )
+    if conjure_type == FoundryFieldType.MAP:
+        return MapFieldType(
+            _get_sdk_field_type(_nested(field_schema.map_key_type, conjure_type)),
+            _get_sdk_field_type(_nested(field_schema.map_value_type, conjure_type)),
+        )
+    if conjure_type == FoundryFieldType.STRUCT:
+        return StructFieldType(
+            [_get_sdk_field(child) for child in field_schema.sub_schemas or []]
+        )
+    sdk_type = _CONJURE_TO_SDK_FIELD_TYPES.get(conjure_type)
+    if sdk_type is not None:
+        return sdk_type()
+    raise ValueError(f"Unsupported FoundryFieldType: {conjure_type}")
+
+
+def _nested(
+    field_schema: Optional[FoundryFieldSchema], conjure_type: FoundryFieldType
+) -> FoundryFieldSchema:
+    if field_schema is None:
+        raise ValueError(f"{conjure_type} field schema without its element types")
+    return field_schema
+
+
+def _prune_absent_values(dictionary):
+    return {
+        k: _prune_absent_values(v) if isinstance(v, dict) else v
+        for k, v in dictionary.items()
+        if v is not None
+    }
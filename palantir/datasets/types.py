@@ -31,10 +31,10 @@ class DatasetLocator:
     def with_updated(
         self,
         *,
-        dataset_rid: ResourceIdentifier = None,
-        branch_id: str = None,
-        start_transaction_rid: ResourceIdentifier = None,
-        end_transaction_rid: ResourceIdentifier = None,
+        dataset_rid: Optional[ResourceIdentifier] = None,
+        branch_id: Optional[str] = None,
+        start_transaction_rid: Optional[ResourceIdentifier] = None,
+        end_transaction_rid: Optional[ResourceIdentifier] = None,
     ) -> "DatasetLocator":
         return DatasetLocator(
             dataset_rid or self.rid,
@@ -54,10 +54,10 @@ class FileLocator:
     def with_updated(
         self,
         *,
-        dataset_rid: ResourceIdentifier = None,
-        end_ref: str = None,
-        logical_path: str = None,
-        start_transaction_rid: str = None,
+        dataset_rid: Optional[ResourceIdentifier] = None,
+        end_ref: Optional[str] = None,
+        logical_path: Optional[str] = None,
+        start_transaction_rid: Optional[str] = None,
     ):
         return FileLocator(
             dataset_rid or self.dataset_rid,
@@ -67,6 +67,144 @@ class FileLocator:
         )
 
 
+@dataclass(frozen=True)
+class UploadConfig:
+    """
+    Configures how file content is uploaded.
+
+    Content of at least ``part_size`` bytes is split into parts that are uploaded in parallel and then concatenated
+    server side.
+
+    Parameters
+    ----------
+    part_size : int
+        The size in bytes of each uploaded part. Defaults to 50 MiB.
+    max_workers : int
+        The maximum number of parts uploaded concurrently.
+    max_attempts : int
+        The number of times a part upload is attempted before giving up, retrying connection errors, timeouts and
+        server errors only.
+    retry_backoff : float
+        The delay in seconds before the first retry of a part, doubled for each subsequent attempt.
+    """
+
+    part_size: int = 50 * 1024 * 1024
+    max_workers: int = 4
+    max_attempts: int = 3
+    retry_backoff: float = 1.0
+
+
+@dataclass(frozen=True)
+class PartUpload:
+    """Reports the upload of a single part of a file uploaded in parts."""
+
+    index: int
+    logical_path: str
+    size: int
+    elapsed: float
+    attempts: int = 1
+
+    @property
+    def throughput(self) -> float:
+        """Returns the upload throughput of the part in bytes per second."""
+        return self.size / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+@dataclass(frozen=True)
+class TransferStats:
+    """Reports the aggregate transfer of a batch of files."""
+
+    files: int
+    size: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Returns the aggregate throughput of the transfer in bytes per second."""
+        return self.size / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+@dataclass(frozen=True)
+class QueryConfig:
+    """
+    Configures how dataset read queries are awaited.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        The maximum time in seconds a query may take to complete, enforced by the server and while polling for the
+        query status. Defaults to no timeout.
+    initial_poll_interval : float
+        The delay in seconds before the first query status poll, doubled after each poll.
+    max_poll_interval : float
+        The maximum delay in seconds between query status polls.
+    """
+
+    timeout: Optional[float] = None
+    initial_poll_interval: float = 0.05
+    max_poll_interval: float = 2.0
+
+
+@dataclass(frozen=True)
+class QueryStats:
+    """Reports the latency breakdown in seconds of a dataset read query."""
+
+    query_id: str
+    submit: float
+    running: float
+    transfer: float
+
+    @property
+    def total(self) -> float:
+        return self.submit + self.running + self.transfer
+
+
+class FilterOperator(Enum):
+    EQUAL = "="
+    NOT_EQUAL = "<>"
+    LESS_THAN = "<"
+    LESS_THAN_OR_EQUAL = "<="
+    GREATER_THAN = ">"
+    GREATER_THAN_OR_EQUAL = ">="
+    IN = "IN"
+    IS_NULL = "IS NULL"
+    IS_NOT_NULL = "IS NOT NULL"
+
+
+@dataclass(frozen=True)
+class ColumnFilter:
+    """
+    A condition on a column of a dataset, evaluated server side when reading the dataset.
+
+    Parameters
+    ----------
+    column : str
+        The name of the column.
+    operator : :class:`FilterOperator`
+        The comparison to apply. May be provided as the operator string, e.g. ``">="``.
+    value : Any, optional
+        The value to compare against: a string, number, bool, :class:`datetime.date`, :class:`datetime.datetime` or
+        :class:`decimal.Decimal`, or an iterable of those for ``FilterOperator.IN``. Unused for null checks.
+
+    Examples
+    --------
+    >>> ColumnFilter("date", FilterOperator.GREATER_THAN_OR_EQUAL, datetime.date(2022, 1, 1)) == ColumnFilter(
+    ...     "date", ">=", datetime.date(2022, 1, 1)
+    ... )
+    True
+    """
+
+    column: str
+    operator: FilterOperator
+    value: Any = None
+
+    def __post_init__(self):
+        if not isinstance(self.operator, FilterOperator):
+            object.__setattr__(
+                self, "operator", FilterOperator(str(self.operator).upper())
+            )
+
+
 class _AutoNameEnum(Enum):
     def _generate_next_value_(
         name, start, count, last_values
@@ -208,7 +346,9 @@ class StringFieldType(AtomicFieldType):
 
 @dataclass(frozen=True)
 class StructFieldType(FieldType):
-    fields: List[FieldType]
+    """A struct, whose fields are given as named :class:`Field` objects, or as bare types for anonymous fields."""
+
+    fields: List[Union["Field", FieldType]]
 
 
 @field_types.alias("datetime", "timestamp")
@@ -247,7 +387,7 @@ class Field:
         name: Optional[str],
         field_type: Union[FieldType, str],
         nullable: bool = True,
-        metadata: Dict[str, Any] = None,
+        metadata: Optional[Dict[str, Any]] = None,
     ):
         self.name = name
         self.type = (
@@ -326,7 +466,7 @@ class FoundrySchema:
             ]
         ],
         file_format: Union[FileFormat, str] = FileFormat.PARQUET,
-        metadata: Dict[str, Any] = None,
+        metadata: Optional[Dict[str, Any]] = None,
     ):
         self.fields: List[Field] = [
             field if isinstance(field, Field)
@@ -14,6 +14,7 @@
 
 from .types import OrderTerm, PropertyFilter, FilterTerm
 
+import threading
 import typing
 
 from palantir.core.types import PalantirContext
@@ -22,6 +23,28 @@ from palantir.core import context
 from palantir.objects.core import Ontology
 from palantir.objects.client import ObjectsClient, ObjectServices
 
+# the default client, with the hostname and token it was created for
+_DefaultClient = typing.Tuple[typing.Tuple[str, str], ObjectsClient]
+_default_client: typing.Optional[_DefaultClient] = None  # pylint: disable=invalid-name
+_default_client_lock = threading.Lock()
+
+
+def _objects_client(ctx: typing.Optional[PalantirContext] = None) -> ObjectsClient:
+    if ctx is not None:
+        # stored on its context, so that calls made with it share its metadata cache
+        return ctx.shared_client(
+            ObjectsClient, lambda: ObjectsClient(ObjectServices(ctx))
+        )
+    global _default_client  # pylint: disable=global-statement,invalid-name
+    # the default configuration is resolved on every call, but the client, with its
+    # metadata cache and pooled connections, is only replaced when it changes
+    resolved = context()
+    config = (resolved.hostname, str(resolved.auth_token))
+    with _default_client_lock:
+        if _default_client is None or _default_client[0] != config:
+            _default_client = (config, ObjectsClient(ObjectServices(resolved)))
+        return _default_client[1]
+
 
 def list_ontologies(
     ctx: PalantirContext = None,
@@ -43,9 +66,7 @@ def list_ontologies(
 
         >>> my_ontologies = objects.list_ontologies()
     """
-    obj_client = ObjectsClient(ObjectServices(ctx or context()))
-    ontologies = obj_client.list_ontologies()
-    return ontologies
+    return _objects_client(ctx).list_ontologies()
 
 
 def ontology(rid: str = None, ctx: PalantirContext = None) -> Ontology:
@@ -64,11 +85,10 @@ def ontology(rid: str = None, ctx: PalantirContext = None) -> Ontology:
 
         >>> my_ontology = objects.ontology(rid="ri.ontology.main.ontology.c61d9ab5-2919-4127-a0a1-ac64c0ce6367")
     """
-    all_ontologies = list_ontologies()
+    ontologies_by_rid = {str(ont.rid): ont for ont in list_ontologies(ctx)}
     if rid is not None:
-        for ont in all_ontologies:
-            if str(ont.rid) == rid:
-                return ont
+        if rid in ontologies_by_rid:
+            return ontologies_by_rid[rid]
         raise ValueError("The ontology with the specified rid does not exist or is not visible to the user.")
     else:
         ctx = ctx or context()
@@ -76,9 +96,8 @@ def ontology(rid: str = None, ctx: PalantirContext = None) -> Ontology:
         if ontology_rid is None:
             raise ValueError("The ontology rid is not specified and it cannot be found in the environment either.")
         else:
-            for ont in all_ontologies:
-                if str(ont.rid) == ontology_rid:
-                    return ont
+            if ontology_rid in ontologies_by_rid:
+                return ontologies_by_rid[ontology_rid]
             raise ValueError("The ontology obtained from the environment does not exist or is not visible to the user.")
 
 
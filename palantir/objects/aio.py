@@ -0,0 +1,507 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+asyncio counterpart of :class:`ObjectsClient`, so that a single event loop can serve many concurrent ontology
+lookups. Requires the ``async`` extra (aiohttp).
+
+Examples:
+    >>> async with AsyncObjectsClient(AsyncObjectServices(context())) as client:
+    ...     ontologies = await client.list_ontologies()
+    ...     object_types = await client.get_object_types(ontologies[0].rid, ["Aircraft", "Airport"])
+    ...     async for aircraft in object_types[0].list_objects():
+    ...         print(aircraft.properties)
+"""
+
+import asyncio
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from palantir.core.aio import AsyncConjureClient, _import_aiohttp
+from palantir.core.types import PalantirContext, ResourceIdentifier
+from palantir.objects.client import (
+    _order_by_param,
+    _search_request,
+    convert_properties_to_dict,
+)
+from palantir.objects.rpc.aio import AsyncAPIService
+from palantir.objects.rpc.api import ListObjectsResponse
+from palantir.objects.types import OrderTerm, PropertyFilter
+
+T = TypeVar("T")
+
+
+class AsyncObjectServices:
+    def __init__(
+        self, ctx: PalantirContext, conjure_client: Optional[AsyncConjureClient] = None
+    ):
+        self.factory = conjure_client or AsyncConjureClient()
+        self.ctx = ctx
+
+    @property
+    def api_service(self) -> AsyncAPIService:
+        return self.factory.service(
+            AsyncAPIService,
+            f"https://{self.ctx.hostname}/api/v1",
+        )
+
+
+class AsyncObjectsClient:
+    """
+    An asyncio client for the ontology API. At most `max_concurrency` requests made through this client are in flight
+    at once, further requests wait for a slot. Its connections are pooled in a session bound to the event loop it is
+    first used from, which must be closed with :meth:`close` or by using the client as an async context manager.
+    """
+
+    def __init__(self, services: AsyncObjectServices, max_concurrency: int = 16):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.services = services
+        self.ctx = services.ctx
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def _api_service(self) -> AsyncAPIService:
+        return self.services.api_service
+
+    async def _call(self, request: Awaitable[T]) -> T:
+        # created lazily, as before python 3.10 a semaphore binds to the event loop current at its creation
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await request
+
+    async def list_ontologies(self) -> List["AsyncOntology"]:
+        """
+        :return: the list of ontologies visible to the user, see :meth:`ObjectsClient.list_ontologies`
+        """
+        response = await self._call(
+            self._api_service.list_ontologies(auth_header=self.ctx.auth_token)
+        )
+        return [
+            AsyncOntology(
+                description=ont.description,
+                rid=ResourceIdentifier.try_parse(ont.rid),
+                display_name=ont.display_name,
+                client=self,
+            )
+            for ont in response.data
+        ]
+
+    async def list_object_types(
+        self, ontology_rid: str, page_size: Optional[int] = None
+    ) -> AsyncGenerator["AsyncObjectType", None]:
+        """Lists the object types of an ontology, fetching the next page while the current one is consumed."""
+
+        def fetch(page_token: Optional[str]) -> "asyncio.Task":
+            return asyncio.ensure_future(
+                self._call(
+                    self._api_service.list_object_types(
+                        auth_header=self.ctx.auth_token,
+                        ontology_rid=ontology_rid,
+                        page_token=page_token,
+                        page_size=page_size,
+                    )
+                )
+            )
+
+        next_page: Optional[asyncio.Task] = fetch(None)
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = (
+                    fetch(page.next_page_token) if page.next_page_token else None
+                )
+                for obj_type in page.data:
+                    yield _to_object_type(obj_type, ontology_rid, self)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def get_object_type(
+        self, ontology_rid: str, object_type: str
+    ) -> Optional["AsyncObjectType"]:
+        """Returns the object type, or None if it does not exist or is not visible to the user."""
+        aiohttp = _import_aiohttp()
+        try:
+            data = await self._call(
+                self._api_service.get_object_type(
+                    auth_header=self.ctx.auth_token,
+                    ontology_rid=ontology_rid,
+                    object_type=object_type,
+                )
+            )
+        except aiohttp.ClientResponseError:
+            return None
+        return _to_object_type(data, ontology_rid, self)
+
+    async def get_object_types(
+        self, ontology_rid: str, object_types: List[str]
+    ) -> List[Optional["AsyncObjectType"]]:
+        """
+        Fetches several object types concurrently, within the concurrency limit of the client.
+
+        Returns: The object types in the order of `object_types`, None for those that do not exist or are not visible
+        to the user.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.get_object_type(ontology_rid, object_type)
+                    for object_type in object_types
+                )
+            )
+        )
+
+    async def list_objects(
+        self,
+        object_type: "AsyncObjectType",
+        properties: Optional[List[str]] = None,
+        order_by: Optional[List[Tuple[str, OrderTerm]]] = None,
+        filters: Optional[List[PropertyFilter]] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncGenerator["AsyncObject", None]:
+        """
+        Streams the objects of a type, fetching the next page while the current one is consumed. Objects are listed
+        with the list objects endpoint, or searched with the search endpoint if there are filters, see
+        :meth:`ObjectsClient.list_objects`.
+        """
+        page_supplier: Callable[[Optional[str]], Awaitable[ListObjectsResponse]]
+        if filters:
+
+            def page_supplier(page_token: Optional[str]):
+                return self._api_service.search_objects(
+                    auth_header=self.ctx.auth_token,
+                    ontology_rid=object_type.ontology_rid,
+                    object_type=object_type.api_name,
+                    request=_search_request(
+                        filters, properties, order_by, page_size, page_token
+                    ),
+                )
+
+        else:
+            order_by_param = _order_by_param(order_by)
+
+            def page_supplier(page_token: Optional[str]):
+                return self._api_service.list_objects(
+                    auth_header=self.ctx.auth_token,
+                    ontology_rid=object_type.ontology_rid,
+                    object_type=object_type.api_name,
+                    page_size=page_size,
+                    page_token=page_token,
+                    properties=properties,
+                    order_by=order_by_param,
+                )
+
+        def fetch(page_token: Optional[str]) -> "asyncio.Task":
+            return asyncio.ensure_future(self._call(page_supplier(page_token)))
+
+        next_page: Optional[asyncio.Task] = fetch(None)
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = (
+                    fetch(page.next_page_token) if page.next_page_token else None
+                )
+                for obj in page.data:
+                    yield _to_object(obj, object_type)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def get_object(
+        self,
+        object_type: "AsyncObjectType",
+        primary_key: Any,
+        properties: Optional[List[str]] = None,
+    ) -> Optional["AsyncObject"]:
+        """Returns the object with the primary key, or None if it does not exist or is not visible to the user."""
+        aiohttp = _import_aiohttp()
+        try:
+            obj = await self._call(
+                self._api_service.get_object(
+                    auth_header=self.ctx.auth_token,
+                    ontology_rid=object_type.ontology_rid,
+                    object_type=object_type.api_name,
+                    primary_key=primary_key,
+                    properties=properties,
+                )
+            )
+        except aiohttp.ClientResponseError as exc:
+            if exc.status == 404:
+                return None
+            raise
+        return _to_object(obj, object_type)
+
+    async def close(self) -> None:
+        """Closes all pooled connections."""
+        await self.services.factory.close()
+
+    async def __aenter__(self) -> "AsyncObjectsClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+
+class AsyncOntology:
+    """An ontology listed by an :class:`AsyncObjectsClient`, whose lookups are coroutines."""
+
+    def __init__(
+        self,
+        rid: Optional[ResourceIdentifier],
+        description: str,
+        display_name: str,
+        client: AsyncObjectsClient,
+    ):
+        self._rid = rid
+        self._description = description
+        self._display_name = display_name
+        self.client = client
+
+    @property
+    def rid(self) -> str:
+        return str(self._rid)
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @property
+    def display_name(self) -> str:
+        return self._display_name
+
+    def list_object_types(
+        self, page_size: Optional[int] = None
+    ) -> AsyncGenerator["AsyncObjectType", None]:
+        """
+        Lists the object types in the ontology
+
+        Args:
+            page_size: An optional number of object types to fetch per page.
+
+        Returns: An async generator of :class:`AsyncObjectType` objects in the current ontology
+        """
+        return self.client.list_object_types(self.rid, page_size=page_size)
+
+    async def object_type(self, api_name: str) -> "AsyncObjectType":
+        """
+        Get the object type specified by api_name argument in the current ontology
+
+        Args:
+            api_name: The API name of the object type
+
+        Returns: An :class:`AsyncObjectType` object representing the object type
+        """
+        obj_type = await self.client.get_object_type(self.rid, api_name)
+        if obj_type is None:
+            raise ValueError(
+                "The specified object type in the ontology does not exist or is not visible to the user."
+            )
+        return obj_type
+
+    def __eq__(self, other) -> bool:
+        return other is self or (
+            isinstance(other, AsyncOntology)
+            and other.rid == self.rid
+            and other.description == self.description
+            and other.display_name == self.display_name
+        )
+
+    def __str__(self):
+        return f'AsyncOntology(rid="{self.rid}", description="{self.description}", display_name="{self.display_name}")'
+
+    def __repr__(self):
+        return str(self)
+
+
+class AsyncObjectType:
+    """An object type fetched by an :class:`AsyncObjectsClient`, whose object lookups are coroutines."""
+
+    def __init__(
+        self,
+        api_name: str,
+        description: str,
+        primary_key: List[str],
+        properties: Dict,
+        rid: Optional[ResourceIdentifier],
+        ontology_rid: str,
+        client: AsyncObjectsClient,
+    ):
+        self._api_name = api_name
+        self._description = description
+        self._primary_key = primary_key
+        self._properties = properties
+        self._rid = rid
+        self.ontology_rid = ontology_rid
+        self.client = client
+
+    @property
+    def api_name(self) -> str:
+        return self._api_name
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @property
+    def primary_key(self) -> List[str]:
+        return self._primary_key
+
+    @property
+    def properties(self) -> Dict:
+        return self._properties
+
+    @property
+    def rid(self) -> str:
+        return str(self._rid)
+
+    def list_objects(
+        self,
+        properties: Optional[List[str]] = None,
+        order_by: Optional[List[Tuple[str, OrderTerm]]] = None,
+        filters: Optional[List[PropertyFilter]] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncGenerator["AsyncObject", None]:
+        """
+        Lists the objects of this type, streamed page by page as by :meth:`ObjectType.list_objects`.
+
+        Args:
+            properties: The properties to return, all properties if not specified.
+            order_by: Pairs of property and :class:`OrderTerm` to sort by.
+            filters: Only objects matching all filters are returned. Filters are evaluated by the server.
+            page_size: An optional number of objects to fetch per page.
+
+        Returns: An async generator of :class:`AsyncObject` objects
+        """
+        return self.client.list_objects(
+            self,
+            properties=properties,
+            order_by=order_by,
+            filters=filters,
+            page_size=page_size,
+        )
+
+    async def object(
+        self, primary_key: Any, properties: Optional[List[str]] = None
+    ) -> "AsyncObject":
+        """
+        Get the object of this type with the specified primary key
+
+        Args:
+            primary_key: The primary key of the object
+            properties: The properties to return, all properties if not specified.
+
+        Returns: An :class:`AsyncObject` object
+        """
+        obj = await self.client.get_object(self, primary_key, properties=properties)
+        if obj is None:
+            raise ValueError(
+                "The specified object does not exist or is not visible to the user."
+            )
+        return obj
+
+    def __str__(self):
+        return f'AsyncObjectType(api_name="{self.api_name}", primary_key="{self.primary_key}", rid="{self.rid}")'
+
+    def __repr__(self):
+        return str(self)
+
+    def __eq__(self, other) -> bool:
+        return other is self or (
+            isinstance(other, AsyncObjectType)
+            and other.rid == self.rid
+            and other.api_name == self.api_name
+            and other.primary_key == self.primary_key
+            and other.description == self.description
+            and other.properties == self.properties
+        )
+
+
+class AsyncObject:
+    """An object fetched by an :class:`AsyncObjectsClient`."""
+
+    def __init__(
+        self,
+        rid: Optional[ResourceIdentifier],
+        properties: Dict,
+        object_type: AsyncObjectType,
+    ):
+        self._rid = rid
+        self._properties = properties
+        self.object_type = object_type
+
+    @property
+    def rid(self) -> str:
+        return str(self._rid)
+
+    @property
+    def properties(self) -> Dict:
+        return self._properties
+
+    @property
+    def primary_key(self) -> Any:
+        """Returns the value of the primary key property of the object."""
+        primary_key = self.object_type.primary_key[0]
+        if primary_key not in self._properties:
+            raise ValueError(
+                f"The primary key property {primary_key} was not returned for the object, include it in the "
+                "requested properties."
+            )
+        return self._properties[primary_key]
+
+    def __str__(self):
+        return f'AsyncObject(rid="{self.rid}", properties={self.properties})'
+
+    def __repr__(self):
+        return str(self)
+
+    def __eq__(self, other) -> bool:
+        return other is self or (
+            isinstance(other, AsyncObject)
+            and other.rid == self.rid
+            and other.properties == self.properties
+        )
+
+
+def _to_object_type(
+    obj_type, ontology_rid: str, client: AsyncObjectsClient
+) -> AsyncObjectType:
+    return AsyncObjectType(
+        api_name=obj_type.api_name,
+        description=obj_type.description,
+        primary_key=obj_type.primary_key,
+        properties=convert_properties_to_dict(obj_type.properties),
+        rid=ResourceIdentifier.try_parse(obj_type.rid),
+        ontology_rid=ontology_rid,
+        client=client,
+    )
+
+
+def _to_object(obj, object_type: AsyncObjectType) -> AsyncObject:
+    return AsyncObject(
+        rid=ResourceIdentifier.try_parse(obj.rid) if obj.rid else None,
+        properties=obj.properties,
+        object_type=object_type,
+    )
@@ -12,14 +12,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import datetime
+import operator
 import typing
+
+from dateutil.parser import isoparse
 from requests.exceptions import HTTPError
 
 from palantir.core.types import PalantirContext, ResourceIdentifier
-from palantir.core.rpc import ConjureClient
-from palantir.core.util import page_results
-from palantir.objects.rpc.api import APIService
-from palantir.objects.core import Ontology, ObjectType
+from palantir.core.util import CacheStats, TTLCache, page_results
+from palantir.objects.rpc.api import APIService, OntologyObject
+from palantir.objects.core import Ontology, Object, ObjectType
+from palantir.objects.types import FilterTerm, OrderTerm, PropertyFilter
 
 
 def convert_properties_to_dict(props_input):
@@ -34,7 +38,7 @@ def convert_properties_to_dict(props_input):
 
 class ObjectServices:
     def __init__(self, ctx: PalantirContext):
-        self.factory = ConjureClient()
+        self.factory = ctx.conjure_client
         self.ctx = ctx
 
     @property
@@ -46,9 +50,15 @@ class ObjectServices:
 
 
 class ObjectsClient:
-    def __init__(self, services: ObjectServices):
+    """
+    A client for the ontology API. Ontologies and object types are cached in memory for `metadata_ttl` seconds, up to
+    `metadata_cache_size` entries, as they rarely change; use :meth:`invalidate` to drop stale entries sooner.
+    """
+
+    def __init__(self, services: ObjectServices, metadata_ttl: float = 300.0, metadata_cache_size: int = 1024):
         self.services = services
         self.ctx = services.ctx
+        self._metadata_cache: TTLCache = TTLCache(maxsize=metadata_cache_size, ttl=metadata_ttl)
 
     @property
     def _api_service(self) -> APIService:
@@ -60,6 +70,12 @@ class ObjectsClient:
         .. _endpoint:
             https://www.palantir.com/docs/foundry/api/ontology-resources/ontology/list-ontologies/
         """
+        return list(self._metadata_cache.get_or_load(("ontologies",), self._list_ontologies))
+
+    def _list_ontologies(self) -> typing.List[Ontology]:
+        response = self._api_service.list_ontologies(auth_header=self.ctx.auth_token)
+        if response is None:
+            return []
         return [
             Ontology(
                 description=ont.description,
@@ -67,36 +83,356 @@ class ObjectsClient:
                 display_name=ont.display_name,
                 client=self
             )
-            for ont in self._api_service.list_ontologies(auth_header=self.ctx.auth_token).data
+            for ont in response.data
         ]
 
-    def list_object_types(self, ontology_rid) -> typing.Generator["ObjectType", None, None]:
+    def list_object_types(
+            self, ontology_rid, page_size: typing.Optional[int] = None
+    ) -> typing.Generator["ObjectType", None, None]:
+        """
+        Lists the object types of an ontology, fetching the next page in the background while the current one is
+        consumed.
+
+        :param page_size: the number of object types requested per page, defaults to the server default
+        """
         for obj_type in page_results(
             values_extractor=lambda page: page.data,
-            token_extractor=lambda page: page.next_page_token,
+            token_extractor=lambda page: page.next_page_token or None,
             page_supplier=lambda next_page_token: self._api_service.list_object_types(
-                auth_header=self.ctx.auth_token, ontology_rid=ontology_rid
+                auth_header=self.ctx.auth_token,
+                ontology_rid=ontology_rid,
+                page_token=next_page_token,
+                page_size=page_size,
             ),
+            prefetch=True,
         ):
-            yield ObjectType(
-                api_name=obj_type.api_name,
-                description=obj_type.description,
-                primary_key=obj_type.primary_key,
-                properties=convert_properties_to_dict(obj_type.properties),
-                rid=ResourceIdentifier.try_parse(obj_type.rid)
-            )
+            object_type = _to_object_type(obj_type, ontology_rid, self)
+            self._metadata_cache.put(("object-type", ontology_rid, object_type.api_name), object_type)
+            yield object_type
 
-    def get_object_type(self, ontology_rid, object_type) -> ObjectType:
+    def get_object_type(self, ontology_rid: str, object_type: str) -> typing.Optional[ObjectType]:
+        key = ("object-type", ontology_rid, object_type)
+        cached = self._metadata_cache.get(key)
+        if cached is not None:
+            return cached
         try:
             data = self._api_service.get_object_type(
                 auth_header=self.ctx.auth_token, ontology_rid=ontology_rid, object_type=object_type
             )
-            return ObjectType(
-                api_name=data.api_name,
-                description=data.description,
-                rid=ResourceIdentifier.try_parse(data.rid),
-                properties=convert_properties_to_dict(data.properties),
-                primary_key=data.primary_key
-            )
         except HTTPError:
+            # not cached, so that object types are found as soon as they are created
             return None
+        result = _to_object_type(data, ontology_rid, self)
+        self._metadata_cache.put(key, result)
+        return result
+
+    def get_linked_object_type(self, object_type: ObjectType, link_type: str) -> ObjectType:
+        """
+        Returns the object type on the other side of an outgoing link type of `object_type`. The link type is cached
+        as object types are.
+        """
+        ontology_rid = _ontology_rid(object_type)
+        target = self._metadata_cache.get_or_load(
+            ("link-type", ontology_rid, object_type.api_name, link_type),
+            lambda: self._api_service.get_outgoing_link_type(
+                auth_header=self.ctx.auth_token,
+                ontology_rid=ontology_rid,
+                object_type=object_type.api_name,
+                link_type=link_type,
+            ).object_type_api_name,
+        )
+        linked_type = self.get_object_type(ontology_rid, target)
+        if linked_type is None:
+            raise ValueError(
+                f"The object type {target} linked by {link_type} does not exist or is not visible to the user."
+            )
+        return linked_type
+
+    def list_objects(
+            self,
+            object_type: ObjectType,
+            properties: typing.Optional[typing.List[str]] = None,
+            order_by: typing.Optional[typing.List[typing.Tuple[str, OrderTerm]]] = None,
+            filters: typing.Optional[typing.List[PropertyFilter]] = None,
+            page_size: typing.Optional[int] = None,
+    ) -> typing.Generator[Object, None, None]:
+        """
+        Streams the objects of a type, fetching the next page in the background while the current one is consumed.
+        Objects are listed with the list objects endpoint, or searched with the search endpoint if there are filters.
+        """
+        if filters:
+            def page_supplier(next_page_token):
+                return self._api_service.search_objects(
+                    auth_header=self.ctx.auth_token,
+                    ontology_rid=object_type.ontology_rid,
+                    object_type=object_type.api_name,
+                    request=_search_request(filters, properties, order_by, page_size, next_page_token),
+                )
+        else:
+            order_by_param = _order_by_param(order_by)
+
+            def page_supplier(next_page_token):
+                return self._api_service.list_objects(
+                    auth_header=self.ctx.auth_token,
+                    ontology_rid=object_type.ontology_rid,
+                    object_type=object_type.api_name,
+                    page_size=page_size,
+                    page_token=next_page_token,
+                    properties=properties,
+                    order_by=order_by_param,
+                )
+
+        for obj in page_results(
+            values_extractor=lambda page: page.data,
+            token_extractor=lambda page: page.next_page_token or None,
+            page_supplier=page_supplier,
+            prefetch=True,
+        ):
+            yield _to_object(obj, object_type, self)
+
+    def get_object(
+            self,
+            object_type: ObjectType,
+            primary_key: typing.Any,
+            properties: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Optional[Object]:
+        """Returns the object with the primary key, or None if it does not exist or is not visible to the user."""
+        try:
+            obj = self._api_service.get_object(
+                auth_header=self.ctx.auth_token,
+                ontology_rid=_ontology_rid(object_type),
+                object_type=object_type.api_name,
+                primary_key=primary_key,
+                properties=properties,
+            )
+        except HTTPError as exc:
+            if exc.response is not None and exc.response.status_code == 404:
+                return None
+            raise
+        return _to_object(obj, object_type, self)
+
+    def list_linked_objects(
+            self,
+            obj: Object,
+            link_type: str,
+            properties: typing.Optional[typing.List[str]] = None,
+            order_by: typing.Optional[typing.List[typing.Tuple[str, OrderTerm]]] = None,
+            filters: typing.Optional[typing.List[PropertyFilter]] = None,
+            page_size: typing.Optional[int] = None,
+    ) -> typing.Generator[Object, None, None]:
+        """
+        Streams the objects linked to an object, fetching the next page in the background while the current one is
+        consumed. The linked objects endpoint does not support filters, so `filters` are evaluated on received objects,
+        comparing values as the types of their properties, as the search endpoint does.
+        """
+        object_type = _object_type(obj)
+        ontology_rid = _ontology_rid(object_type)
+        linked_type = self.get_linked_object_type(object_type, link_type)
+        requested = properties
+        if filters:
+            unknown = [f.property for f in filters if f.property not in linked_type.properties]
+            if unknown:
+                raise ValueError(f"The object type {linked_type.api_name} has no properties {unknown} to filter on.")
+            if properties:
+                requested = list(properties) + [f.property for f in filters if f.property not in properties]
+        order_by_param = _order_by_param(order_by)
+        for linked in page_results(
+            values_extractor=lambda page: page.data,
+            token_extractor=lambda page: page.next_page_token or None,
+            page_supplier=lambda next_page_token: self._api_service.list_linked_objects(
+                auth_header=self.ctx.auth_token,
+                ontology_rid=ontology_rid,
+                object_type=object_type.api_name,
+                primary_key=obj.primary_key,
+                link_type=link_type,
+                page_size=page_size,
+                page_token=next_page_token,
+                properties=requested,
+                order_by=order_by_param,
+            ),
+            prefetch=True,
+        ):
+            if filters and not all(_matches(linked.properties, f, linked_type.properties) for f in filters):
+                continue
+            yield _to_object(linked, linked_type, self)
+
+    def get_linked_object(
+            self,
+            obj: Object,
+            link_type: str,
+            primary_key: typing.Any,
+            properties: typing.Optional[typing.List[str]] = None,
+    ) -> typing.Optional[Object]:
+        """Returns the linked object with the primary key, or None if it does not exist or is not visible to the user."""
+        object_type = _object_type(obj)
+        linked_type = self.get_linked_object_type(object_type, link_type)
+        try:
+            linked = self._api_service.get_linked_object(
+                auth_header=self.ctx.auth_token,
+                ontology_rid=_ontology_rid(object_type),
+                object_type=object_type.api_name,
+                primary_key=obj.primary_key,
+                link_type=link_type,
+                linked_object_primary_key=primary_key,
+                properties=properties,
+            )
+        except HTTPError as exc:
+            if exc.response is not None and exc.response.status_code == 404:
+                return None
+            raise
+        return _to_object(linked, linked_type, self)
+
+    def invalidate(
+            self, ontology_rid: typing.Optional[str] = None, object_type: typing.Optional[str] = None
+    ) -> None:
+        """
+        Drops cached metadata: the object type `object_type` of the ontology and its link types if both are specified,
+        every object type and link type of the ontology if only `ontology_rid` is, and all ontologies, object types
+        and link types otherwise.
+        """
+        if ontology_rid is None:
+            self._metadata_cache.invalidate()
+        elif object_type is None:
+            self._metadata_cache.invalidate(
+                lambda key: key[0] in ("object-type", "link-type") and key[1] == ontology_rid
+            )
+        else:
+            self._metadata_cache.invalidate(
+                lambda key: key[0] in ("object-type", "link-type") and key[1:3] == (ontology_rid, object_type)
+            )
+
+    def cache_stats(self) -> CacheStats:
+        """Returns a :class:`CacheStats` report of the metadata cache activity."""
+        return self._metadata_cache.stats()
+
+
+def _to_object_type(
+        obj_type, ontology_rid: typing.Optional[str] = None, client: typing.Optional["ObjectsClient"] = None
+) -> ObjectType:
+    return ObjectType(
+        api_name=obj_type.api_name,
+        description=obj_type.description,
+        primary_key=obj_type.primary_key,
+        properties=convert_properties_to_dict(obj_type.properties),
+        rid=ResourceIdentifier.try_parse(obj_type.rid),
+        ontology_rid=ontology_rid,
+        client=client
+    )
+
+
+def _to_object(
+        obj: OntologyObject,
+        object_type: typing.Optional[ObjectType] = None,
+        client: typing.Optional["ObjectsClient"] = None,
+) -> Object:
+    return Object(
+        rid=ResourceIdentifier.try_parse(obj.rid) if obj.rid else None,
+        properties=obj.properties,
+        object_type=object_type,
+        client=client
+    )
+
+
+def _order_by_param(order_by: typing.Optional[typing.List[typing.Tuple[str, OrderTerm]]]) -> typing.Optional[str]:
+    if not order_by:
+        return None
+    return ",".join(f"properties.{prop}{OrderTerm(term).value}" for prop, term in order_by)
+
+
+def _search_request(
+        filters: typing.List[PropertyFilter],
+        properties: typing.Optional[typing.List[str]],
+        order_by: typing.Optional[typing.List[typing.Tuple[str, OrderTerm]]],
+        page_size: typing.Optional[int],
+        page_token: typing.Optional[str],
+) -> typing.Dict[str, typing.Any]:
+    queries = [_filter_query(prop_filter) for prop_filter in filters]
+    request: typing.Dict[str, typing.Any] = {
+        "query": queries[0] if len(queries) == 1 else {"type": "and", "value": queries},
+    }
+    if order_by:
+        request["orderBy"] = {
+            "fields": [
+                {"field": f"properties.{prop}", "direction": OrderTerm(term).value.lstrip(":")}
+                for prop, term in order_by
+            ]
+        }
+    if properties:
+        request["fields"] = list(properties)
+    if page_size is not None:
+        request["pageSize"] = page_size
+    if page_token is not None:
+        request["pageToken"] = page_token
+    return request
+
+
+def _ontology_rid(object_type: ObjectType) -> str:
+    if object_type.ontology_rid is None:
+        raise ValueError(f"The ontology of the object type {object_type.api_name} is not known.")
+    return object_type.ontology_rid
+
+
+def _object_type(obj: Object) -> ObjectType:
+    if obj.object_type is None:
+        raise ValueError("The object type of the object is not known.")
+    return obj.object_type
+
+
+def _filter_query(prop_filter: PropertyFilter) -> typing.Dict[str, typing.Any]:
+    term = FilterTerm(prop_filter.filter)
+    if term == FilterTerm.IS_NULL:
+        return {"type": "isNull", "field": f"properties.{prop_filter.property}", "value": bool(prop_filter.value)}
+    return {"type": term.value, "field": f"properties.{prop_filter.property}", "value": prop_filter.value}
+
+
+_COMPARISONS = {
+    FilterTerm.EQUAL: operator.eq,
+    FilterTerm.LESS_THAN: operator.lt,
+    FilterTerm.LESS_THAN_OR_EQUAL: operator.le,
+    FilterTerm.GREATER_THAN: operator.gt,
+    FilterTerm.GREATER_THAN_OR_EQUAL: operator.ge,
+}
+
+
+def _matches(
+        properties: typing.Dict[str, typing.Any],
+        prop_filter: PropertyFilter,
+        property_types: typing.Dict[str, typing.Dict[str, typing.Any]],
+) -> bool:
+    """
+    Evaluates a filter on the properties of an object, as the server would. Null properties, which are not returned,
+    only match IS_NULL filters.
+    """
+    value = properties.get(prop_filter.property)
+    term = FilterTerm(prop_filter.filter)
+    if term == FilterTerm.IS_NULL:
+        return (value is None) == bool(prop_filter.value)
+    if value is None:
+        return False
+    base_type = property_types[prop_filter.property]["base_type"]
+    value = _typed_value(value, base_type)
+    if term == FilterTerm.CONTAINS:
+        return prop_filter.value in value
+    return _COMPARISONS[term](value, _typed_value(prop_filter.value, base_type))
+
+
+def _typed_value(value: typing.Any, base_type: str) -> typing.Any:
+    """
+    Converts a property value, as received in JSON or given in a filter, to the python type of its base type, so that
+    received values compare with filter values. Timestamps without a timezone are taken to be in UTC.
+    """
+    if base_type == "Timestamp":
+        if isinstance(value, str):
+            value = isoparse(value)
+        if isinstance(value, datetime.datetime) and value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+    elif base_type == "Date":
+        if isinstance(value, datetime.datetime):
+            value = value.date()
+        elif isinstance(value, str):
+            value = datetime.date.fromisoformat(value)
+    elif base_type in ("Byte", "Short", "Integer", "Long") and isinstance(value, str):
+        value = int(value)
+    elif base_type in ("Float", "Double") and isinstance(value, str):
+        value = float(value)
+    return value
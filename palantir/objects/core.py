@@ -12,16 +12,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Generator, List, Dict
-import requests
+from typing import Any, Generator, List, Dict, Optional, Tuple, TYPE_CHECKING
 
 from palantir.core.types import ResourceIdentifier
-from palantir.objects import OrderTerm, PropertyFilter
+from palantir.objects.types import OrderTerm, PropertyFilter
+
+if TYPE_CHECKING:
+    from palantir.objects.client import ObjectsClient
 
 
 class Ontology:
 
-    def __init__(self, rid: ResourceIdentifier, description: str, display_name: str, client: "ObjectClient"):
+    def __init__(self, rid: Optional[ResourceIdentifier], description: str, display_name: str, client: "ObjectsClient"):
         self._rid = rid
         self._description = description
         self._display_name = display_name
@@ -39,16 +41,16 @@ class Ontology:
     def display_name(self) -> str:
         return self._display_name
 
-    def list_object_types(self) -> Generator["ObjectType", None, None]:
+    def list_object_types(self, page_size: Optional[int] = None) -> Generator["ObjectType", None, None]:
         """
         Lists the object types in the ontology
 
         Args:
-            path: An optional path prefix to use to filter when listing files.
+            page_size: An optional number of object types to fetch per page.
 
         Returns: A generator over pages of :class:`ObjectType` objects in the current ontology
         """
-        return self.client.list_object_types(str(self.rid))
+        return self.client.list_object_types(str(self.rid), page_size=page_size)
 
     def object_type(self, api_name: str) -> "ObjectType":
         """
@@ -83,13 +85,22 @@ class Ontology:
 class ObjectType:
 
     def __init__(
-            self, api_name: str, description: str, primary_key: List[str], properties: Dict, rid: ResourceIdentifier
+            self,
+            api_name: str,
+            description: str,
+            primary_key: List[str],
+            properties: Dict,
+            rid: Optional[ResourceIdentifier],
+            ontology_rid: Optional[str] = None,
+            client: Optional["ObjectsClient"] = None,
     ):
         self._api_name = api_name
         self._description = description
         self._primary_key = primary_key
         self._properties = properties
         self._rid = rid
+        self.ontology_rid = ontology_rid
+        self.client = client
 
     @property
     def api_name(self) -> str:
@@ -113,11 +124,26 @@ class ObjectType:
 
     def list_objects(
             self,
-            properties: List[str] = None,
-            order_by: List[tuple[str, OrderTerm]] = None,
-            filters: List[PropertyFilter] = None
-    ):
-        pass
+            properties: Optional[List[str]] = None,
+            order_by: Optional[List[Tuple[str, OrderTerm]]] = None,
+            filters: Optional[List[PropertyFilter]] = None,
+            page_size: Optional[int] = None,
+    ) -> Generator["Object", None, None]:
+        """
+        Lists the objects of this type. Objects are streamed page by page, fetching the next page in the background
+        while the current one is consumed, so that memory use does not grow with the number of objects.
+
+        Args:
+            properties: The properties to return, all properties if not specified.
+            order_by: Pairs of property and :class:`OrderTerm` to sort by.
+            filters: Only objects matching all filters are returned. Filters are evaluated by the server.
+            page_size: An optional number of objects to fetch per page.
+
+        Returns: A generator over :class:`Object` objects
+        """
+        return _client(self.client).list_objects(
+            self, properties=properties, order_by=order_by, filters=filters, page_size=page_size
+        )
 
     def query(self, query_string: str):
         pass
@@ -125,8 +151,20 @@ class ObjectType:
     def search(self, json_string: str):
         pass
 
-    def object(self, primary_key: str):
-        pass
+    def object(self, primary_key: Any, properties: Optional[List[str]] = None) -> "Object":
+        """
+        Get the object of this type with the specified primary key
+
+        Args:
+            primary_key: The primary key of the object
+            properties: The properties to return, all properties if not specified.
+
+        Returns: An :class:`Object` object
+        """
+        obj = _client(self.client).get_object(self, primary_key, properties=properties)
+        if obj is None:
+            raise ValueError("The specified object does not exist or is not visible to the user.")
+        return obj
 
     def __str__(self):
         return f'ObjectType(api_name="{self.api_name}", primary_key="{self.primary_key}", rid="{self.rid}")'
@@ -147,9 +185,17 @@ class ObjectType:
 
 class Object:
 
-    def __init__(self, rid: ResourceIdentifier, properties: Dict):
+    def __init__(
+            self,
+            rid: Optional[ResourceIdentifier],
+            properties: Dict,
+            object_type: Optional[ObjectType] = None,
+            client: Optional["ObjectsClient"] = None,
+    ):
         self._rid = rid
         self._properties = properties
+        self.object_type = object_type
+        self.client = client
 
     @property
     def rid(self) -> str:
@@ -159,14 +205,75 @@ class Object:
     def properties(self) -> Dict:
         return self._properties
 
+    @property
+    def primary_key(self) -> Any:
+        """Returns the value of the primary key property of the object."""
+        if self.object_type is None:
+            raise ValueError("The object type of the object is not known, so neither is its primary key.")
+        primary_key = self.object_type.primary_key[0]
+        if primary_key not in self._properties:
+            raise ValueError(
+                f"The primary key property {primary_key} was not returned for the object, include it in the requested "
+                "properties."
+            )
+        return self._properties[primary_key]
+
     def list_linked_objects(
         self,
         link_type: str,
-        properties: List[str] = None,
-        order_by: List[tuple[str, OrderTerm]] = None,
-        filters: List[PropertyFilter] = None
-    ):
-        pass
+        properties: Optional[List[str]] = None,
+        order_by: Optional[List[Tuple[str, OrderTerm]]] = None,
+        filters: Optional[List[PropertyFilter]] = None,
+        page_size: Optional[int] = None,
+    ) -> Generator["Object", None, None]:
+        """
+        Lists the objects linked to this object, streamed as by :meth:`ObjectType.list_objects`.
+
+        Args:
+            link_type: The API name of the link type
+            properties: The properties to return, all properties if not specified.
+            order_by: Pairs of property and :class:`OrderTerm` to sort by.
+            filters: Only objects matching all filters are returned. The linked objects endpoint does not support
+                filters, so they are evaluated as objects are received.
+            page_size: An optional number of objects to fetch per page.
+
+        Returns: A generator over the linked :class:`Object` objects
+        """
+        return _client(self.client).list_linked_objects(
+            self, link_type, properties=properties, order_by=order_by, filters=filters, page_size=page_size
+        )
+
+    def linked_object(self, link_type: str, primary_key: Any, properties: Optional[List[str]] = None) -> "Object":
+        """
+        Get the object linked to this object with the specified primary key
+
+        Args:
+            link_type: The API name of the link type
+            primary_key: The primary key of the linked object
+            properties: The properties to return, all properties if not specified.
+
+        Returns: The linked :class:`Object` object
+        """
+        obj = _client(self.client).get_linked_object(self, link_type, primary_key, properties=properties)
+        if obj is None:
+            raise ValueError("The specified linked object does not exist or is not visible to the user.")
+        return obj
+
+    def __str__(self):
+        return f'Object(rid="{self.rid}", properties={self.properties})'
+
+    def __repr__(self):
+        return str(self)
+
+    def __eq__(self, other) -> bool:
+        return other is self or (
+                isinstance(other, Object)
+                and other.rid == self.rid
+                and other.properties == self.properties
+        )
+
 
-    def linked_object(self, link_type: str, primary_key: str):
-        pass
\ No newline at end of file
+def _client(client: Optional["ObjectsClient"]) -> "ObjectsClient":
+    if client is None:
+        raise ValueError("The object type or object is not bound to a client, get it from an ObjectsClient.")
+    return client
@@ -0,0 +1,190 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""asyncio counterpart of the ontology API service stub, sharing its conjure types."""
+
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+from conjure_python_client import ConjureDecoder
+
+from palantir.core.aio import AsyncService
+from palantir.objects.rpc.api import (
+    ListObjectsResponse,
+    ListObjectTypesResponse,
+    ListOntologiesResponse,
+    ObjectType,
+    OntologyObject,
+)
+
+
+class AsyncAPIService(AsyncService):
+    async def list_ontologies(self, auth_header: str) -> ListOntologiesResponse:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _path = "/ontologies"
+
+        async with await self._request(
+            "GET", self._uri + _path, headers=_headers
+        ) as _response:
+            return ConjureDecoder().decode(
+                await _response.json(), ListOntologiesResponse
+            )
+
+    async def list_object_types(
+        self,
+        auth_header: str,
+        ontology_rid: str,
+        page_token: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> ListObjectTypesResponse:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _params: Dict[str, Any] = {
+            "pageToken": page_token,
+            "pageSize": page_size,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "ontology_rid": ontology_rid,
+        }
+
+        _path = "/ontologies/{ontology_rid}/objectTypes"
+        _path = _path.format(**_path_params)
+
+        async with await self._request(
+            "GET", self._uri + _path, params=_params, headers=_headers
+        ) as _response:
+            return ConjureDecoder().decode(
+                await _response.json(), ListObjectTypesResponse
+            )
+
+    async def get_object_type(
+        self, auth_header: str, ontology_rid: str, object_type: str
+    ) -> ObjectType:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "ontology_rid": ontology_rid,
+            "object_type": object_type,
+        }
+
+        _path = "/ontologies/{ontology_rid}/objectTypes/{object_type}"
+        _path = _path.format(**_path_params)
+
+        async with await self._request(
+            "GET", self._uri + _path, headers=_headers
+        ) as _response:
+            return ConjureDecoder().decode(await _response.json(), ObjectType)
+
+    async def list_objects(
+        self,
+        auth_header: str,
+        ontology_rid: str,
+        object_type: str,
+        page_size: Optional[int] = None,
+        page_token: Optional[str] = None,
+        properties: Optional[List[str]] = None,
+        order_by: Optional[str] = None,
+    ) -> ListObjectsResponse:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _params: Dict[str, Any] = {
+            "pageSize": page_size,
+            "pageToken": page_token,
+            "properties": properties,
+            "orderBy": order_by,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "ontology_rid": ontology_rid,
+            "object_type": object_type,
+        }
+
+        _path = "/ontologies/{ontology_rid}/objects/{object_type}"
+        _path = _path.format(**_path_params)
+
+        async with await self._request(
+            "GET", self._uri + _path, params=_params, headers=_headers
+        ) as _response:
+            return ConjureDecoder().decode(await _response.json(), ListObjectsResponse)
+
+    async def search_objects(
+        self,
+        auth_header: str,
+        ontology_rid: str,
+        object_type: str,
+        request: Dict[str, Any],
+    ) -> ListObjectsResponse:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "ontology_rid": ontology_rid,
+            "object_type": object_type,
+        }
+
+        _path = "/ontologies/{ontology_rid}/objects/{object_type}/search"
+        _path = _path.format(**_path_params)
+
+        async with await self._request(
+            "POST", self._uri + _path, headers=_headers, json=request
+        ) as _response:
+            return ConjureDecoder().decode(await _response.json(), ListObjectsResponse)
+
+    async def get_object(
+        self,
+        auth_header: str,
+        ontology_rid: str,
+        object_type: str,
+        primary_key: str,
+        properties: Optional[List[str]] = None,
+    ) -> OntologyObject:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _params: Dict[str, Any] = {
+            "properties": properties,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "ontology_rid": ontology_rid,
+            "object_type": object_type,
+            "primary_key": quote(str(primary_key), safe=""),
+        }
+
+        _path = "/ontologies/{ontology_rid}/objects/{object_type}/{primary_key}"
+        _path = _path.format(**_path_params)
+
+        async with await self._request(
+            "GET", self._uri + _path, params=_params, headers=_headers
+        ) as _response:
+            return ConjureDecoder().decode(await _response.json(), OntologyObject)
@@ -11,6 +11,7 @@
 #  limitations under the License.
 
 from typing import Optional, Dict, Any, List
+from urllib.parse import quote
 
 from conjure_python_client import (
     Service,
@@ -157,6 +158,82 @@ class ListObjectTypesResponse(ConjureBeanType):
         return self._next_page_token
 
 
+class OntologyObject(ConjureBeanType):
+    @classmethod
+    def _fields(cls) -> Dict[str, ConjureFieldDefinition]:
+        return {
+            'rid': ConjureFieldDefinition('rid', OptionalTypeWrapper[str]),
+            'properties': ConjureFieldDefinition('properties', DictType(str, object))
+        }
+
+    __slots__: List[str] = ["_rid", "_properties"]
+
+    def __init__(self, properties: Dict[str, Any], rid: Optional[str] = None):
+        self._rid = rid
+        self._properties = properties
+
+    @property
+    def rid(self) -> Optional[str]:
+        return self._rid
+
+    @property
+    def properties(self) -> Dict[str, Any]:
+        return self._properties
+
+
+class ListObjectsResponse(ConjureBeanType):
+    @classmethod
+    def _fields(cls) -> Dict[str, ConjureFieldDefinition]:
+        return {
+            'data': ConjureFieldDefinition('data', List[OntologyObject]),
+            'next_page_token': ConjureFieldDefinition('nextPageToken', OptionalTypeWrapper[str])
+        }
+
+    __slots__: List[str] = ["_next_page_token", "_data"]
+
+    def __init__(self, data: List[OntologyObject], next_page_token: Optional[str] = None):
+        self._data = data
+        self._next_page_token = next_page_token
+
+    @property
+    def data(self) -> List[OntologyObject]:
+        return self._data
+
+    @property
+    def next_page_token(self) -> Optional[str]:
+        return self._next_page_token
+
+
+class LinkTypeSide(ConjureBeanType):
+    @classmethod
+    def _fields(cls) -> Dict[str, ConjureFieldDefinition]:
+        return {
+            'api_name': ConjureFieldDefinition('apiName', str),
+            'object_type_api_name': ConjureFieldDefinition('objectTypeApiName', str),
+            'cardinality': ConjureFieldDefinition('cardinality', OptionalTypeWrapper[str])
+        }
+
+    __slots__: List[str] = ["_api_name", "_object_type_api_name", "_cardinality"]
+
+    def __init__(self, api_name: str, object_type_api_name: str, cardinality: Optional[str] = None):
+        self._api_name = api_name
+        self._object_type_api_name = object_type_api_name
+        self._cardinality = cardinality
+
+    @property
+    def api_name(self) -> str:
+        return self._api_name
+
+    @property
+    def object_type_api_name(self) -> str:
+        """The API name of the object type on the other side of the link."""
+        return self._object_type_api_name
+
+    @property
+    def cardinality(self) -> Optional[str]:
+        return self._cardinality
+
+
 class APIService(Service):
     def list_ontologies(
             self, auth_header: str,
@@ -181,7 +258,7 @@ class APIService(Service):
         return _decoder.decode(_response.json(), ListOntologiesResponse)
 
     def list_object_types(
-        self, auth_header: str, ontology_rid: str, page_token: str = None
+        self, auth_header: str, ontology_rid: str, page_token: Optional[str] = None, page_size: Optional[int] = None
     ) -> "Optional[ListObjectTypesResponse]":
         _headers: Dict[str, Any] = {
             "Accept": "application/json",
@@ -190,7 +267,8 @@ class APIService(Service):
         }
 
         _params: Dict[str, Any] = {
-            "pageToken": page_token
+            "pageToken": page_token,
+            "pageSize": page_size
         }
         _path_params: Dict[str, Any] = {
             "ontology_rid": ontology_rid
@@ -233,3 +311,201 @@ class APIService(Service):
         _decoder = ConjureDecoder()
         return _decoder.decode(_response.json(), ObjectType)
 
+    def list_objects(
+        self,
+        auth_header: str,
+        ontology_rid: str,
+        object_type: str,
+        page_size: Optional[int] = None,
+        page_token: Optional[str] = None,
+        properties: Optional[List[str]] = None,
+        order_by: Optional[str] = None,
+    ) -> ListObjectsResponse:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _params: Dict[str, Any] = {
+            "pageSize": page_size,
+            "pageToken": page_token,
+            "properties": properties,
+            "orderBy": order_by,
+        }
+        _path_params: Dict[str, Any] = {
+            "ontology_rid": ontology_rid,
+            "object_type": object_type,
+        }
+
+        _path = "/ontologies/{ontology_rid}/objects/{object_type}"
+        _path = _path.format(**_path_params)
+
+        _response = self._request(
+            "GET", self._uri + _path, params=_params, headers=_headers
+        )
+
+        _decoder = ConjureDecoder()
+        return _decoder.decode(_response.json(), ListObjectsResponse)
+
+    def search_objects(
+        self,
+        auth_header: str,
+        ontology_rid: str,
+        object_type: str,
+        request: Dict[str, Any],
+    ) -> ListObjectsResponse:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "ontology_rid": ontology_rid,
+            "object_type": object_type,
+        }
+
+        _path = "/ontologies/{ontology_rid}/objects/{object_type}/search"
+        _path = _path.format(**_path_params)
+
+        _response = self._request(
+            "POST", self._uri + _path, headers=_headers, json=request
+        )
+
+        _decoder = ConjureDecoder()
+        return _decoder.decode(_response.json(), ListObjectsResponse)
+
+    def get_object(
+        self,
+        auth_header: str,
+        ontology_rid: str,
+        object_type: str,
+        primary_key: str,
+        properties: Optional[List[str]] = None,
+    ) -> OntologyObject:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _params: Dict[str, Any] = {
+            "properties": properties,
+        }
+        _path_params: Dict[str, Any] = {
+            "ontology_rid": ontology_rid,
+            "object_type": object_type,
+            "primary_key": quote(str(primary_key), safe=""),
+        }
+
+        _path = "/ontologies/{ontology_rid}/objects/{object_type}/{primary_key}"
+        _path = _path.format(**_path_params)
+
+        _response = self._request(
+            "GET", self._uri + _path, params=_params, headers=_headers
+        )
+
+        _decoder = ConjureDecoder()
+        return _decoder.decode(_response.json(), OntologyObject)
+
+    def list_linked_objects(
+        self,
+        auth_header: str,
+        ontology_rid: str,
+        object_type: str,
+        primary_key: str,
+        link_type: str,
+        page_size: Optional[int] = None,
+        page_token: Optional[str] = None,
+        properties: Optional[List[str]] = None,
+        order_by: Optional[str] = None,
+    ) -> ListObjectsResponse:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _params: Dict[str, Any] = {
+            "pageSize": page_size,
+            "pageToken": page_token,
+            "properties": properties,
+            "orderBy": order_by,
+        }
+        _path_params: Dict[str, Any] = {
+            "ontology_rid": ontology_rid,
+            "object_type": object_type,
+            "primary_key": quote(str(primary_key), safe=""),
+            "link_type": link_type,
+        }
+
+        _path = "/ontologies/{ontology_rid}/objects/{object_type}/{primary_key}/links/{link_type}"
+        _path = _path.format(**_path_params)
+
+        _response = self._request(
+            "GET", self._uri + _path, params=_params, headers=_headers
+        )
+
+        _decoder = ConjureDecoder()
+        return _decoder.decode(_response.json(), ListObjectsResponse)
+
+    def get_linked_object(
+        self,
+        auth_header: str,
+        ontology_rid: str,
+        object_type: str,
+        primary_key: str,
+        link_type: str,
+        linked_object_primary_key: str,
+        properties: Optional[List[str]] = None,
+    ) -> OntologyObject:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _params: Dict[str, Any] = {
+            "properties": properties,
+        }
+        _path_params: Dict[str, Any] = {
+            "ontology_rid": ontology_rid,
+            "object_type": object_type,
+            "primary_key": quote(str(primary_key), safe=""),
+            "link_type": link_type,
+            "linked_object_primary_key": quote(str(linked_object_primary_key), safe=""),
+        }
+
+        _path = (
+            "/ontologies/{ontology_rid}/objects/{object_type}/{primary_key}/links/{link_type}/"
+            "{linked_object_primary_key}"
+        )
+        _path = _path.format(**_path_params)
+
+        _response = self._request(
+            "GET", self._uri + _path, params=_params, headers=_headers
+        )
+
+        _decoder = ConjureDecoder()
+        return _decoder.decode(_response.json(), OntologyObject)
+
+    def get_outgoing_link_type(
+        self, auth_header: str, ontology_rid: str, object_type: str, link_type: str
+    ) -> LinkTypeSide:
+        _headers: Dict[str, Any] = {
+            "Accept": "application/json",
+            "Authorization": auth_header,
+        }
+
+        _path_params: Dict[str, Any] = {
+            "ontology_rid": ontology_rid,
+            "object_type": object_type,
+            "link_type": link_type,
+        }
+
+        _path = "/ontologies/{ontology_rid}/objectTypes/{object_type}/outgoingLinkTypes/{link_type}"
+        _path = _path.format(**_path_params)
+
+        _response = self._request(
+            "GET", self._uri + _path, headers=_headers
+        )
+
+        _decoder = ConjureDecoder()
+        return _decoder.decode(_response.json(), LinkTypeSide)
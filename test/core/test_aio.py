@@ -0,0 +1,116 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from conjure_python_client import ServiceConfiguration
+from expects import expect, equal, raise_error, be
+
+from palantir.core.aio import AsyncConjureClient, AsyncService, poll_until
+from palantir.core.rpc import get_user_agent
+
+
+class EchoService(AsyncService):
+    async def echo(self, params):
+        async with await self._request(
+            "GET", self._uri + "/echo", params=params
+        ) as response:
+            return await response.json()
+
+
+def _run(handler, test):
+    async def main():
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handler)
+        async with TestServer(app) as server:
+            service_config = ServiceConfiguration()
+            service_config.backoff_slot_size = 1
+            async with AsyncConjureClient(service_config=service_config) as client:
+                return await test(client, str(server.make_url("")))
+
+    return asyncio.run(main())
+
+
+class TestAsyncConjureClient:
+    def test_request(self):
+        async def handler(request):
+            return web.json_response(
+                {
+                    "query": sorted(request.query.items()),
+                    "user_agent": request.headers["User-Agent"],
+                }
+            )
+
+        async def test(client, uri):
+            service = client.service(EchoService, uri)
+            expect(client.service(EchoService, uri)).to(be(service))
+            return await service.echo({"a": None, "b": True, "c": ["x", "y"]})
+
+        expect(_run(handler, test)).to(
+            equal(
+                {
+                    "query": [["b", "True"], ["c", "x"], ["c", "y"]],
+                    "user_agent": get_user_agent(),
+                }
+            )
+        )
+
+    def test_retries_unavailable(self):
+        attempts = []
+
+        async def handler(_request):
+            attempts.append(1)
+            if len(attempts) < 3:
+                return web.Response(status=503)
+            return web.json_response({})
+
+        async def test(client, uri):
+            return await client.service(EchoService, uri).echo({})
+
+        expect(_run(handler, test)).to(equal({}))
+        expect(len(attempts)).to(equal(3))
+
+    def test_raises_errors(self):
+        async def handler(_request):
+            return web.Response(status=404, text="not found")
+
+        async def test(client, uri):
+            try:
+                await client.service(EchoService, uri).echo({})
+            except aiohttp.ClientResponseError as error:
+                return error.status, error.message
+            return None
+
+        expect(_run(handler, test)).to(equal((404, "Not Found: not found")))
+
+
+class TestPollUntil:
+    def test_polls_until_truthy(self):
+        results = iter([None, False, "done"])
+
+        async def poll():
+            return next(results)
+
+        expect(asyncio.run(poll_until(poll, initial_delay=0.001))).to(equal("done"))
+
+    def test_times_out(self):
+        async def poll():
+            return False
+
+        expect(
+            lambda: asyncio.run(poll_until(poll, initial_delay=0.01, timeout=0.03))
+        ).to(raise_error(TimeoutError))
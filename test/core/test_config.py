@@ -12,9 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 from unittest import mock
+from urllib.parse import parse_qs
 
 from expects import expect, equal, be_a, raise_error, be_none
 
@@ -30,6 +35,9 @@ from palantir.core.config import (
     StaticTokenProvider,
     ConfigFileTokenProvider,
     TokenProviderChain,
+    ClientCredentialsGrant,
+    ExpiringToken,
+    RefreshingTokenProvider,
 )
 
 
@@ -71,6 +79,27 @@ class TestConfigLoader:
             )
         )
 
+    def test_load_config_caches_file(self, tmp_path):
+        path = tmp_path / "config"
+        path.write_text('[default]\nhostname = "first"\n')
+        config_loader = ConfigLoader(path=path, refresh_interval=3600)
+        expect(config_loader.load_config().hostname).to(equal("first"))
+
+        path.write_text('[default]\nhostname = "second"\n')
+        expect(config_loader.load_config().hostname).to(equal("first"))
+
+    def test_load_config_reloads_changed_file(self, tmp_path):
+        path = tmp_path / "config"
+        path.write_text('[default]\nhostname = "first"\n')
+        config_loader = ConfigLoader(path=path, refresh_interval=0)
+        expect(config_loader.load_config().hostname).to(equal("first"))
+
+        path.write_text('[default]\nhostname = "second-host"\n')
+        expect(config_loader.load_config().hostname).to(equal("second-host"))
+
+        path.unlink()
+        expect(lambda: config_loader.load_config()).to(raise_error(FileNotFoundError))
+
 
 class TestStaticHostnameProvider:
     def test_get(self):
@@ -248,3 +277,129 @@ class TestTokenProviderChain:
         expect(lambda: provider.get()).to(
             raise_error(ValueError, "No configured hostname found.")
         )
+
+
+class TestRefreshingTokenProvider:
+    def test_renews_in_background(self):
+        threads = []
+
+        def refresh():
+            threads.append(threading.current_thread())
+            return ExpiringToken(AuthToken(f"token-{len(threads)}"), expires_in=0.2)
+
+        provider = RefreshingTokenProvider(
+            refresh, refresh_margin=0.15, min_refresh_interval=0.05
+        )
+        try:
+            expect(provider.get()).to(equal("token-1"))
+            time.sleep(0.3)
+            expect(provider.get()).not_to(equal("token-1"))
+            expect(threads[0]).to(equal(threading.current_thread()))
+            expect(threading.current_thread() in threads[1:]).to(equal(False))
+        finally:
+            provider.close()
+
+    def test_does_not_renew_tokens_without_expiry(self):
+        calls = []
+
+        def refresh():
+            calls.append(None)
+            return ExpiringToken(AuthToken("token"))
+
+        provider = RefreshingTokenProvider(refresh)
+        try:
+            expect(provider.get()).to(equal("token"))
+            expect(provider.get()).to(equal("token"))
+            expect(len(calls)).to(equal(1))
+        finally:
+            provider.close()
+
+    def test_renews_expired_token_on_get(self):
+        tokens = iter(
+            [
+                ExpiringToken(AuthToken("expired"), expires_in=0),
+                ExpiringToken(AuthToken("valid"), expires_in=3600),
+            ]
+        )
+        provider = RefreshingTokenProvider(lambda: next(tokens), retry_interval=3600)
+        provider.close()
+
+        expect(provider.get()).to(equal("expired"))
+        expect(provider.get()).to(equal("valid"))
+
+    def test_does_not_cache_tokens_without_lifetime(self):
+        calls = []
+
+        def refresh():
+            calls.append(None)
+            return ExpiringToken(AuthToken(f"token-{len(calls)}"), expires_in=0)
+
+        provider = RefreshingTokenProvider(refresh, min_refresh_interval=0.05)
+        try:
+            with mock.patch("palantir.core.config._logger") as logger:
+                expect(provider.get()).to(equal("token-1"))
+                time.sleep(0.2)
+                # renewed by each call to get only, not by the background thread
+                expect(len(calls)).to(equal(1))
+                expect(provider.get()).to(equal("token-2"))
+                expect(logger.warning.call_count).to(equal(1))
+        finally:
+            provider.close()
+
+    def test_renews_short_lived_tokens_at_most_every_min_refresh_interval(self):
+        calls = []
+
+        def refresh():
+            calls.append(None)
+            return ExpiringToken(AuthToken("token"), expires_in=0.001)
+
+        provider = RefreshingTokenProvider(refresh, min_refresh_interval=0.1)
+        try:
+            provider.get()
+            time.sleep(0.25)
+            expect(len(calls) <= 3).to(equal(True))
+        finally:
+            provider.close()
+
+
+class _TokenHandler(BaseHTTPRequestHandler):
+    def do_POST(self):  # pylint: disable=invalid-name
+        form = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode())
+        if form["client_secret"] != ["secret"]:
+            self.send_response(401)
+            self.end_headers()
+            return
+        body = json.dumps(
+            {
+                "access_token": f"token-for-{form['client_id'][0]}",
+                "expires_in": 3600,
+                "scope": form["scope"][0],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class TestClientCredentialsGrant:
+    def test_acquires_token(self):
+        server = HTTPServer(("127.0.0.1", 0), _TokenHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            grant = ClientCredentialsGrant(
+                f"http://127.0.0.1:{server.server_address[1]}/oauth2/token",
+                client_id="client",
+                client_secret="secret",
+                scopes=["api:read-data"],
+            )
+            expect(grant()).to(
+                equal(ExpiringToken(AuthToken("token-for-client"), expires_in=3600))
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,109 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from expects import expect, be, equal, be_a
+from conjure_python_client import Service, ServiceConfiguration
+
+from palantir.core.config import StaticHostnameProvider, StaticTokenProvider, AuthToken
+from palantir.core.rpc import (
+    ConjureClient,
+    ConnectionPoolConfiguration,
+    _PooledHTTPAdapter,
+    get_user_agent,
+)
+from palantir.core.types import PalantirContext
+
+
+class CatalogService(Service):
+    pass
+
+
+class SchemaService(Service):
+    pass
+
+
+class TestConjureClient:
+    def test_services_share_session(self):
+        client = ConjureClient()
+        catalog = client.service(CatalogService, "https://host/catalog/api")
+        schema = client.service(SchemaService, "https://host/schema/api")
+
+        expect(catalog._requests_session).to(be(schema._requests_session))
+        expect(catalog._requests_session).to(be(client.session))
+        expect(catalog._uris).to(equal(["https://host/catalog/api"]))
+        expect(schema._uris).to(equal(["https://host/schema/api"]))
+
+    def test_service_stubs_are_reused(self):
+        client = ConjureClient()
+        expect(client.service(CatalogService, "https://host/catalog/api")).to(
+            be(client.service(CatalogService, "https://host/catalog/api"))
+        )
+
+    def test_pool_configuration(self):
+        client = ConjureClient(
+            pool_config=ConnectionPoolConfiguration(
+                pool_connections=3, pool_maxsize=7, pool_block=True, keep_alive=False
+            ),
+            service_config=ServiceConfiguration(connect_timeout=1, read_timeout=2),
+        )
+        adapter = client.session.get_adapter("https://host/catalog/api")
+        expect(adapter).to(be_a(_PooledHTTPAdapter))
+        expect(adapter.poolmanager.connection_pool_kw["maxsize"]).to(equal(7))
+        expect(adapter.poolmanager.connection_pool_kw["block"]).to(equal(True))
+        expect(adapter.socket_keep_alive).to(equal(False))
+        expect(client.session.headers["User-Agent"]).to(equal(get_user_agent()))
+
+        catalog = client.service(CatalogService, "https://host/catalog/api")
+        expect(catalog._connect_timeout).to(equal(1))
+        expect(catalog._read_timeout).to(equal(2))
+
+    def test_retries(self):
+        client = ConjureClient(
+            service_config=ServiceConfiguration(
+                max_num_retries=2, backoff_slot_size=250
+            )
+        )
+        retry = client.session.get_adapter("https://host/catalog/api").max_retries
+        expect(retry.total).to(equal(2))
+        expect(retry.read).to(equal(0))
+        expect(retry.is_retry("POST", 503)).to(equal(True))
+        expect(retry.is_retry("POST", 500)).to(equal(False))
+
+        retry = retry.increment("POST", "/").increment("POST", "/")
+        for _ in range(10):
+            expect(0 <= retry.get_backoff_time() <= 0.5).to(equal(True))
+
+    def test_close(self):
+        client = ConjureClient()
+        catalog = client.service(CatalogService, "https://host/catalog/api")
+        client.close()
+        expect(client.service(CatalogService, "https://host/catalog/api")).not_to(
+            be(catalog)
+        )
+
+
+class TestPalantirContext:
+    def test_context_owns_conjure_client(self):
+        ctx = PalantirContext(
+            StaticHostnameProvider("host"), StaticTokenProvider(AuthToken("token"))
+        )
+        expect(ctx.conjure_client).to(be_a(ConjureClient))
+
+        client = ConjureClient()
+        ctx = PalantirContext(
+            StaticHostnameProvider("host"),
+            StaticTokenProvider(AuthToken("token")),
+            conjure_client=client,
+        )
+        expect(ctx.conjure_client).to(be(client))
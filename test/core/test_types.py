@@ -12,9 +12,45 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from expects import expect, raise_error, equal, be_none
+import pickle
 
-from palantir.core.types import ResourceIdentifier
+from expects import expect, raise_error, equal, be, be_none
+
+from palantir.core.config import HostnameProvider, StaticTokenProvider
+from palantir.core.types import PalantirContext, ResourceIdentifier
+
+
+class _CountingHostnameProvider(HostnameProvider):
+    def __init__(self):
+        self.calls = 0
+
+    def get(self) -> str:
+        self.calls += 1
+        return "hostname"
+
+
+class TestPalantirContext:
+    def test_resolves_hostname_once(self):
+        provider = _CountingHostnameProvider()
+        ctx = PalantirContext(provider, StaticTokenProvider("token"))
+
+        expect(ctx.hostname).to(equal("hostname"))
+        expect(ctx.hostname).to(equal("hostname"))
+        expect(provider.calls).to(equal(1))
+
+    def test_shared_client(self):
+        ctx = PalantirContext(_CountingHostnameProvider(), StaticTokenProvider("token"))
+        created = []
+
+        def create():
+            created.append(object())
+            return created[-1]
+
+        client = ctx.shared_client("key", create)
+
+        expect(ctx.shared_client("key", create)).to(be(client))
+        expect(ctx.shared_client("other", create)).not_to(be(client))
+        expect(len(created)).to(equal(2))
 
 
 class TestResourceIdentifier:
@@ -45,3 +81,17 @@ class TestResourceIdentifier:
     def test_str(self):
         raw = "ri.foundry.main.dataset.00000000-0000-0000-0000-000000000000"
         expect(str(ResourceIdentifier.from_string(raw))).to(equal(raw))
+
+    def test_from_string_is_cached(self):
+        raw = "ri.foundry.main.transaction.00000000-0000-0000-0000-000000000000"
+        expect(ResourceIdentifier.from_string(raw)).to(
+            be(ResourceIdentifier.from_string(raw))
+        )
+
+    def test_pickle(self):
+        rid = ResourceIdentifier.from_string("ri.foundry.main.dataset.0")
+        str(rid)
+        unpickled = pickle.loads(pickle.dumps(rid))
+        expect(unpickled).to(equal(rid))
+        expect(hash(unpickled)).to(equal(hash(rid)))
+        expect(str(unpickled)).to(equal("ri.foundry.main.dataset.0"))
@@ -0,0 +1,170 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import threading
+import time
+
+import pytest
+from expects import expect, equal, raise_error
+
+from palantir.core.util import CacheStats, TTLCache, page_results, poll_until
+
+
+def _pages(count):
+    """Returns a supplier of `count` pages of two values, each page holding the token of the next one."""
+    calls = []
+
+    def supplier(token):
+        calls.append(token)
+        index = 0 if token is None else int(token)
+        next_token = str(index + 1) if index + 1 < count else None
+        return [index * 2, index * 2 + 1], next_token
+
+    return supplier, calls
+
+
+class TestPageResults:
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_pages(self, prefetch):
+        supplier, calls = _pages(3)
+
+        values = page_results(
+            values_extractor=lambda page: page[0],
+            token_extractor=lambda page: page[1],
+            page_supplier=supplier,
+            prefetch=prefetch,
+        )
+
+        expect(list(values)).to(equal([0, 1, 2, 3, 4, 5]))
+        expect(calls).to(equal([None, "1", "2"]))
+
+    def test_many_pages(self):
+        supplier, _ = _pages(5000)
+
+        values = page_results(
+            values_extractor=lambda page: page[0],
+            token_extractor=lambda page: page[1],
+            page_supplier=supplier,
+        )
+
+        expect(sum(1 for _ in values)).to(equal(10000))
+
+    def test_prefetches_next_page(self):
+        fetched = threading.Event()
+
+        def supplier(token):
+            if token is not None:
+                fetched.set()
+            return ["value"], None if token else "next"
+
+        values = page_results(
+            values_extractor=lambda page: page[0],
+            token_extractor=lambda page: page[1],
+            page_supplier=supplier,
+            prefetch=True,
+        )
+
+        expect(next(values)).to(equal("value"))
+        # the second page is requested while the first value is being consumed
+        expect(fetched.wait(timeout=5)).to(equal(True))
+        expect(list(values)).to(equal(["value"]))
+
+    def test_prefetch_raises_errors(self):
+        def supplier(token):
+            if token is not None:
+                raise ValueError("failed")
+            return ["value"], "next"
+
+        values = page_results(
+            values_extractor=lambda page: page[0],
+            token_extractor=lambda page: page[1],
+            page_supplier=supplier,
+            prefetch=True,
+        )
+
+        expect(next(values)).to(equal("value"))
+        expect(lambda: next(values)).to(raise_error(ValueError, "failed"))
+
+
+class TestPollUntil:
+    def test_backs_off_exponentially(self, monkeypatch):
+        delays = []
+        monkeypatch.setattr(time, "sleep", delays.append)
+        results = iter([None, None, None, None, "done"])
+
+        expect(poll_until(lambda: next(results), initial_delay=1, max_delay=5)).to(
+            equal("done")
+        )
+        expect(delays).to(equal([1, 2, 4, 5]))
+
+    def test_returns_immediately(self):
+        expect(poll_until(lambda: True, initial_delay=10)).to(equal(True))
+
+    def test_times_out(self):
+        expect(lambda: poll_until(lambda: False, initial_delay=0.01, timeout=0.05)).to(
+            raise_error(TimeoutError)
+        )
+
+
+class TestTTLCache:
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=None)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        expect(cache.get("a")).to(equal(1))
+        cache.put("c", 3)
+
+        expect(cache.get("b")).to(equal(None))
+        expect(cache.get("a")).to(equal(1))
+        expect(cache.get("c")).to(equal(3))
+        expect(cache.stats()).to(
+            equal(CacheStats(hits=3, misses=1, evictions=1, entries=2, size=2))
+        )
+
+    def test_expires_entries(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        cache = TTLCache(ttl=10)
+        cache.put("a", 1)
+
+        now[0] = 9.9
+        expect(cache.get("a")).to(equal(1))
+        now[0] = 10.0
+        expect(cache.get("a")).to(equal(None))
+        expect(len(cache)).to(equal(0))
+
+    def test_get_or_load(self):
+        loads = []
+        cache = TTLCache()
+
+        def load():
+            loads.append(None)
+            return "value"
+
+        expect(cache.get_or_load("a", load)).to(equal("value"))
+        expect(cache.get_or_load("a", load)).to(equal("value"))
+        expect(len(loads)).to(equal(1))
+        expect(cache.stats().hit_rate).to(equal(0.5))
+
+    def test_invalidate(self):
+        cache = TTLCache()
+        cache.put(("a", 1), 1)
+        cache.put(("b", 1), 2)
+
+        cache.invalidate(lambda key: key[0] == "a")
+        expect(cache.get(("a", 1))).to(equal(None))
+        expect(cache.get(("b", 1))).to(equal(2))
+
+        cache.invalidate()
+        expect(len(cache)).to(equal(0))
@@ -0,0 +1,115 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from mockito import mock, when
+
+from palantir.core.config import StaticTokenProvider, StaticHostnameProvider, AuthToken
+from palantir.core.types import ResourceIdentifier, PalantirContext
+from palantir.datasets.client import DatasetsClient, DatasetServices
+from palantir.datasets.core import Dataset
+from palantir.datasets.rpc.catalog import (
+    Dataset as ConjureDataset,
+    Transaction as ConjureTransaction,
+    TransactionStatus as ConjureTransactionStatus,
+    Branch,
+    CatalogService,
+    TransactionRange,
+    TransactionType as ConjureTransactionType,
+)
+from palantir.datasets.rpc.data_proxy import (
+    DataProxyConcatenationService,
+    DataProxyService,
+)
+from palantir.datasets.rpc.path import PathService
+from palantir.datasets.rpc.schema import SchemaService
+from palantir.datasets.rpc.sql import SqlQueryService
+from palantir.datasets.types import DatasetLocator
+
+
+class DatasetsClientMocks:
+    """Sets up a :class:`DatasetsClient` backed by mocked conjure services."""
+
+    AUTH_HEADER: str = "auth-header"
+    DATASET_RID: ResourceIdentifier = ResourceIdentifier.from_string(
+        "ri.foundry.main.dataset.0"
+    )
+    BRANCH_ID: str = "branch-id"
+    END_TRANSACTION_RID: ResourceIdentifier = ResourceIdentifier.from_string(
+        "ri.foundry.main.transaction.2"
+    )
+    START_TRANSACTION_RID: ResourceIdentifier = ResourceIdentifier.from_string(
+        "ri.foundry.main.transaction.1"
+    )
+    LOCATOR: DatasetLocator = DatasetLocator(
+        rid=DATASET_RID,
+        branch_id=BRANCH_ID,
+        start_transaction_rid=START_TRANSACTION_RID,
+        end_transaction_rid=END_TRANSACTION_RID,
+    )
+
+    @pytest.fixture(autouse=True)
+    def before(self):
+        self.catalog_service: CatalogService = mock(CatalogService)
+        self.data_proxy_service: DataProxyService = mock(DataProxyService)
+        self.data_proxy_concatenation_service: DataProxyConcatenationService = mock(
+            DataProxyConcatenationService
+        )
+        self.sql_query_service: SqlQueryService = mock(SqlQueryService)
+        self.path_service: PathService = mock(PathService)
+        self.schema_service: SchemaService = mock(SchemaService)
+        services: DatasetServices = mock(DatasetServices)
+        services.catalog_service = self.catalog_service  # noqa
+        services.data_proxy_service = self.data_proxy_service  # noqa
+        services.data_proxy_concatenation_service = (  # noqa
+            self.data_proxy_concatenation_service
+        )
+        services.sql_query_service = self.sql_query_service  # noqa
+        services.path_service = self.path_service  # noqa
+        services.schema_service = self.schema_service  # noqa
+        ctx: PalantirContext = PalantirContext(
+            StaticHostnameProvider("unused"),
+            StaticTokenProvider(AuthToken(self.AUTH_HEADER)),
+        )
+        services.ctx = ctx
+        self.client: DatasetsClient = DatasetsClient(services)
+
+        self.conjure_dataset: ConjureDataset = mock(ConjureDataset)
+        self.conjure_dataset.rid = self.DATASET_RID  # noqa
+        self.branch: Branch = mock(Branch)
+        self.branch.rid = self.BRANCH_ID  # noqa
+
+        self.txn: ConjureTransaction = mock(ConjureTransaction)
+        self.txn.rid = str(self.END_TRANSACTION_RID)  # noqa
+        self.txn.status = ConjureTransactionStatus.OPEN  # noqa
+        self.txn.type = ConjureTransactionType.APPEND  # noqa
+
+        self.locator: DatasetLocator = DatasetLocator(
+            rid=self.DATASET_RID,
+            branch_id=self.BRANCH_ID,
+            start_transaction_rid=self.START_TRANSACTION_RID,
+            end_transaction_rid=self.END_TRANSACTION_RID,
+        )
+        self.dataset: Dataset = Dataset(self.client, self.locator)
+
+        when(self.catalog_service).get_dataset_view_range2(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            end_ref=self.BRANCH_ID,
+            include_open_exclusive_transaction=False,
+        ).thenReturn(
+            TransactionRange(
+                str(self.END_TRANSACTION_RID), str(self.START_TRANSACTION_RID)
+            )
+        )
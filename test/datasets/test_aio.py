@@ -0,0 +1,415 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+
+import aiohttp
+import pandas as pd
+import pyarrow as pa
+import pytest
+from expects import expect, equal, raise_error
+from mockito import mock, when, verify
+
+from palantir.core.config import StaticTokenProvider, StaticHostnameProvider, AuthToken
+from palantir.core.types import PalantirContext, ResourceIdentifier
+from palantir.datasets.aio import (
+    AsyncDataset,
+    AsyncDatasetServices,
+    AsyncDatasetsClient,
+    AsyncFile,
+)
+from palantir.datasets.errors import TransactionAbortedError
+from palantir.datasets.rpc.aio import (
+    AsyncCatalogService,
+    AsyncDataProxyConcatenationService,
+    AsyncDataProxyService,
+    AsyncSqlQueryService,
+)
+from palantir.datasets.rpc.catalog import (
+    FileMetadata,
+    FileResource,
+    FileResourcesPage,
+    Transaction as ConjureTransaction,
+    TransactionStatus as ConjureTransactionStatus,
+    TransactionType as ConjureTransactionType,
+)
+from palantir.datasets.rpc.data_proxy import (
+    ConcatenationTaskQueued,
+    ConcatenationTaskStatus,
+    ConcatenationTaskStatusReport,
+    ConcatenationTaskSuccess,
+    StartConcatenationTaskRequest,
+    StartConcatenationTaskResponse,
+)
+from palantir.datasets.rpc.sql import (
+    QueryStatus,
+    ReadyQueryStatus,
+    RunningQueryStatus,
+    SqlExecuteResponse,
+    SqlGetStatusResponse,
+)
+from palantir.datasets.types import (
+    DatasetLocator,
+    FileLocator,
+    TransactionStatus,
+    TransactionType,
+    UploadConfig,
+)
+
+
+def _returning(*values):
+    """Answers each call with the next value, repeating the last one."""
+    results = list(values)
+
+    async def answer(*_args, **_kwargs):
+        return results.pop(0) if len(results) > 1 else results[0]
+
+    return answer
+
+
+class _FakeContent:
+    """Serves a body in small chunks, as a response body is received."""
+
+    def __init__(self, content: bytes):
+        self._content = content
+
+    async def read(self, n: int = -1) -> bytes:
+        data = self._content[: min(n, 5)] if n >= 0 else self._content
+        self._content = self._content[len(data) :]
+        return data
+
+    async def readexactly(self, n: int) -> bytes:
+        data = self._content[:n]
+        self._content = self._content[n:]
+        return data
+
+
+class _FakeResponse:
+    def __init__(self, content: bytes):
+        self._content = content
+        self.content = _FakeContent(content)
+
+    async def read(self) -> bytes:
+        return self._content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+def _get_file(path: str) -> FileResource:
+    return FileResource(
+        is_open=False,
+        logical_path=path,
+        physical_path="unused",
+        time_modified="2020-01-01",
+        transaction_rid="ri.foundry.main.transaction.2",
+        file_metadata=FileMetadata(10),
+    )
+
+
+class TestAsyncDatasetsClient:
+    AUTH_HEADER = "auth-header"
+    DATASET_RID = ResourceIdentifier.from_string("ri.foundry.main.dataset.0")
+    END_TRANSACTION_RID = ResourceIdentifier.from_string(
+        "ri.foundry.main.transaction.2"
+    )
+
+    @pytest.fixture(autouse=True)
+    def before(self):
+        self.catalog_service = mock(AsyncCatalogService)
+        self.data_proxy_service = mock(AsyncDataProxyService)
+        self.data_proxy_concatenation_service = mock(AsyncDataProxyConcatenationService)
+        self.sql_query_service = mock(AsyncSqlQueryService)
+        services = mock(AsyncDatasetServices)
+        services.catalog_service = self.catalog_service  # noqa
+        services.data_proxy_service = self.data_proxy_service  # noqa
+        services.data_proxy_concatenation_service = (  # noqa
+            self.data_proxy_concatenation_service
+        )
+        services.sql_query_service = self.sql_query_service  # noqa
+        services.ctx = PalantirContext(  # noqa
+            StaticHostnameProvider("unused"),
+            StaticTokenProvider(AuthToken(self.AUTH_HEADER)),
+        )
+        self.services = services
+        self.client = AsyncDatasetsClient(services)
+        self.dataset = AsyncDataset(
+            self.client,
+            DatasetLocator(
+                rid=self.DATASET_RID,
+                branch_id="master",
+                end_transaction_rid=self.END_TRANSACTION_RID,
+            ),
+        )
+
+    def test_list_files(self):
+        when(self.catalog_service).get_dataset_view_files2(...).thenAnswer(
+            _returning(
+                FileResourcesPage(
+                    values=[_get_file("one"), _get_file("two")],
+                    next_page_token="two",
+                ),
+                FileResourcesPage(values=[_get_file("three")]),
+            )
+        )
+
+        async def list_files():
+            return [file async for file in self.dataset.list_files()]
+
+        files = asyncio.run(list_files())
+
+        expect([file.path for file in files]).to(equal(["one", "two", "three"]))
+        expect(files[0]).to(
+            equal(
+                AsyncFile(
+                    self.dataset,
+                    "one",
+                    self.client,
+                    transaction_rid=self.END_TRANSACTION_RID,
+                )
+            )
+        )
+
+    def test_read_file(self):
+        when(self.data_proxy_service).get_file_in_view(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            end_ref="master",
+            logical_path="path",
+            start_transaction_rid=None,
+        ).thenAnswer(_returning(_FakeResponse(b"content")))
+
+        expect(asyncio.run(self.dataset.file("path").read())).to(equal(b"content"))
+
+    def test_transaction(self):
+        txn = mock(ConjureTransaction)
+        txn.rid = str(self.END_TRANSACTION_RID)  # noqa
+        txn.status = ConjureTransactionStatus.OPEN  # noqa
+        txn.type = ConjureTransactionType.SNAPSHOT  # noqa
+        when(self.catalog_service).start_transaction(...).thenAnswer(_returning(txn))
+        when(self.catalog_service).set_transaction_type(...).thenAnswer(_returning(txn))
+        when(self.data_proxy_service).put_file(...).thenAnswer(_returning(None))
+        when(self.catalog_service).commit_transaction(...).thenAnswer(_returning(None))
+        when(self.catalog_service).abort_transaction(...).thenAnswer(_returning(None))
+
+        async def write():
+            async with await self.dataset.start_transaction("snapshot") as txn:
+                await txn.write("path", b"content")
+            return txn
+
+        committed = asyncio.run(write())
+
+        expect(committed.status).to(equal(TransactionStatus.COMMITTED))
+        expect(committed.txn_type).to(equal(TransactionType.SNAPSHOT))
+        verify(self.data_proxy_service).put_file(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            logical_path="path",
+            file_data=b"content",
+        )
+
+        async def fail():
+            async with await self.dataset.start_transaction():
+                raise ValueError()
+
+        expect(lambda: asyncio.run(fail())).to(raise_error(TransactionAbortedError))
+        verify(self.catalog_service).abort_transaction(...)
+
+    def test_put_file_chunked(self):
+        when(self.data_proxy_service).put_file(...).thenAnswer(_returning(None))
+        when(self.data_proxy_concatenation_service).start_concatenation_task(
+            ...
+        ).thenAnswer(
+            _returning(
+                StartConcatenationTaskResponse(
+                    concatenation_task_id="concatenation-task-id"
+                )
+            )
+        )
+        when(self.data_proxy_concatenation_service).get_concatenation_task_status(
+            ...
+        ).thenAnswer(
+            _returning(
+                ConcatenationTaskStatusReport(
+                    status=ConcatenationTaskStatus(queued=ConcatenationTaskQueued()),
+                    reported_at="reported-at",
+                ),
+                ConcatenationTaskStatusReport(
+                    status=ConcatenationTaskStatus(success=ConcatenationTaskSuccess()),
+                    reported_at="reported-at",
+                ),
+            )
+        )
+
+        async def content():
+            for data in [b"01", b"2345", b"67", b"8"]:
+                yield data
+
+        uploaded = []
+        locator = FileLocator(
+            dataset_rid=self.DATASET_RID,
+            end_ref=str(self.END_TRANSACTION_RID),
+            logical_path="path",
+        )
+        client = AsyncDatasetsClient(
+            self.services, upload_config=UploadConfig(part_size=4)
+        )
+        asyncio.run(client.put_file(locator, content(), uploaded.append))
+
+        for idx, part in enumerate([b"0123", b"4567", b"8"]):
+            verify(self.data_proxy_service).put_file(
+                auth_header=self.AUTH_HEADER,
+                dataset_rid=str(self.DATASET_RID),
+                transaction_rid=str(self.END_TRANSACTION_RID),
+                logical_path=f"path.{idx}",
+                file_data=part,
+            )
+        verify(self.data_proxy_concatenation_service).start_concatenation_task(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            request=StartConcatenationTaskRequest(
+                destination_path="path",
+                source_paths=["path.0", "path.1", "path.2"],
+            ),
+        )
+        verify(
+            self.data_proxy_concatenation_service, times=2
+        ).get_concatenation_task_status(
+            auth_header=self.AUTH_HEADER, concatenation_task_id="concatenation-task-id"
+        )
+        expect(sorted(part.size for part in uploaded)).to(equal([1, 4, 4]))
+
+    def test_put_file_retries_part(self):
+        calls = []
+
+        async def put_file(**kwargs):
+            calls.append(kwargs["logical_path"])
+            if len(calls) == 1:
+                raise aiohttp.ClientResponseError(mock(), (), status=500)
+
+        when(self.data_proxy_service).put_file(...).thenAnswer(put_file)
+        when(self.data_proxy_concatenation_service).start_concatenation_task(
+            ...
+        ).thenAnswer(
+            _returning(
+                StartConcatenationTaskResponse(
+                    concatenation_task_id="concatenation-task-id"
+                )
+            )
+        )
+        when(self.data_proxy_concatenation_service).get_concatenation_task_status(
+            ...
+        ).thenAnswer(
+            _returning(
+                ConcatenationTaskStatusReport(
+                    status=ConcatenationTaskStatus(success=ConcatenationTaskSuccess()),
+                    reported_at="reported-at",
+                )
+            )
+        )
+
+        client = AsyncDatasetsClient(
+            self.services, upload_config=UploadConfig(part_size=4, retry_backoff=0)
+        )
+        uploaded = []
+        asyncio.run(
+            client.put_file(
+                FileLocator(
+                    dataset_rid=self.DATASET_RID,
+                    end_ref=str(self.END_TRANSACTION_RID),
+                    logical_path="path",
+                ),
+                b"01234567",
+                uploaded.append,
+            )
+        )
+
+        expect(sorted(calls)).to(equal(["path.0", "path.0", "path.1"]))
+        expect(max(part.attempts for part in uploaded)).to(equal(2))
+
+    def test_put_file_chunked_stops_after_failed_part(self):
+        async def put_file(**_kwargs):
+            raise aiohttp.ClientResponseError(mock(), (), status=400)
+
+        when(self.data_proxy_service).put_file(...).thenAnswer(put_file)
+
+        read = []
+
+        async def content():
+            for idx in range(100):
+                read.append(idx)
+                yield b"0123"
+
+        client = AsyncDatasetsClient(
+            self.services, upload_config=UploadConfig(part_size=4, max_workers=2)
+        )
+        locator = FileLocator(
+            dataset_rid=self.DATASET_RID,
+            end_ref=str(self.END_TRANSACTION_RID),
+            logical_path="path",
+        )
+
+        expect(lambda: asyncio.run(client.put_file(locator, content()))).to(
+            raise_error(aiohttp.ClientResponseError)
+        )
+        expect(len(read)).to(equal(3))
+        verify(self.data_proxy_service, times=2).put_file(...)
+        verify(self.data_proxy_concatenation_service, times=0).start_concatenation_task(
+            ...
+        )
+
+    def test_read_dataset(self):
+        table = pa.Table.from_pandas(pd.DataFrame([[1, "a"]], columns=["foo", "bar"]))
+        sink = pa.BufferOutputStream()
+        writer = pa.ipc.new_stream(sink=sink, schema=table.schema)
+        writer.write_table(table)
+        writer.close()
+
+        when(self.sql_query_service).execute(...).thenAnswer(
+            _returning(
+                SqlExecuteResponse(
+                    query_id="query-id",
+                    status=QueryStatus(running=RunningQueryStatus()),
+                )
+            )
+        )
+        when(self.sql_query_service).get_status(
+            auth_header=self.AUTH_HEADER, query_id="query-id"
+        ).thenAnswer(
+            _returning(
+                SqlGetStatusResponse(status=QueryStatus(running=RunningQueryStatus())),
+                SqlGetStatusResponse(status=QueryStatus(ready=ReadyQueryStatus())),
+            )
+        )
+        when(self.sql_query_service).get_results(
+            auth_header=self.AUTH_HEADER, query_id="query-id"
+        ).thenAnswer(_returning(_FakeResponse(b"A" + sink.getvalue().to_pybytes())))
+
+        expect(asyncio.run(self.dataset.read_arrow())).to(equal(table))
+
+    def test_write_file_locator(self):
+        expect(self.dataset.file("path").locator()).to(
+            equal(
+                FileLocator(
+                    dataset_rid=self.DATASET_RID,
+                    end_ref="master",
+                    logical_path="path",
+                )
+            )
+        )
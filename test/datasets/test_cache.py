@@ -0,0 +1,118 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+import os
+
+import pytest
+from expects import expect, equal, be_none
+
+from palantir.core.types import ResourceIdentifier
+from palantir.datasets.cache import FileCache
+from palantir.datasets.types import FileLocator
+
+
+class TestFileCache:
+    def test_key(self):
+        locator = FileLocator(
+            dataset_rid=ResourceIdentifier.from_string("ri.foundry.test.dataset.0"),
+            end_ref="ri.foundry.test.transaction.0",
+            logical_path="path",
+        )
+
+        expect(FileCache.key(locator)).to(
+            equal(FileCache.key(FileLocator(**locator.__dict__)))
+        )
+        expect(FileCache.key(locator)).not_to(
+            equal(FileCache.key(locator.with_updated(logical_path="other")))
+        )
+        expect(FileCache.key(locator)).not_to(
+            equal(
+                FileCache.key(
+                    locator.with_updated(
+                        start_transaction_rid="ri.foundry.test.transaction.1"
+                    )
+                )
+            )
+        )
+
+    def test_get_and_put(self, tmp_path):
+        cache = FileCache(tmp_path)
+
+        expect(cache.get("a")).to(be_none)
+        with cache.put("a", io.BytesIO(b"123")) as file:
+            expect(file.read()).to(equal(b"123"))
+        with cache.get("a") as file:
+            expect(file.read()).to(equal(b"123"))
+
+        stats = cache.stats()
+        expect((stats.hits, stats.misses, stats.entries, stats.size)).to(
+            equal((1, 1, 1, 3))
+        )
+        expect(stats.hit_rate).to(equal(0.5))
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = FileCache(tmp_path, max_bytes=6)
+        cache.put("a", io.BytesIO(b"123")).close()
+        cache.put("b", io.BytesIO(b"123")).close()
+        cache.get("a").close()
+        cache.put("c", io.BytesIO(b"123")).close()
+
+        expect(sorted(os.listdir(tmp_path))).to(equal(["a", "c"]))
+        expect(cache.stats().evictions).to(equal(1))
+
+    def test_returns_content_larger_than_cache(self, tmp_path):
+        cache = FileCache(tmp_path, max_bytes=2)
+
+        with cache.put("a", io.BytesIO(b"123")) as file:
+            expect(file.read()).to(equal(b"123"))
+        expect(os.listdir(tmp_path)).to(equal([]))
+
+    def test_removes_interrupted_write(self, tmp_path):
+        class _Interrupted(io.RawIOBase):
+            def readable(self):
+                return True
+
+            def readinto(self, b):
+                raise KeyboardInterrupt
+
+        cache = FileCache(tmp_path)
+
+        with pytest.raises(KeyboardInterrupt):
+            cache.put("a", _Interrupted())
+
+        expect(os.listdir(tmp_path)).to(equal([]))
+        expect(cache.get("a")).to(be_none)
+
+    def test_loads_existing_entries(self, tmp_path):
+        (tmp_path / "old").write_bytes(b"123")
+        os.utime(tmp_path / "old", (0, 0))
+        (tmp_path / "new").write_bytes(b"123")
+        (tmp_path / "partial.tmp").write_bytes(b"1")
+
+        cache = FileCache(tmp_path, max_bytes=3)
+
+        expect(cache.stats().entries).to(equal(1))
+        expect(cache.get("old")).to(be_none)
+        with cache.get("new") as file:
+            expect(file.read()).to(equal(b"123"))
+
+    def test_clear(self, tmp_path):
+        cache = FileCache(tmp_path)
+        cache.put("a", io.BytesIO(b"123")).close()
+
+        cache.clear()
+
+        expect(os.listdir(tmp_path)).to(equal([]))
+        expect(cache.stats().size).to(equal(0))
@@ -13,27 +13,22 @@
 #  limitations under the License.
 
 import io
-
-from os.path import relpath
+from contextlib import closing
+from datetime import timezone
 
 import pandas as pd
 import pyarrow as pa
-import pytest
 import urllib3
+from conjure_python_client import ConjureDecoder
 from dateutil.parser import isoparse
-from expects import expect, equal, raise_error
+from expects import expect, equal, raise_error, be_above
 from mockito import mock, verifyZeroInteractions, when, verify
 
-from palantir.core.config import StaticTokenProvider, StaticHostnameProvider, AuthToken
-from palantir.core.types import ResourceIdentifier, PalantirContext
-from palantir.datasets.client import DatasetsClient, DatasetServices
+from palantir.core.types import ResourceIdentifier
+from palantir.datasets.cache import FileCache
 from palantir.datasets.core import Transaction, File, Dataset
 from palantir.datasets.rpc.catalog import (
-    Dataset as ConjureDataset,
     Transaction as ConjureTransaction,
-    TransactionStatus as ConjureTransactionStatus,
-    Branch,
-    CatalogService,
     TransactionRange,
     FileResource,
     FileMetadata,
@@ -42,21 +37,9 @@ from palantir.datasets.rpc.catalog import (
     TransactionType as ConjureTransactionType,
     CloseTransactionRequest,
 )
-from palantir.datasets.rpc.data_proxy import (
-    DataProxyConcatenationService,
-    DataProxyService,
-    StartConcatenationTaskRequest,
-    StartConcatenationTaskResponse,
-    ConcatenationTaskStatusReport,
-    ConcatenationTaskStatus,
-    ConcatenationTaskQueued,
-    ConcatenationTaskInProgress,
-    ConcatenationTaskSuccess,
-    ConcatenationTaskFailure,
-)
-from palantir.datasets.rpc.path import PathService, DecoratedResource
+from palantir.datasets.rpc.path import DecoratedResource
 from palantir.datasets.rpc.schema import (
-    SchemaService,
+    VersionedFoundrySchema,
     FoundryFieldType,
     FoundryFieldSchema,
     FoundrySchema as ConjureFoundrySchema,
@@ -71,7 +54,6 @@ from palantir.datasets.rpc.sql import (
     SqlExecuteResponse,
     SqlGetStatusResponse,
     SqlQuery,
-    SqlQueryService,
 )
 from palantir.datasets.types import (
     DatasetLocator,
@@ -79,11 +61,17 @@ from palantir.datasets.types import (
     TransactionType,
     TransactionStatus,
     FoundrySchema,
+    QueryConfig,
     Field,
     FileFormat,
     ArrayFieldType,
+    DecimalFieldType,
     LongFieldType,
+    MapFieldType,
+    StringFieldType,
+    StructFieldType,
 )
+from test.datasets.client_mocks import DatasetsClientMocks
 
 FILE_LEN = 10
 FILE_MODIFIED = isoparse("2020-01-01")
@@ -102,81 +90,7 @@ def get_file(path: str) -> FileResource:
 
 
 # pylint: disable=too-many-public-methods
-class TestFoundryClient:
-
-    AUTH_HEADER: str = "auth-header"
-    DATASET_RID: ResourceIdentifier = ResourceIdentifier.from_string(
-        "ri.foundry.main.dataset.0"
-    )
-    BRANCH_ID: str = "branch-id"
-    END_TRANSACTION_RID: ResourceIdentifier = ResourceIdentifier.from_string(
-        "ri.foundry.main.transaction.2"
-    )
-    START_TRANSACTION_RID: ResourceIdentifier = ResourceIdentifier.from_string(
-        "ri.foundry.main.transaction.1"
-    )
-    LOCATOR: DatasetLocator = DatasetLocator(
-        rid=DATASET_RID,
-        branch_id=BRANCH_ID,
-        start_transaction_rid=START_TRANSACTION_RID,
-        end_transaction_rid=END_TRANSACTION_RID,
-    )
-
-    @pytest.fixture(autouse=True)
-    def before(self):
-        self.catalog_service: CatalogService = mock(CatalogService)
-        self.data_proxy_service: DataProxyService = mock(DataProxyService)
-        self.data_proxy_concatenation_service: DataProxyConcatenationService = mock(
-            DataProxyConcatenationService
-        )
-        self.sql_query_service: SqlQueryService = mock(SqlQueryService)
-        self.path_service: PathService = mock(PathService)
-        self.schema_service: SchemaService = mock(SchemaService)
-        services: DatasetServices = mock(DatasetServices)
-        services.catalog_service = self.catalog_service  # noqa
-        services.data_proxy_service = self.data_proxy_service  # noqa
-        services.data_proxy_concatenation_service = (  # noqa
-            self.data_proxy_concatenation_service
-        )
-        services.sql_query_service = self.sql_query_service  # noqa
-        services.path_service = self.path_service  # noqa
-        services.schema_service = self.schema_service  # noqa
-        ctx: PalantirContext = PalantirContext(
-            StaticHostnameProvider("unused"),
-            StaticTokenProvider(AuthToken(self.AUTH_HEADER)),
-        )
-        services.ctx = ctx
-        self.client: DatasetsClient = DatasetsClient(services)
-
-        self.conjure_dataset: ConjureDataset = mock(ConjureDataset)
-        self.conjure_dataset.rid = self.DATASET_RID  # noqa
-        self.branch: Branch = mock(Branch)
-        self.branch.rid = self.BRANCH_ID  # noqa
-
-        self.txn: ConjureTransaction = mock(ConjureTransaction)
-        self.txn.rid = str(self.END_TRANSACTION_RID)  # noqa
-        self.txn.status = ConjureTransactionStatus.OPEN  # noqa
-        self.txn.type = ConjureTransactionType.APPEND  # noqa
-
-        self.locator: DatasetLocator = DatasetLocator(
-            rid=self.DATASET_RID,
-            branch_id=self.BRANCH_ID,
-            start_transaction_rid=self.START_TRANSACTION_RID,
-            end_transaction_rid=self.END_TRANSACTION_RID,
-        )
-        self.dataset: Dataset = Dataset(self.client, self.locator)
-
-        when(self.catalog_service).get_dataset_view_range2(
-            auth_header=self.AUTH_HEADER,
-            dataset_rid=str(self.DATASET_RID),
-            end_ref=self.BRANCH_ID,
-            include_open_exclusive_transaction=False,
-        ).thenReturn(
-            TransactionRange(
-                str(self.END_TRANSACTION_RID), str(self.START_TRANSACTION_RID)
-            )
-        )
-
+class TestFoundryClient(DatasetsClientMocks):
     def test_get_dataset_with_rid(self):
         expect(self.client.get_dataset(str(self.DATASET_RID))).to(
             equal(self.DATASET_RID)
@@ -327,6 +241,64 @@ class TestFoundryClient:
             )
         )
 
+    def test_list_files_grows_page_size(self):
+        page_sizes = []
+
+        def get_dataset_view_files2(page_size, page_start_logical_path, **_kwargs):
+            page_sizes.append(page_size)
+            index = int(page_start_logical_path or 0)
+            return FileResourcesPage(
+                values=[get_file(f"/path/{index}")],
+                next_page_token=str(index + 1) if index < 5 else None,
+            )
+
+        when(self.catalog_service).get_dataset_view_files2(...).thenAnswer(
+            get_dataset_view_files2
+        )
+
+        files = list(self.client.list_files(dataset=self.dataset))
+
+        expect([file.path for file in files]).to(
+            equal([f"/path/{index}" for index in range(6)])
+        )
+        expect(page_sizes).to(equal([100, 200, 400, 800, 1000, 1000]))
+
+    def test_list_files_table(self):
+        when(self.catalog_service).get_dataset_view_files2(...).thenReturn(
+            FileResourcesPage(
+                values=[get_file("/path/one"), get_file("/path/two")],
+            )
+        )
+
+        table = self.client.list_files_table(dataset=self.dataset)
+
+        expect(table.to_pydict()).to(
+            equal(
+                {
+                    "path": ["/path/one", "/path/two"],
+                    "length": [FILE_LEN, FILE_LEN],
+                    "modified": [FILE_MODIFIED.replace(tzinfo=timezone.utc)] * 2,
+                    "transaction_rid": [TRANSACTION_RID] * 2,
+                }
+            )
+        )
+
+    def test_list_files_parses_lazily(self):
+        when(self.catalog_service).get_dataset_view_files2(...).thenReturn(
+            FileResourcesPage(values=[get_file("/path/one")])
+        )
+
+        (file,) = self.client.list_files(dataset=self.dataset)
+
+        expect(file.locator().end_ref).to(equal(TRANSACTION_RID))
+        expect(file._modified).to(
+            equal("2020-01-01")
+        )  # pylint: disable=protected-access
+        expect(file.modified).to(equal(FILE_MODIFIED))
+        expect(file.transaction_rid).to(
+            equal(ResourceIdentifier.from_string(TRANSACTION_RID))
+        )
+
     def test_list_files_without_path(self):
         path = "path"
         when(self.catalog_service).get_dataset_view_files2(
@@ -417,201 +389,142 @@ class TestFoundryClient:
         )
         expect(_bytes.read()).to(equal(binary_content))
 
-    def test_put_file(self):
-        path = "path"
-        binary_content = b"123456"
-        when(self.data_proxy_service).put_file(
+    def test_open_file_streaming(self):
+        when(self.data_proxy_service).get_file_in_view(
             auth_header=self.AUTH_HEADER,
             dataset_rid=str(self.DATASET_RID),
-            transaction_rid=str(self.END_TRANSACTION_RID),
-            logical_path=path,
-            file_data=binary_content,
-        ).thenReturn(None)
-
-        self.client.put_file(
-            locator=FileLocator(
-                dataset_rid=self.DATASET_RID,
-                end_ref=str(self.END_TRANSACTION_RID),
-                logical_path=path,
-                start_transaction_rid=str(self.START_TRANSACTION_RID),
+            end_ref=str(self.END_TRANSACTION_RID),
+            logical_path="path",
+            start_transaction_rid=None,
+        ).thenReturn(io.BytesIO(b"0123456789"))
+
+        chunks = File(
+            dataset=Dataset(
+                self.client,
+                DatasetLocator(
+                    rid=self.DATASET_RID,
+                    branch_id="master",
+                    end_transaction_rid=self.END_TRANSACTION_RID,
+                ),
             ),
-            content=binary_content,
+            path="path",
+            transaction_rid=self.END_TRANSACTION_RID,
+            client=self.client,
+        ).iter_chunks(chunk_size=4)
+
+        expect(list(chunks)).to(equal([b"0123", b"4567", b"89"]))
+
+    def test_iter_chunks_closes_stream_on_early_exit(self):
+        stream = io.BytesIO(b"0123456789")
+        when(self.data_proxy_service).get_file_in_view(...).thenReturn(stream)
+        file = File(
+            dataset=Dataset(
+                self.client,
+                DatasetLocator(
+                    rid=self.DATASET_RID,
+                    branch_id="master",
+                    end_transaction_rid=self.END_TRANSACTION_RID,
+                ),
+            ),
+            path="path",
+            transaction_rid=self.END_TRANSACTION_RID,
+            client=self.client,
         )
 
-        verify(self.data_proxy_service).put_file(
-            auth_header=self.AUTH_HEADER,
-            dataset_rid=str(self.DATASET_RID),
-            transaction_rid=str(self.END_TRANSACTION_RID),
-            logical_path=path,
-            file_data=binary_content,
+        with closing(file.iter_chunks(chunk_size=4)) as chunks:
+            expect(next(chunks)).to(equal(b"0123"))
+        expect(stream.closed).to(equal(True))
+
+        stream = io.BytesIO(b"0123456789")
+        when(self.data_proxy_service).get_file_in_view(...).thenReturn(stream)
+        expect(file.read()).to(equal(b"0123456789"))
+        expect(stream.closed).to(equal(True))
+
+    def test_read_file_cached(self, tmp_path):
+        self.client.file_cache = FileCache(tmp_path)
+        when(self.data_proxy_service).get_file_in_view(...).thenAnswer(
+            lambda **_kwargs: io.BytesIO(b"content")
+        )
+        committed = FileLocator(
+            dataset_rid=self.DATASET_RID,
+            end_ref=str(self.END_TRANSACTION_RID),
+            logical_path="path",
         )
+        on_branch = committed.with_updated(end_ref="master")
 
-    def test_put_file_chunked(self):
-        path = "path"
-        megabyte = 1024 * 1024
-        max_chunk_size = 50 * megabyte
-        first_chunk = b"0" * max_chunk_size
-        second_chunk = b"1" * max_chunk_size
-        binary_content = first_chunk + second_chunk
+        for _ in range(2):
+            with self.client.read_file(committed) as file:
+                expect(file.read()).to(equal(b"content"))
+            expect(self.client.read_file(on_branch).read()).to(equal(b"content"))
 
-        when(self.data_proxy_service).put_file(
-            auth_header=self.AUTH_HEADER,
-            dataset_rid=str(self.DATASET_RID),
-            transaction_rid=str(self.END_TRANSACTION_RID),
-            logical_path=f"{path}.0",
-            file_data=first_chunk,
-        ).thenReturn(None)
-        when(self.data_proxy_service).put_file(
+        verify(self.data_proxy_service, times=1).get_file_in_view(
             auth_header=self.AUTH_HEADER,
             dataset_rid=str(self.DATASET_RID),
-            transaction_rid=str(self.END_TRANSACTION_RID),
-            logical_path=f"{path}.1",
-            file_data=second_chunk,
-        ).thenReturn(None)
-
-        when(self.data_proxy_concatenation_service).start_concatenation_task(
+            end_ref=str(self.END_TRANSACTION_RID),
+            logical_path="path",
+            start_transaction_rid=None,
+        )
+        verify(self.data_proxy_service, times=2).get_file_in_view(
             auth_header=self.AUTH_HEADER,
             dataset_rid=str(self.DATASET_RID),
-            transaction_rid=str(self.END_TRANSACTION_RID),
-            request=StartConcatenationTaskRequest(
-                destination_path=relpath(path),
-                source_paths=[f"{path}.0", f"{path}.1"],
-            ),
-        ).thenReturn(
-            StartConcatenationTaskResponse(
-                concatenation_task_id="concatenation-task-id"
-            )
+            end_ref="master",
+            logical_path="path",
+            start_transaction_rid=None,
         )
+        stats = self.client.file_cache.stats()
+        expect((stats.hits, stats.misses, stats.entries)).to(equal((1, 1, 1)))
 
-        when(self.data_proxy_concatenation_service).get_concatenation_task_status(
-            auth_header=self.AUTH_HEADER, concatenation_task_id="concatenation-task-id"
-        ).thenReturn(
-            ConcatenationTaskStatusReport(
-                status=ConcatenationTaskStatus(queued=ConcatenationTaskQueued()),
-                reported_at="reported-at",
-            )
-        ).thenReturn(
-            ConcatenationTaskStatusReport(
-                status=ConcatenationTaskStatus(
-                    in_progress=ConcatenationTaskInProgress(
-                        concatenated_files_count=0,
-                        deleted_files_count=0,
-                        total_files_count=0,
-                    )
-                ),
-                reported_at="reported-at",
-            )
-        ).thenReturn(
-            ConcatenationTaskStatusReport(
-                status=ConcatenationTaskStatus(success=ConcatenationTaskSuccess()),
-                reported_at="reported-at",
-            )
+    def test_read_files(self):
+        contents = {"a": b"1", "b": b"22", "c": b"333"}
+        when(self.data_proxy_service).get_file_in_view(...).thenAnswer(
+            lambda **kwargs: io.BytesIO(contents[kwargs["logical_path"]])
         )
+        read = {}
 
-        self.client.put_file(
-            locator=FileLocator(
-                dataset_rid=self.DATASET_RID,
-                end_ref=str(self.END_TRANSACTION_RID),
-                logical_path=path,
-                start_transaction_rid=str(self.START_TRANSACTION_RID),
+        stats = self.client.read_files(
+            (
+                FileLocator(
+                    dataset_rid=self.DATASET_RID,
+                    end_ref=str(self.END_TRANSACTION_RID),
+                    logical_path=path,
+                )
+                for path in contents
             ),
-            content=binary_content,
+            lambda locator, stream: read.update({locator.logical_path: stream.read()}),
+            max_workers=2,
         )
 
-        verify(self.data_proxy_service).put_file(
-            auth_header=self.AUTH_HEADER,
-            dataset_rid=str(self.DATASET_RID),
-            transaction_rid=str(self.END_TRANSACTION_RID),
-            logical_path=f"{path}.0",
-            file_data=first_chunk,
-        )
-        verify(self.data_proxy_service).put_file(
-            auth_header=self.AUTH_HEADER,
-            dataset_rid=str(self.DATASET_RID),
-            transaction_rid=str(self.END_TRANSACTION_RID),
-            logical_path=f"{path}.1",
-            file_data=second_chunk,
-        )
+        expect(read).to(equal(contents))
+        expect(stats.files).to(equal(3))
+        expect(stats.size).to(equal(6))
 
-    def test_put_file_chunked_failure(self):
-        path = "path"
-        megabyte = 1024 * 1024
-        max_chunk_size = 50 * megabyte
-        first_chunk = b"0" * max_chunk_size
-        second_chunk = b"1" * max_chunk_size
-        binary_content = first_chunk + second_chunk
+    def test_read_files_closes_streams(self):
+        streams = []
 
-        when(self.data_proxy_service).put_file(
-            auth_header=self.AUTH_HEADER,
-            dataset_rid=str(self.DATASET_RID),
-            transaction_rid=str(self.END_TRANSACTION_RID),
-            logical_path=f"{path}.0",
-            file_data=first_chunk,
-        ).thenReturn(None)
-        when(self.data_proxy_service).put_file(
-            auth_header=self.AUTH_HEADER,
-            dataset_rid=str(self.DATASET_RID),
-            transaction_rid=str(self.END_TRANSACTION_RID),
-            logical_path=f"{path}.1",
-            file_data=second_chunk,
-        ).thenReturn(None)
+        def get_file_in_view(**_kwargs):
+            streams.append(io.BytesIO(b"content"))
+            return streams[-1]
 
-        when(self.data_proxy_concatenation_service).start_concatenation_task(
-            auth_header=self.AUTH_HEADER,
-            dataset_rid=str(self.DATASET_RID),
-            transaction_rid=str(self.END_TRANSACTION_RID),
-            request=StartConcatenationTaskRequest(
-                destination_path=relpath(path),
-                source_paths=[f"{path}.0", f"{path}.1"],
-            ),
-        ).thenReturn(
-            StartConcatenationTaskResponse(
-                concatenation_task_id="concatenation-task-id"
+        when(self.data_proxy_service).get_file_in_view(...).thenAnswer(get_file_in_view)
+        locators = [
+            FileLocator(
+                dataset_rid=self.DATASET_RID,
+                end_ref=str(self.END_TRANSACTION_RID),
+                logical_path=path,
             )
-        )
+            for path in ["a", "b"]
+        ]
 
-        when(self.data_proxy_concatenation_service).get_concatenation_task_status(
-            auth_header=self.AUTH_HEADER, concatenation_task_id="concatenation-task-id"
-        ).thenReturn(
-            ConcatenationTaskStatusReport(
-                status=ConcatenationTaskStatus(
-                    failure=ConcatenationTaskFailure(
-                        concatenated_files_count=0,
-                        deleted_files_count=0,
-                        total_files_count=0,
-                        error_message="error message",
-                    )
-                ),
-                reported_at="reported-at",
-            )
-        )
+        self.client.read_files(locators, lambda _locator, stream: stream.read(1))
+        expect([stream.closed for stream in streams]).to(equal([True, True]))
 
-        expect(
-            lambda: self.client.put_file(
-                locator=FileLocator(
-                    dataset_rid=self.DATASET_RID,
-                    end_ref=str(self.END_TRANSACTION_RID),
-                    logical_path=path,
-                    start_transaction_rid=str(self.START_TRANSACTION_RID),
-                ),
-                content=binary_content,
-            )
-        ).to(raise_error(ValueError, "error message"))
+        def fail(_locator, _stream):
+            raise ValueError()
 
-        verify(self.data_proxy_service).put_file(
-            auth_header=self.AUTH_HEADER,
-            dataset_rid=str(self.DATASET_RID),
-            transaction_rid=str(self.END_TRANSACTION_RID),
-            logical_path=f"{path}.0",
-            file_data=first_chunk,
-        )
-        verify(self.data_proxy_service).put_file(
-            auth_header=self.AUTH_HEADER,
-            dataset_rid=str(self.DATASET_RID),
-            transaction_rid=str(self.END_TRANSACTION_RID),
-            logical_path=f"{path}.1",
-            file_data=second_chunk,
+        expect(lambda: self.client.read_files(locators[:1], fail)).to(
+            raise_error(ValueError)
         )
+        expect(streams[-1].closed).to(equal(True))
 
     def test_start_transaction_with_append_type(self):
         when(self.catalog_service).start_transaction(
@@ -771,17 +684,113 @@ class TestFoundryClient:
             schema=expected,
         )
 
-    def test_read_dataset(self):
-        query_id = "query_id"
+    def _stub_get_schema(self):
+        # decoded from the wire format, as get_schema decodes the response body
+        versioned_schema = ConjureDecoder().decode(
+            {
+                "branchId": self.BRANCH_ID,
+                "transactionRid": str(self.END_TRANSACTION_RID),
+                "versionId": "version",
+                "schema": {
+                    "fieldSchemaList": [
+                        {"type": "STRING", "name": "foo", "customMetadata": {}},
+                        {
+                            "type": "DECIMAL",
+                            "name": "amount",
+                            "nullable": False,
+                            "precision": 38,
+                            "scale": 2,
+                            "customMetadata": {"unit": "EUR"},
+                        },
+                        {
+                            "type": "MAP",
+                            "name": "tags",
+                            "mapKeyType": {"type": "STRING", "customMetadata": {}},
+                            "mapValueType": {
+                                "type": "ARRAY",
+                                "arraySubtype": {"type": "LONG", "customMetadata": {}},
+                                "customMetadata": {},
+                            },
+                            "customMetadata": {},
+                        },
+                        {
+                            "type": "STRUCT",
+                            "name": "point",
+                            "subSchemas": [
+                                {"type": "DOUBLE", "name": "x", "customMetadata": {}}
+                            ],
+                            "customMetadata": {},
+                        },
+                    ],
+                    "dataFrameReaderClass": "com.palantir.foundry.spark.input.ParquetDataFrameReader",
+                    "customMetadata": {"format": "parquet", "key": "value"},
+                },
+            },
+            VersionedFoundrySchema,
+        )
+        when(self.schema_service).get_schema(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            branch_id=self.BRANCH_ID,
+            end_transaction_rid=str(self.END_TRANSACTION_RID),
+        ).thenReturn(versioned_schema)
+
+    def test_get_schema(self):
+        self._stub_get_schema()
+
+        expect(self.client.get_schema(self.dataset)).to(
+            equal(
+                FoundrySchema(
+                    fields=[
+                        Field("foo", "str"),
+                        Field(
+                            "amount",
+                            DecimalFieldType(precision=38, scale=2),
+                            nullable=False,
+                            metadata={"unit": "EUR"},
+                        ),
+                        Field(
+                            "tags",
+                            MapFieldType(
+                                StringFieldType(), ArrayFieldType(LongFieldType())
+                            ),
+                        ),
+                        Field("point", StructFieldType([Field("x", "double")])),
+                    ],
+                    file_format=FileFormat.PARQUET,
+                    metadata={"key": "value"},
+                )
+            )
+        )
+
+    def test_get_schema_is_cached_until_put_schema(self):
+        self._stub_get_schema()
+        when(self.schema_service).put_schema(...)
+
+        first = self.client.get_schema(self.dataset)
+        expect(self.client.get_schema(self.dataset)).to(equal(first))
+        verify(self.schema_service, times=1).get_schema(...)
+
+        self.client.put_schema(self.dataset, first)
+        self.client.get_schema(self.dataset)
+        verify(self.schema_service, times=2).get_schema(...)
+
+    def test_get_schema_when_absent(self):
+        when(self.schema_service).get_schema(...).thenReturn(None)
+
+        expect(self.client.get_schema(self.dataset)).to(equal(None))
+        expect(self.client.get_schema(self.dataset)).to(equal(None))
+        verify(self.schema_service, times=2).get_schema(...)
+
+    def _stub_query(
+        self, table, query_id="query_id", projection="*", where="", timeout=None
+    ):
         running = QueryStatus(running=RunningQueryStatus())
         ready = QueryStatus(ready=ReadyQueryStatus())
 
-        table = pa.Table.from_pandas(
-            pd.DataFrame([[1, "a"], [2, "b"], [3, "c"]], columns=["foo", "bar"])
-        )
         sink = pa.BufferOutputStream()
         writer = pa.ipc.new_stream(sink=sink, schema=table.schema)
-        writer.write_table(table)
+        writer.write_table(table, max_chunksize=1)
         writer.close()
 
         results = io.BytesIO()
@@ -795,9 +804,11 @@ class TestFoundryClient:
                 dialect=SqlDialect.ANSI,  # type: ignore
                 fallback_branch_ids=[],
                 query=SqlQuery(
-                    f'SELECT * FROM "{self.END_TRANSACTION_RID}@{self.BRANCH_ID}"."{self.DATASET_RID}"'
+                    f'SELECT {projection} FROM "{self.END_TRANSACTION_RID}@{self.BRANCH_ID}"."{self.DATASET_RID}"'
+                    + where
                 ),
                 serialization_protocol=SerializationProtocol.ARROW,  # type: ignore
+                timeout=timeout,
             ),
         ).thenReturn(
             SqlExecuteResponse(
@@ -820,10 +831,61 @@ class TestFoundryClient:
             auth_header=self.AUTH_HEADER,
             query_id=query_id,
         ).thenReturn(results)
+        return results
+
+    def test_read_dataset(self):
+        table = pa.Table.from_pandas(
+            pd.DataFrame([[1, "a"], [2, "b"], [3, "c"]], columns=["foo", "bar"])
+        )
+        results = self._stub_query(table)
 
         expect(self.client.read_dataset(locator=self.LOCATOR)).to(equal(table))
 
         verify(self.sql_query_service, times=2).get_status(
             auth_header=self.AUTH_HEADER,
-            query_id=query_id,
+            query_id="query_id",
+        )
+        expect(results.closed).to(equal(True))
+
+    def test_read_dataset_with_columns_and_filters(self):
+        table = pa.Table.from_pandas(pd.DataFrame([[1], [2]], columns=["foo"]))
+        self._stub_query(
+            table, projection='"foo"', where=""" WHERE "bar" = 'a' AND "foo" > 0"""
         )
+
+        expect(
+            self.client.read_dataset(
+                locator=self.LOCATOR,
+                columns=["foo"],
+                filters=[("bar", "=", "a"), ("foo", ">", 0)],
+            )
+        ).to(equal(table))
+
+    def test_read_dataset_with_timeout_and_stats(self):
+        table = pa.Table.from_pandas(pd.DataFrame([[1], [2]], columns=["foo"]))
+        self._stub_query(table, timeout=30000)
+        self.client.query_config = QueryConfig(timeout=30)
+        stats = []
+
+        expect(
+            self.client.read_dataset(locator=self.LOCATOR, on_query_stats=stats.append)
+        ).to(equal(table))
+
+        expect(len(stats)).to(equal(1))
+        expect(stats[0].query_id).to(equal("query_id"))
+        expect(stats[0].running).to(be_above(0))
+        expect(stats[0].total).to(
+            equal(stats[0].submit + stats[0].running + stats[0].transfer)
+        )
+
+    def test_read_dataset_batches(self):
+        table = pa.Table.from_pandas(
+            pd.DataFrame([[1, "a"], [2, "b"], [3, "c"]], columns=["foo", "bar"])
+        )
+        results = self._stub_query(table)
+
+        batches = list(self.client.read_dataset_batches(locator=self.LOCATOR))
+
+        expect([batch.num_rows for batch in batches]).to(equal([1, 1, 1]))
+        expect(pa.Table.from_batches(batches)).to(equal(table))
+        expect(results.closed).to(equal(True))
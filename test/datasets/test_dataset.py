@@ -16,13 +16,15 @@ import io
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
-from expects import expect, equal
+from expects import expect, equal, raise_error
 from mockito import mock, when, verify
 
 from palantir.core.types import ResourceIdentifier
 from palantir.datasets.client import DatasetsClient
 from palantir.datasets.core import Dataset, File, Transaction
+from palantir.datasets.errors import TransactionAbortedError
 from palantir.datasets.types import (
     DatasetLocator,
     TransactionType,
@@ -32,6 +34,9 @@ from palantir.datasets.types import (
     Field,
     StringFieldType,
     LongFieldType,
+    TransferStats,
+    ColumnFilter,
+    FilterOperator,
 )
 
 
@@ -80,7 +85,9 @@ class TestDataset:
             yield file1
             yield file2
 
-        when(self.client).list_files(dataset=self.dataset, path=None).thenReturn(gen())
+        when(self.client).list_files(
+            dataset=self.dataset, path=None, page_size=None
+        ).thenReturn(gen())
 
         expect(list(self.dataset.list_files())).to(equal([file1, file2]))
 
@@ -100,9 +107,9 @@ class TestDataset:
             yield file1
             yield file2
 
-        when(self.client).list_files(dataset=self.dataset, path="path").thenReturn(
-            gen()
-        )
+        when(self.client).list_files(
+            dataset=self.dataset, path="path", page_size=None
+        ).thenReturn(gen())
 
         expect(list(self.dataset.list_files(path="path"))).to(equal([file1, file2]))
 
@@ -114,17 +121,94 @@ class TestDataset:
         )
         expect(self.dataset.file("file_path")).to(equal(expected))
 
+    def _stub_read_files(self, contents):
+        def read_files(locators, consumer, **_kwargs):
+            size = 0
+            for locator in locators:
+                consumer(locator, io.BytesIO(contents[locator.logical_path]))
+                size += len(contents[locator.logical_path])
+            return TransferStats(files=len(contents), size=size, elapsed=1.0)
+
+        when(self.client).read_files(...).thenAnswer(read_files)
+
+    def test_download(self, tmp_path):
+        contents = {"a": b"1", "dir/b": b"22"}
+        self._stub_read_files(contents)
+        when(self.client).list_files(
+            dataset=self.dataset, path="dir", page_size=None
+        ).thenReturn(
+            iter(
+                [
+                    File(
+                        dataset=self.dataset,
+                        path=path,
+                        transaction_rid=self.locator.end_transaction_rid,
+                        client=self.client,
+                    )
+                    for path in contents
+                ]
+            )
+        )
+
+        stats = self.dataset.download(tmp_path / "out", path="dir")
+
+        expect(stats.throughput).to(equal(3.0))
+        expect((tmp_path / "out" / "a").read_bytes()).to(equal(b"1"))
+        expect((tmp_path / "out" / "dir" / "b").read_bytes()).to(equal(b"22"))
+
+    def test_download_rejects_escaping_paths(self, tmp_path):
+        self._stub_read_files({"../a": b"1"})
+        when(self.client).list_files(
+            dataset=self.dataset, path=None, page_size=None
+        ).thenReturn(
+            iter([File(dataset=self.dataset, path="../a", client=self.client)])
+        )
+
+        expect(lambda: self.dataset.download(tmp_path / "out")).to(
+            raise_error(ValueError)
+        )
+
+    def test_read_files(self):
+        self._stub_read_files({"b": b"2", "a": b"1"})
+
+        content = self.dataset.read_files(["b", "a"])
+
+        expect(list(content.items())).to(equal([("b", b"2"), ("a", b"1")]))
+
     def test_read_arrow(self):
         table = mock(pa.Table)
-        when(self.client).read_dataset(self.locator).thenReturn(table)
+        when(self.client).read_dataset(
+            self.locator, columns=None, filters=None, on_query_stats=None
+        ).thenReturn(table)
 
         expect(self.dataset.read_arrow()).to(equal(table))
 
+    def test_read_arrow_with_columns_and_filters(self):
+        table = mock(pa.Table)
+        filters = [ColumnFilter("id", FilterOperator.GREATER_THAN, 1)]
+        when(self.client).read_dataset(
+            self.locator, columns=["id"], filters=filters, on_query_stats=None
+        ).thenReturn(table)
+
+        expect(self.dataset.read_arrow(columns=["id"], filters=filters)).to(
+            equal(table)
+        )
+
+    def test_iter_batches(self):
+        batches = iter([mock(pa.RecordBatch), mock(pa.RecordBatch)])
+        when(self.client).read_dataset_batches(
+            self.locator, columns=None, filters=None, on_query_stats=None
+        ).thenReturn(batches)
+
+        expect(self.dataset.iter_batches()).to(equal(batches))
+
     def test_read_pandas(self):
         table = mock(pa.Table)
         df = mock(pd.DataFrame)
         when(table).to_pandas().thenReturn(df)
-        when(self.client).read_dataset(self.locator).thenReturn(table)
+        when(self.client).read_dataset(
+            self.locator, columns=None, filters=None, on_query_stats=None
+        ).thenReturn(table)
 
         expect(self.dataset.read_pandas()).to(equal(df))
 
@@ -151,7 +235,7 @@ class TestDataset:
         )
         content: bytes
         with io.BytesIO() as buf:
-            df.to_parquet(buf)
+            df.to_parquet(buf, index=False)
             buf.seek(0)
             content = buf.read()
 
@@ -205,3 +289,180 @@ class TestDataset:
                 ]
             ),
         )
+
+    def test_write_pandas_partitioned(self):
+        df = pd.DataFrame(
+            {
+                "numbers": [1, 2, 3, 4, 5],
+                "words": ["a", "b", "a", "a", None],
+            }
+        )
+        txn = Transaction(
+            self.dataset,
+            rid="ri.foundry.test.transaction.2",
+            txn_type=TransactionType.SNAPSHOT,
+            status=TransactionStatus.OPEN,
+            client=self.client,
+        )
+        written = {}
+
+        def put_file(locator, content):
+            written[locator.logical_path] = pq.read_table(pa.BufferReader(content))
+
+        when(self.client).start_transaction(
+            self.dataset, TransactionType.SNAPSHOT
+        ).thenReturn(txn)
+        when(self.client).put_file(...).thenAnswer(put_file)
+        when(self.client).commit_transaction(txn).thenReturn(txn)
+        when(self.client).put_schema(...).thenReturn(None)
+
+        self.dataset.write_pandas(df, max_rows_per_file=2, partition_cols=["words"])
+
+        expect(sorted(written)).to(
+            equal(
+                [
+                    "words=__HIVE_DEFAULT_PARTITION__/part-00000.parquet",
+                    "words=a/part-00000.parquet",
+                    "words=a/part-00001.parquet",
+                    "words=b/part-00000.parquet",
+                ]
+            )
+        )
+        expect(
+            written["words=a/part-00000.parquet"]["numbers"].to_pylist()
+            + written["words=a/part-00001.parquet"]["numbers"].to_pylist()
+        ).to(equal([1, 3, 4]))
+        for table in written.values():
+            expect(table.column_names).to(equal(["numbers", "words"]))
+        verify(self.client, times=4).put_file(...)
+        verify(self.client).commit_transaction(txn)
+
+    def test_get_schema(self):
+        schema = FoundrySchema(fields=[Field(name="numbers", field_type="long")])
+        when(self.client).get_schema(self.dataset).thenReturn(schema)
+
+        expect(self.dataset.get_schema()).to(equal(schema))
+
+
+class TestDatasetWriter:
+    @pytest.fixture(autouse=True)
+    def before(self):
+        self.client = mock(DatasetsClient)
+        self.dataset = Dataset(
+            self.client,
+            DatasetLocator(
+                rid=ResourceIdentifier.from_string("ri.foundry.test.dataset.0"),
+                branch_id="master",
+            ),
+        )
+
+    def _stub_snapshot_writes(self):
+        txn = Transaction(
+            self.dataset,
+            rid="ri.foundry.test.transaction.2",
+            txn_type=TransactionType.SNAPSHOT,
+            status=TransactionStatus.OPEN,
+            client=self.client,
+        )
+        written = {}
+
+        def put_file(locator, content):
+            written[locator.logical_path] = pq.read_table(pa.BufferReader(content))
+
+        when(self.client).start_transaction(
+            self.dataset, TransactionType.SNAPSHOT
+        ).thenReturn(txn)
+        when(self.client).put_file(...).thenAnswer(put_file)
+        when(self.client).commit_transaction(txn).thenReturn(txn)
+        when(self.client).abort_transaction(txn).thenReturn(None)
+        when(self.client).put_schema(...).thenReturn(None)
+        return txn, written
+
+    def test_write_arrow(self):
+        txn, written = self._stub_snapshot_writes()
+        table = pa.table(
+            {
+                "numbers": pa.array([1, 2, 3, 4], pa.int64()),
+                "words": pa.array(["one", "two", "three", "four"]),
+            }
+        )
+
+        self.dataset.write_arrow(table, target_file_size=16)
+
+        expect(sorted(written)).to(
+            equal(
+                [
+                    "part-00000.parquet",
+                    "part-00001.parquet",
+                    "part-00002.parquet",
+                    "part-00003.parquet",
+                ]
+            )
+        )
+        expect(
+            pa.concat_tables(written[path] for path in sorted(written)).equals(table)
+        ).to(equal(True))
+        verify(self.client).commit_transaction(txn)
+        verify(self.client).put_schema(
+            self.dataset,
+            FoundrySchema(
+                fields=[
+                    Field(name="numbers", field_type=LongFieldType()),
+                    Field(name="words", field_type=StringFieldType()),
+                ]
+            ),
+        )
+
+    def test_writer_rolls_files_at_target_size(self):
+        txn, written = self._stub_snapshot_writes()
+        batch = pa.record_batch([pa.array(range(1000), pa.int64())], names=["n"])
+
+        with self.dataset.writer(target_file_size=1 << 20) as writer:
+            for _ in range(3):
+                writer.write(batch)
+
+        expect(list(written)).to(equal(["part-00000.parquet"]))
+        expect(written["part-00000.parquet"].num_rows).to(equal(3000))
+        verify(self.client).commit_transaction(txn)
+
+    def test_writer_aborts_on_error(self):
+        txn, written = self._stub_snapshot_writes()
+        batch = pa.record_batch([pa.array([1], pa.int64())], names=["n"])
+
+        def fail():
+            with self.dataset.writer() as writer:
+                writer.write(batch)
+                raise RuntimeError("failed")
+
+        expect(fail).to(raise_error(TransactionAbortedError))
+        expect(written).to(equal({}))
+        verify(self.client).abort_transaction(txn)
+        verify(self.client, times=0).commit_transaction(...)
+        verify(self.client, times=0).put_schema(...)
+
+    def test_writer_aborts_on_failed_upload(self):
+        txn, _ = self._stub_snapshot_writes()
+        when(self.client).put_file(...).thenRaise(OSError("failed"))
+        batch = pa.record_batch([pa.array([1], pa.int64())], names=["n"])
+
+        def fail():
+            with self.dataset.writer() as writer:
+                writer.write(batch)
+
+        expect(fail).to(raise_error(TransactionAbortedError))
+        verify(self.client).abort_transaction(txn)
+        verify(self.client, times=0).commit_transaction(...)
+
+    def test_writer_aborts_on_failed_roll(self):
+        txn, written = self._stub_snapshot_writes()
+        batch = pa.record_batch([pa.array([1], pa.int64())], names=["n"])
+        writer = self.dataset.writer()
+        writer.write(batch)
+
+        with when(pq.ParquetWriter).close().thenRaise(OSError("failed")):
+            expect(writer.close).to(raise_error(TransactionAbortedError))
+
+        expect(written).to(equal({}))
+        verify(self.client).abort_transaction(txn)
+        verify(self.client, times=0).commit_transaction(...)
+        verify(self.client, times=0).put_schema(...)
@@ -0,0 +1,506 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+from os.path import relpath
+
+import pytest
+import requests
+from expects import expect, equal, raise_error
+from mockito import verifyZeroInteractions, when, verify
+
+from palantir.datasets.rpc.data_proxy import (
+    StartConcatenationTaskRequest,
+    StartConcatenationTaskResponse,
+    ConcatenationTaskStatusReport,
+    ConcatenationTaskStatus,
+    ConcatenationTaskQueued,
+    ConcatenationTaskInProgress,
+    ConcatenationTaskSuccess,
+    ConcatenationTaskFailure,
+)
+from palantir.datasets.types import FileLocator, UploadConfig
+from test.datasets.client_mocks import DatasetsClientMocks
+
+
+class TestFileIO(DatasetsClientMocks):
+    def _stub_ranges(self, content, honor_range=True):
+        requested = []
+
+        def get_file_in_view(byte_range, **_kwargs):
+            requested.append(byte_range)
+            start, end = byte_range[len("bytes=") :].split("-")
+            if not honor_range:
+                return _FakeResponse(content, 200)
+            if int(start) >= len(content):
+                response = requests.Response()
+                response.status_code = 416
+                raise requests.exceptions.HTTPError(response=response)
+            end = len(content) - 1 if not end else min(int(end), len(content) - 1)
+            return _FakeResponse(
+                content[int(start) : end + 1],
+                206,
+                {"Content-Range": f"bytes {start}-{end}/{len(content)}"},
+            )
+
+        when(self.data_proxy_service).get_file_in_view(...).thenAnswer(get_file_in_view)
+        return requested
+
+    @pytest.mark.parametrize("honor_range", [True, False])
+    def test_open_file_seekable(self, honor_range):
+        requested = self._stub_ranges(b"0123456789", honor_range)
+        file = self.client.open_file(
+            FileLocator(
+                dataset_rid=self.DATASET_RID,
+                end_ref=str(self.END_TRANSACTION_RID),
+                logical_path="path",
+            ),
+            seekable=True,
+            size=None if honor_range else 10,
+            buffer_size=4,
+        )
+
+        file.seek(-3, io.SEEK_END)
+        expect(file.read(2)).to(equal(b"78"))
+        file.seek(2)
+        expect(file.read(3)).to(equal(b"234"))
+        expect(file.read()).to(equal(b"56789"))
+        expect(file.read()).to(equal(b""))
+        if honor_range:
+            expect(requested[:3]).to(equal(["bytes=0-0", "bytes=7-10", "bytes=2-5"]))
+
+    def test_open_file_seekable_empty(self):
+        self._stub_ranges(b"")
+        file = self.client.open_file(
+            FileLocator(
+                dataset_rid=self.DATASET_RID,
+                end_ref=str(self.END_TRANSACTION_RID),
+                logical_path="path",
+            ),
+            seekable=True,
+        )
+
+        expect(file.seek(0, io.SEEK_END)).to(equal(0))
+        expect(file.read()).to(equal(b""))
+
+    def test_put_file(self):
+        path = "path"
+        binary_content = b"123456"
+        when(self.data_proxy_service).put_file(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            logical_path=path,
+            file_data=binary_content,
+        ).thenReturn(None)
+
+        self.client.put_file(
+            locator=FileLocator(
+                dataset_rid=self.DATASET_RID,
+                end_ref=str(self.END_TRANSACTION_RID),
+                logical_path=path,
+                start_transaction_rid=str(self.START_TRANSACTION_RID),
+            ),
+            content=binary_content,
+        )
+
+        verify(self.data_proxy_service).put_file(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            logical_path=path,
+            file_data=binary_content,
+        )
+
+    def test_put_file_chunked(self):
+        path = "path"
+        megabyte = 1024 * 1024
+        max_chunk_size = 50 * megabyte
+        first_chunk = b"0" * max_chunk_size
+        second_chunk = b"1" * max_chunk_size
+        binary_content = first_chunk + second_chunk
+
+        when(self.data_proxy_service).put_file(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            logical_path=f"{path}.0",
+            file_data=first_chunk,
+        ).thenReturn(None)
+        when(self.data_proxy_service).put_file(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            logical_path=f"{path}.1",
+            file_data=second_chunk,
+        ).thenReturn(None)
+
+        when(self.data_proxy_concatenation_service).start_concatenation_task(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            request=StartConcatenationTaskRequest(
+                destination_path=relpath(path),
+                source_paths=[f"{path}.0", f"{path}.1"],
+            ),
+        ).thenReturn(
+            StartConcatenationTaskResponse(
+                concatenation_task_id="concatenation-task-id"
+            )
+        )
+
+        when(self.data_proxy_concatenation_service).get_concatenation_task_status(
+            auth_header=self.AUTH_HEADER, concatenation_task_id="concatenation-task-id"
+        ).thenReturn(
+            ConcatenationTaskStatusReport(
+                status=ConcatenationTaskStatus(queued=ConcatenationTaskQueued()),
+                reported_at="reported-at",
+            )
+        ).thenReturn(
+            ConcatenationTaskStatusReport(
+                status=ConcatenationTaskStatus(
+                    in_progress=ConcatenationTaskInProgress(
+                        concatenated_files_count=0,
+                        deleted_files_count=0,
+                        total_files_count=0,
+                    )
+                ),
+                reported_at="reported-at",
+            )
+        ).thenReturn(
+            ConcatenationTaskStatusReport(
+                status=ConcatenationTaskStatus(success=ConcatenationTaskSuccess()),
+                reported_at="reported-at",
+            )
+        )
+
+        self.client.put_file(
+            locator=FileLocator(
+                dataset_rid=self.DATASET_RID,
+                end_ref=str(self.END_TRANSACTION_RID),
+                logical_path=path,
+                start_transaction_rid=str(self.START_TRANSACTION_RID),
+            ),
+            content=binary_content,
+        )
+
+        verify(self.data_proxy_service).put_file(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            logical_path=f"{path}.0",
+            file_data=first_chunk,
+        )
+        verify(self.data_proxy_service).put_file(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            logical_path=f"{path}.1",
+            file_data=second_chunk,
+        )
+
+    def test_put_file_chunked_failure(self):
+        path = "path"
+        megabyte = 1024 * 1024
+        max_chunk_size = 50 * megabyte
+        first_chunk = b"0" * max_chunk_size
+        second_chunk = b"1" * max_chunk_size
+        binary_content = first_chunk + second_chunk
+
+        when(self.data_proxy_service).put_file(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            logical_path=f"{path}.0",
+            file_data=first_chunk,
+        ).thenReturn(None)
+        when(self.data_proxy_service).put_file(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            logical_path=f"{path}.1",
+            file_data=second_chunk,
+        ).thenReturn(None)
+
+        when(self.data_proxy_concatenation_service).start_concatenation_task(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            request=StartConcatenationTaskRequest(
+                destination_path=relpath(path),
+                source_paths=[f"{path}.0", f"{path}.1"],
+            ),
+        ).thenReturn(
+            StartConcatenationTaskResponse(
+                concatenation_task_id="concatenation-task-id"
+            )
+        )
+
+        when(self.data_proxy_concatenation_service).get_concatenation_task_status(
+            auth_header=self.AUTH_HEADER, concatenation_task_id="concatenation-task-id"
+        ).thenReturn(
+            ConcatenationTaskStatusReport(
+                status=ConcatenationTaskStatus(
+                    failure=ConcatenationTaskFailure(
+                        concatenated_files_count=0,
+                        deleted_files_count=0,
+                        total_files_count=0,
+                        error_message="error message",
+                    )
+                ),
+                reported_at="reported-at",
+            )
+        )
+
+        expect(
+            lambda: self.client.put_file(
+                locator=FileLocator(
+                    dataset_rid=self.DATASET_RID,
+                    end_ref=str(self.END_TRANSACTION_RID),
+                    logical_path=path,
+                    start_transaction_rid=str(self.START_TRANSACTION_RID),
+                ),
+                content=binary_content,
+            )
+        ).to(raise_error(ValueError, "error message"))
+
+        verify(self.data_proxy_service).put_file(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            logical_path=f"{path}.0",
+            file_data=first_chunk,
+        )
+        verify(self.data_proxy_service).put_file(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            logical_path=f"{path}.1",
+            file_data=second_chunk,
+        )
+
+    def test_put_file_parts_in_parallel_with_retry(self):
+        path = "path"
+        self.client.upload_config = UploadConfig(
+            part_size=2, max_workers=2, retry_backoff=0
+        )
+
+        def put_part(idx, content):
+            return when(self.data_proxy_service).put_file(
+                auth_header=self.AUTH_HEADER,
+                dataset_rid=str(self.DATASET_RID),
+                transaction_rid=str(self.END_TRANSACTION_RID),
+                logical_path=f"{path}.{idx}",
+                file_data=content,
+            )
+
+        put_part(0, b"ab").thenReturn(None)
+        put_part(1, b"cd").thenRaise(requests.exceptions.ConnectionError()).thenReturn(
+            None
+        )
+        put_part(2, b"e").thenReturn(None)
+        when(self.data_proxy_concatenation_service).start_concatenation_task(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            request=StartConcatenationTaskRequest(
+                destination_path=relpath(path),
+                source_paths=[f"{path}.0", f"{path}.1", f"{path}.2"],
+            ),
+        ).thenReturn(
+            StartConcatenationTaskResponse(
+                concatenation_task_id="concatenation-task-id"
+            )
+        )
+        when(self.data_proxy_concatenation_service).get_concatenation_task_status(
+            auth_header=self.AUTH_HEADER, concatenation_task_id="concatenation-task-id"
+        ).thenReturn(
+            ConcatenationTaskStatusReport(
+                status=ConcatenationTaskStatus(success=ConcatenationTaskSuccess()),
+                reported_at="reported-at",
+            )
+        )
+
+        reports = []
+        self.client.put_file(
+            locator=FileLocator(
+                dataset_rid=self.DATASET_RID,
+                end_ref=str(self.END_TRANSACTION_RID),
+                logical_path=path,
+            ),
+            content=b"abcde",
+            on_part_uploaded=reports.append,
+        )
+
+        expect(sorted((part.index, part.size, part.attempts) for part in reports)).to(
+            equal([(0, 2, 1), (1, 2, 2), (2, 1, 1)])
+        )
+        verify(self.data_proxy_concatenation_service).start_concatenation_task(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            request=StartConcatenationTaskRequest(
+                destination_path=relpath(path),
+                source_paths=[f"{path}.0", f"{path}.1", f"{path}.2"],
+            ),
+        )
+
+    def test_put_file_parts_does_not_retry_client_errors(self):
+        path = "path"
+        self.client.upload_config = UploadConfig(
+            part_size=2, max_workers=1, retry_backoff=0
+        )
+        response = requests.Response()
+        response.status_code = 403
+        error = requests.exceptions.HTTPError(response=response)
+        when(self.data_proxy_service).put_file(
+            auth_header=self.AUTH_HEADER,
+            dataset_rid=str(self.DATASET_RID),
+            transaction_rid=str(self.END_TRANSACTION_RID),
+            logical_path=f"{path}.0",
+            file_data=b"ab",
+        ).thenRaise(error)
+
+        expect(
+            lambda: self.client.put_file(
+                locator=FileLocator(
+                    dataset_rid=self.DATASET_RID,
+                    end_ref=str(self.END_TRANSACTION_RID),
+                    logical_path=path,
+                ),
+                content=b"abcd",
+            )
+        ).to(raise_error(requests.exceptions.HTTPError))
+        verifyZeroInteractions(self.data_proxy_concatenation_service)
+
+    def _record_uploads(self):
+        uploads = {}
+
+        def record(**kwargs):
+            data = kwargs["file_data"]
+            uploads[kwargs["logical_path"]] = (
+                data.read() if hasattr(data, "read") else bytes(data)
+            )
+
+        when(self.data_proxy_service).put_file(...).thenAnswer(record)
+        when(self.data_proxy_concatenation_service).start_concatenation_task(
+            ...
+        ).thenReturn(
+            StartConcatenationTaskResponse(
+                concatenation_task_id="concatenation-task-id"
+            )
+        )
+        when(self.data_proxy_concatenation_service).get_concatenation_task_status(
+            ...
+        ).thenReturn(
+            ConcatenationTaskStatusReport(
+                status=ConcatenationTaskStatus(success=ConcatenationTaskSuccess()),
+                reported_at="reported-at",
+            )
+        )
+        return uploads
+
+    @pytest.mark.parametrize(
+        "make_content",
+        [
+            lambda: io.BytesIO(b"abcde"),
+            lambda: iter([b"a", b"bcd", b"", b"e"]),
+            lambda: memoryview(bytearray(b"abcde")),
+        ],
+    )
+    def test_put_file_streams_parts(self, make_content):
+        self.client.upload_config = UploadConfig(part_size=2, max_workers=2)
+        uploads = self._record_uploads()
+
+        self.client.put_file(
+            locator=FileLocator(
+                dataset_rid=self.DATASET_RID,
+                end_ref=str(self.END_TRANSACTION_RID),
+                logical_path="path",
+            ),
+            content=make_content(),
+        )
+
+        expect(uploads).to(equal({"path.0": b"ab", "path.1": b"cd", "path.2": b"e"}))
+
+    def test_put_file_from_path(self, tmp_path):
+        local_file = tmp_path / "local"
+        local_file.write_bytes(b"abcde")
+        uploads = self._record_uploads()
+        locator = FileLocator(
+            dataset_rid=self.DATASET_RID,
+            end_ref=str(self.END_TRANSACTION_RID),
+            logical_path="path",
+        )
+
+        self.client.put_file(locator=locator, content=local_file)
+        expect(uploads).to(equal({"path": b"abcde"}))
+
+        uploads.clear()
+        self.client.upload_config = UploadConfig(part_size=3)
+        self.client.put_file(locator=locator, content=local_file)
+        expect(uploads).to(equal({"path.0": b"abc", "path.1": b"de"}))
+
+    def test_upload_file(self, tmp_path):
+        local_file = tmp_path / "local"
+        local_file.write_bytes(b"abcdefg")
+        empty_file = tmp_path / "empty"
+        empty_file.write_bytes(b"")
+        uploads = self._record_uploads()
+        self.client.upload_config = UploadConfig(part_size=3)
+        locator = FileLocator(
+            dataset_rid=self.DATASET_RID,
+            end_ref=str(self.END_TRANSACTION_RID),
+            logical_path="path",
+        )
+
+        self.client.upload_file(locator, str(local_file))
+        expect(uploads).to(equal({"path.0": b"abc", "path.1": b"def", "path.2": b"g"}))
+
+        uploads.clear()
+        self.client.upload_file(locator, empty_file)
+        expect(uploads).to(equal({"path": b""}))
+
+    def test_put_file_with_small_stream(self):
+        uploads = self._record_uploads()
+
+        self.client.put_file(
+            locator=FileLocator(
+                dataset_rid=self.DATASET_RID,
+                end_ref=str(self.END_TRANSACTION_RID),
+                logical_path="path",
+            ),
+            content=io.BytesIO(b"abcde"),
+        )
+
+        expect(uploads).to(equal({"path": b"abcde"}))
+
+    def test_put_file_rejects_str(self):
+        expect(
+            lambda: self.client.put_file(
+                locator=FileLocator(
+                    dataset_rid=self.DATASET_RID,
+                    end_ref=str(self.END_TRANSACTION_RID),
+                    logical_path="path",
+                ),
+                content="content",
+            )
+        ).to(raise_error(TypeError))
+
+
+class _FakeResponse(io.BytesIO):
+    def __init__(self, content, status, headers=None):
+        super().__init__(content)
+        self.status = status
+        self.headers = headers or {"Content-Length": str(len(content))}
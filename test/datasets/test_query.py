@@ -0,0 +1,89 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from expects import expect, equal, raise_error
+
+from palantir.core.types import ResourceIdentifier
+from palantir.datasets.query import select_query, to_condition, to_literal
+from palantir.datasets.types import DatasetLocator, ColumnFilter, FilterOperator
+
+
+class TestQuery:
+    LOCATOR = DatasetLocator(
+        rid=ResourceIdentifier.from_string("ri.foundry.test.dataset.0"),
+        branch_id="master",
+        end_transaction_rid=ResourceIdentifier.from_string(
+            "ri.foundry.test.transaction.0"
+        ),
+    )
+    TABLE = '"ri.foundry.test.transaction.0@master"."ri.foundry.test.dataset.0"'
+
+    def test_select_star(self):
+        expect(select_query(self.LOCATOR)).to(equal(f"SELECT * FROM {self.TABLE}"))
+
+    def test_select_columns_and_filters(self):
+        expect(
+            select_query(
+                self.LOCATOR,
+                columns=["id", 'we"ird'],
+                filters=[
+                    ("date", ">=", date(2022, 1, 1)),
+                    ColumnFilter("name", FilterOperator.IS_NOT_NULL),
+                ],
+            )
+        ).to(
+            equal(
+                f'SELECT "id", "we""ird" FROM {self.TABLE} '
+                """WHERE "date" >= DATE '2022-01-01' AND "name" IS NOT NULL"""
+            )
+        )
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (None, "NULL"),
+            (True, "TRUE"),
+            (3, "3"),
+            (1.5, "1.5"),
+            (Decimal("1.10"), "1.10"),
+            ("it's", "'it''s'"),
+            ("'; DROP TABLE x; --", "'''; DROP TABLE x; --'"),
+            (date(2022, 1, 2), "DATE '2022-01-02'"),
+            (datetime(2022, 1, 2, 3, 4, 5), "TIMESTAMP '2022-01-02 03:04:05'"),
+        ],
+    )
+    def test_to_literal(self, value, expected):
+        expect(to_literal(value)).to(equal(expected))
+
+    def test_to_literal_rejects_unsupported_values(self):
+        expect(lambda: to_literal(float("nan"))).to(raise_error(ValueError))
+        expect(lambda: to_literal(object())).to(raise_error(TypeError))
+
+    def test_to_condition(self):
+        expect(to_condition(("id", "in", [1, 2]))).to(equal('"id" IN (1, 2)'))
+        expect(to_condition(("id", FilterOperator.IS_NULL, None))).to(
+            equal('"id" IS NULL')
+        )
+        expect(to_condition(("id", "<>", "a"))).to(equal(""""id" <> 'a'"""))
+
+    def test_to_condition_rejects_invalid_filters(self):
+        expect(lambda: to_condition(("id", "=", None))).to(raise_error(ValueError))
+        expect(lambda: to_condition(("id", "IN", []))).to(raise_error(ValueError))
+        expect(lambda: to_condition(("id", "IN", "ab"))).to(raise_error(TypeError))
+        expect(lambda: to_condition(("id", "LIKE", "a"))).to(raise_error(ValueError))
+        expect(lambda: to_condition(("", "=", "a"))).to(raise_error(ValueError))
@@ -13,27 +13,44 @@
 #  limitations under the License.
 
 from datetime import date
+from decimal import Decimal
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 from expects import expect, equal
 
-from palantir.datasets.schema import pandas_to_foundry_schema, _get_field
+from palantir.datasets.rpc.schema import (
+    FoundryFieldSchema,
+    FoundryFieldType,
+    FoundrySchema as ConjureFoundrySchema,
+)
+from palantir.datasets.schema import (
+    arrow_to_foundry_schema,
+    pandas_to_foundry_schema,
+    _get_conjure_field_schema,
+    _get_field,
+    _get_sdk_schema,
+)
 from palantir.datasets.types import (
     ArrayFieldType,
+    BinaryFieldType,
     BooleanFieldType,
     ByteFieldType,
     Field,
     FileFormat,
     DateFieldType,
+    DecimalFieldType,
     DoubleFieldType,
     FloatFieldType,
     FoundrySchema,
     IntegerFieldType,
     LongFieldType,
+    MapFieldType,
     ShortFieldType,
     StringFieldType,
+    StructFieldType,
     TimestampFieldType,
 )
 
@@ -138,6 +155,84 @@ class TestPandasSchemaConverter:
             )
         )
 
+    @pytest.mark.parametrize(
+        "series,field_type",
+        [
+            (pd.Series(["one", None], dtype=pd.StringDtype()), StringFieldType()),
+            (pd.Series([True, None], dtype=pd.BooleanDtype()), BooleanFieldType()),
+            (pd.Series([1.1, None], dtype=pd.Float32Dtype()), FloatFieldType()),
+            (
+                pd.Series([pd.Timestamp(1, tz="UTC"), pd.Timestamp(2, tz="UTC")]),
+                TimestampFieldType(),
+            ),
+            (pd.Series(["one", "two", "one"], dtype="category"), StringFieldType()),
+            (
+                pd.Series([1, None], dtype=pd.ArrowDtype(pa.int32())),
+                IntegerFieldType(),
+            ),
+            (
+                pd.Series([[1], None], dtype=pd.ArrowDtype(pa.list_(pa.int64()))),
+                ArrayFieldType(element_type=LongFieldType()),
+            ),
+            (pd.Series([None, None, "one"]), StringFieldType()),
+            (pd.Series([None, date(1970, 1, 1)]), DateFieldType()),
+            (pd.Series([None, b"one"]), BinaryFieldType()),
+            (pd.Series([None, [], [1.1]]), ArrayFieldType(DoubleFieldType())),
+            (pd.Series([None] * 5000 + ["one"]), StringFieldType()),
+        ],
+    )
+    def test_get_field_schema_extension_types_and_nulls(self, series, field_type):
+        expect(_get_field("name", series)).to(
+            equal(Field(name="name", field_type=field_type))
+        )
+
+    @pytest.mark.parametrize(
+        "series,field_type",
+        [
+            (pd.Series([1, 2], dtype=np.uint8), ShortFieldType()),
+            (pd.Series([1, 2], dtype=np.uint16), IntegerFieldType()),
+            (pd.Series([1, 2], dtype=np.uint32), LongFieldType()),
+            (
+                pd.Series([1, 2], dtype=np.uint64),
+                DecimalFieldType(precision=20, scale=0),
+            ),
+            (pd.Series([1, None], dtype=pd.UInt8Dtype()), ShortFieldType()),
+            (
+                pd.Series([Decimal("1.25"), None, Decimal("10.5")]),
+                DecimalFieldType(precision=4, scale=2),
+            ),
+            (
+                pd.Series([{"a": 1}, {"a": 2}]),
+                StructFieldType(fields=[Field("a", LongFieldType())]),
+            ),
+        ],
+    )
+    def test_get_field_schema_widened_and_fallback_types(self, series, field_type):
+        expect(_get_field("name", series)).to(
+            equal(Field(name="name", field_type=field_type))
+        )
+
+    def test_from_pandas_unsigned(self):
+        df = pd.DataFrame(
+            {
+                "small": np.array([1], dtype=np.uint8),
+                "big": np.array([1], dtype=np.uint64),
+            }
+        )
+
+        expect(pandas_to_foundry_schema(df).fields).to(
+            equal(
+                [
+                    Field("small", ShortFieldType()),
+                    Field("big", DecimalFieldType(precision=20, scale=0)),
+                ]
+            )
+        )
+
+    def test_get_field_schema_all_nulls(self):
+        with pytest.raises(ValueError):
+            _get_field("name", pd.Series([None, None]))
+
     def test_from_pandas(self):
         df = pd.DataFrame(
             {
@@ -173,3 +268,179 @@ class TestPandasSchemaConverter:
         )
 
         expect(pandas_to_foundry_schema(df)).to(equal(expected))
+
+
+class TestArrowSchemaConverter:
+    @pytest.mark.parametrize(
+        "arrow_type,field_type",
+        [
+            (pa.bool_(), BooleanFieldType()),
+            (pa.int8(), ByteFieldType()),
+            (pa.int16(), ShortFieldType()),
+            (pa.int32(), IntegerFieldType()),
+            (pa.int64(), LongFieldType()),
+            (pa.float32(), FloatFieldType()),
+            (pa.float64(), DoubleFieldType()),
+            (pa.string(), StringFieldType()),
+            (pa.large_string(), StringFieldType()),
+            (pa.binary(), BinaryFieldType()),
+            (pa.date32(), DateFieldType()),
+            (pa.timestamp("us", tz="UTC"), TimestampFieldType()),
+            (pa.list_(pa.int32()), ArrayFieldType(element_type=IntegerFieldType())),
+            (pa.uint8(), ShortFieldType()),
+            (pa.uint16(), IntegerFieldType()),
+            (pa.uint32(), LongFieldType()),
+            (pa.uint64(), DecimalFieldType(precision=20, scale=0)),
+            (pa.decimal128(38, 2), DecimalFieldType(precision=38, scale=2)),
+            (pa.decimal256(76, 10), DecimalFieldType(precision=76, scale=10)),
+            (pa.large_binary(), BinaryFieldType()),
+            (pa.binary(16), BinaryFieldType()),
+            (pa.date64(), DateFieldType()),
+            (pa.timestamp("ns"), TimestampFieldType()),
+            (pa.dictionary(pa.int32(), pa.string()), StringFieldType()),
+            (pa.large_list(pa.string()), ArrayFieldType(StringFieldType())),
+            (pa.list_(pa.float32(), 3), ArrayFieldType(FloatFieldType())),
+            (
+                pa.list_(pa.list_(pa.int64())),
+                ArrayFieldType(ArrayFieldType(LongFieldType())),
+            ),
+            (
+                pa.map_(pa.string(), pa.list_(pa.bool_())),
+                MapFieldType(StringFieldType(), ArrayFieldType(BooleanFieldType())),
+            ),
+            (
+                pa.struct(
+                    [
+                        pa.field("x", pa.float64(), nullable=False),
+                        pa.field("tags", pa.map_(pa.string(), pa.int64())),
+                    ]
+                ),
+                StructFieldType(
+                    [
+                        Field("x", DoubleFieldType(), nullable=False),
+                        Field("tags", MapFieldType(StringFieldType(), LongFieldType())),
+                    ]
+                ),
+            ),
+        ],
+    )
+    def test_from_arrow_types(self, arrow_type, field_type):
+        expect(arrow_to_foundry_schema(pa.schema([("name", arrow_type)]))).to(
+            equal(FoundrySchema(fields=[Field(name="name", field_type=field_type)]))
+        )
+
+    def test_from_arrow_nullability(self):
+        schema = pa.schema(
+            [
+                pa.field("required", pa.int64(), nullable=False),
+                pa.field("optional", pa.string()),
+            ]
+        )
+
+        expect(arrow_to_foundry_schema(schema)).to(
+            equal(
+                FoundrySchema(
+                    fields=[
+                        Field(name="required", field_type="long", nullable=False),
+                        Field(name="optional", field_type="str"),
+                    ],
+                    file_format=FileFormat.PARQUET,
+                )
+            )
+        )
+
+    def test_from_arrow_unsupported_type(self):
+        with pytest.raises(ValueError):
+            arrow_to_foundry_schema(pa.schema([("name", pa.null())]))
+
+
+class TestConjureSchemaConverter:
+    def test_to_conjure_nested_types(self):
+        expect(
+            _get_conjure_field_schema(DecimalFieldType(precision=38, scale=2), "amount")
+        ).to(
+            equal(
+                FoundryFieldSchema(
+                    name="amount",
+                    field_type=FoundryFieldType.DECIMAL,
+                    precision=38,
+                    scale=2,
+                    custom_metadata={},
+                    nullable=True,
+                )
+            )
+        )
+        expect(
+            _get_conjure_field_schema(
+                MapFieldType(StringFieldType(), LongFieldType()), "tags"
+            )
+        ).to(
+            equal(
+                FoundryFieldSchema(
+                    name="tags",
+                    field_type=FoundryFieldType.MAP,
+                    map_key_type=FoundryFieldSchema(
+                        field_type=FoundryFieldType.STRING,
+                        custom_metadata={},
+                        nullable=False,
+                    ),
+                    map_value_type=FoundryFieldSchema(
+                        field_type=FoundryFieldType.LONG,
+                        custom_metadata={},
+                        nullable=True,
+                    ),
+                    custom_metadata={},
+                    nullable=True,
+                )
+            )
+        )
+        expect(
+            _get_conjure_field_schema(
+                StructFieldType(
+                    [Field("x", "double", nullable=False), Field("y", "double")]
+                ),
+                "point",
+            )
+        ).to(
+            equal(
+                FoundryFieldSchema(
+                    name="point",
+                    field_type=FoundryFieldType.STRUCT,
+                    sub_schemas=[
+                        FoundryFieldSchema(
+                            name="x",
+                            field_type=FoundryFieldType.DOUBLE,
+                            custom_metadata={},
+                            nullable=False,
+                        ),
+                        FoundryFieldSchema(
+                            name="y",
+                            field_type=FoundryFieldType.DOUBLE,
+                            custom_metadata={},
+                            nullable=True,
+                        ),
+                    ],
+                    custom_metadata={},
+                    nullable=True,
+                )
+            )
+        )
+
+    @pytest.mark.parametrize(
+        "custom_metadata, file_format",
+        [(None, FileFormat.PARQUET), ({"format": "avro"}, FileFormat.AVRO)],
+    )
+    def test_from_conjure_with_unknown_reader(self, custom_metadata, file_format):
+        schema = ConjureFoundrySchema(
+            field_schema_list=[
+                FoundryFieldSchema(
+                    custom_metadata={}, field_type=FoundryFieldType.STRING, name="foo"
+                )
+            ],
+            data_frame_reader_class="com.example.CustomDataFrameReader",
+            custom_metadata=custom_metadata,
+        )
+
+        expect(_get_sdk_schema(schema)).to(
+            equal(FoundrySchema(fields=[Field("foo", "str")], file_format=file_format))
+        )
@@ -0,0 +1,256 @@
+#  (c) Copyright 2022 Palantir Technologies Inc. All rights reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+
+import aiohttp
+import pytest
+from expects import expect, equal
+from mockito import mock, when
+
+from palantir.core.config import StaticTokenProvider, StaticHostnameProvider, AuthToken
+from palantir.core.types import PalantirContext, ResourceIdentifier
+from palantir.objects.aio import (
+    AsyncObject,
+    AsyncObjectsClient,
+    AsyncObjectServices,
+    AsyncObjectType,
+    AsyncOntology,
+)
+from palantir.objects.rpc.aio import AsyncAPIService
+from palantir.objects.rpc.api import (
+    ListObjectsResponse,
+    ListObjectTypesResponse,
+    ListOntologiesResponse,
+    ObjectType,
+    Ontology,
+    OntologyObject,
+    Property,
+)
+from palantir.objects.types import FilterTerm, PropertyFilter
+
+
+def _object_type(api_name: str) -> ObjectType:
+    return ObjectType(
+        api_name=api_name,
+        description=f"{api_name} description",
+        primary_key=[f"{api_name}PK"],
+        properties={"prop": Property(description="", base_type="String")},
+        rid=f"ri.ontology.main.object-type.{api_name}",
+    )
+
+
+def _async_object_type(api_name: str, client=None) -> AsyncObjectType:
+    return AsyncObjectType(
+        api_name=api_name,
+        description=f"{api_name} description",
+        primary_key=[f"{api_name}PK"],
+        properties={"prop": {"description": "", "base_type": "String"}},
+        rid=ResourceIdentifier.try_parse(f"ri.ontology.main.object-type.{api_name}"),
+        ontology_rid=TestAsyncObjectsClient.ONTOLOGY_RID,
+        client=client,
+    )
+
+
+class TestAsyncObjectsClient:
+    AUTH_HEADER = "auth-header"
+    ONTOLOGY_RID = "ri.ontology.main.ontology.1"
+
+    @pytest.fixture(autouse=True)
+    def before(self):
+        self.api_service = mock(AsyncAPIService)
+        services = mock(AsyncObjectServices)
+        services.api_service = self.api_service  # noqa
+        services.ctx = PalantirContext(  # noqa
+            StaticHostnameProvider("unused"),
+            StaticTokenProvider(AuthToken(self.AUTH_HEADER)),
+        )
+        self.client = AsyncObjectsClient(services, max_concurrency=2)
+
+    def test_list_ontologies(self):
+        async def list_ontologies(**_kwargs):
+            return ListOntologiesResponse(
+                data=[
+                    Ontology(
+                        description="description",
+                        display_name="display",
+                        rid=self.ONTOLOGY_RID,
+                    )
+                ]
+            )
+
+        when(self.api_service).list_ontologies(auth_header=self.AUTH_HEADER).thenAnswer(
+            list_ontologies
+        )
+
+        expect(asyncio.run(self.client.list_ontologies())).to(
+            equal(
+                [
+                    AsyncOntology(
+                        rid=ResourceIdentifier.from_string(self.ONTOLOGY_RID),
+                        description="description",
+                        display_name="display",
+                        client=None,
+                    )
+                ]
+            )
+        )
+
+    def test_list_object_types(self):
+        pages = {
+            None: ListObjectTypesResponse(
+                data=[_object_type("One")], next_page_token="two"
+            ),
+            "two": ListObjectTypesResponse(
+                data=[_object_type("Two")], next_page_token=None
+            ),
+        }
+
+        async def list_object_types(page_token=None, **_kwargs):
+            return pages[page_token]
+
+        when(self.api_service).list_object_types(...).thenAnswer(list_object_types)
+
+        async def collect():
+            return [
+                obj_type
+                async for obj_type in self.client.list_object_types(self.ONTOLOGY_RID)
+            ]
+
+        object_types = asyncio.run(collect())
+
+        expect(object_types).to(
+            equal([_async_object_type("One"), _async_object_type("Two")])
+        )
+        for obj_type in object_types:
+            expect(obj_type.ontology_rid).to(equal(self.ONTOLOGY_RID))
+            expect(obj_type.client).to(equal(self.client))
+
+    def test_get_object_types_bounds_concurrency(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_object_type(object_type, **_kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if object_type == "Missing":
+                raise aiohttp.ClientResponseError(None, (), status=404)
+            return _object_type(object_type)
+
+        when(self.api_service).get_object_type(...).thenAnswer(get_object_type)
+
+        object_types = asyncio.run(
+            self.client.get_object_types(
+                self.ONTOLOGY_RID, ["One", "Missing", "Two", "Three"]
+            )
+        )
+
+        expect(object_types).to(
+            equal(
+                [
+                    _async_object_type("One"),
+                    None,
+                    _async_object_type("Two"),
+                    _async_object_type("Three"),
+                ]
+            )
+        )
+        for obj_type in object_types:
+            if obj_type is not None:
+                expect(obj_type.ontology_rid).to(equal(self.ONTOLOGY_RID))
+                expect(obj_type.client).to(equal(self.client))
+        expect(max_in_flight).to(equal(2))
+
+    def test_list_objects(self):
+        object_type = _async_object_type("One", self.client)
+        pages = {
+            None: ListObjectsResponse(
+                data=[OntologyObject(rid="ri.1", properties={"OnePK": 1})],
+                next_page_token="two",
+            ),
+            "two": ListObjectsResponse(
+                data=[OntologyObject(rid="ri.2", properties={"OnePK": 2})],
+                next_page_token=None,
+            ),
+        }
+
+        async def list_objects(page_token=None, **_kwargs):
+            return pages[page_token]
+
+        when(self.api_service).list_objects(...).thenAnswer(list_objects)
+
+        async def collect():
+            return [obj async for obj in object_type.list_objects(page_size=1)]
+
+        objects = asyncio.run(collect())
+
+        expect(objects).to(
+            equal(
+                [
+                    AsyncObject(
+                        ResourceIdentifier.try_parse("ri.1"), {"OnePK": 1}, object_type
+                    ),
+                    AsyncObject(
+                        ResourceIdentifier.try_parse("ri.2"), {"OnePK": 2}, object_type
+                    ),
+                ]
+            )
+        )
+        expect([obj.primary_key for obj in objects]).to(equal([1, 2]))
+
+    def test_list_objects_searches_with_filters(self):
+        object_type = _async_object_type("One", self.client)
+        requests = []
+
+        async def search_objects(request, **_kwargs):
+            requests.append(request)
+            return ListObjectsResponse(
+                data=[OntologyObject(rid="ri.1", properties={"OnePK": 1})],
+                next_page_token=None,
+            )
+
+        when(self.api_service).search_objects(...).thenAnswer(search_objects)
+
+        async def collect():
+            return [
+                obj
+                async for obj in object_type.list_objects(
+                    filters=[PropertyFilter("OnePK", FilterTerm.EQUAL, 1)]
+                )
+            ]
+
+        expect(len(asyncio.run(collect()))).to(equal(1))
+        expect(requests).to(
+            equal([{"query": {"type": "eq", "field": "properties.OnePK", "value": 1}}])
+        )
+
+    def test_object(self):
+        object_type = _async_object_type("One", self.client)
+
+        async def get_object(primary_key, **_kwargs):
+            if primary_key == "missing":
+                raise aiohttp.ClientResponseError(None, (), status=404)
+            return OntologyObject(rid="ri.1", properties={"OnePK": primary_key})
+
+        when(self.api_service).get_object(...).thenAnswer(get_object)
+
+        obj = asyncio.run(object_type.object("found"))
+
+        expect(obj.properties).to(equal({"OnePK": "found"}))
+        expect(obj.object_type).to(equal(object_type))
+        with pytest.raises(ValueError):
+            asyncio.run(object_type.object("missing"))
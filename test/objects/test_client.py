@@ -12,18 +12,25 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import datetime
+
 import pytest
-from mockito import mock, when
-from expects import expect, equal
+import requests
+from mockito import mock, when, verify
+from requests.exceptions import HTTPError
+from expects import expect, equal, raise_error
 
 from palantir.objects.client import ObjectsClient, ObjectServices
 from palantir.objects.rpc.api import (
-    APIService, ListOntologiesResponse, Ontology, ListObjectTypesResponse, ObjectType, Property
+    APIService, ListOntologiesResponse, Ontology, ListObjectTypesResponse, ObjectType, Property,
+    ListObjectsResponse, OntologyObject, LinkTypeSide
 )
 from palantir.objects.core import (
     Ontology as FinalOntology,
-    ObjectType as FinalObjectType
+    ObjectType as FinalObjectType,
+    Object as FinalObject
 )
+from palantir.objects.types import FilterTerm, OrderTerm, PropertyFilter
 
 from palantir.core.types import PalantirContext, ResourceIdentifier
 from palantir.core.config import StaticTokenProvider, StaticHostnameProvider, AuthToken
@@ -101,12 +108,22 @@ class TestClient:
 
         when(self.api_service).list_object_types(
             auth_header=self.AUTH_HEADER,
-            ontology_rid=self.rid1
+            ontology_rid=self.rid1,
+            page_token=None,
+            page_size=1
+        ).thenReturn(
+            ListObjectTypesResponse(data=[obj1], next_page_token="next-page-token")
+        )
+        when(self.api_service).list_object_types(
+            auth_header=self.AUTH_HEADER,
+            ontology_rid=self.rid1,
+            page_token="next-page-token",
+            page_size=1
         ).thenReturn(
-            ListObjectTypesResponse(data=[obj1, obj2], next_page_token=None)
+            ListObjectTypesResponse(data=[obj2], next_page_token=None)
         )
 
-        expect(list(self.client.list_object_types(ontology_rid=self.rid1))).to(equal(
+        expect(list(self.client.list_object_types(ontology_rid=self.rid1, page_size=1))).to(equal(
             [
                 FinalObjectType(
                     api_name=obj1_api_name, description=obj1_desc, primary_key=obj1_pk, rid=obj1_rid,
@@ -120,5 +137,198 @@ class TestClient:
         ))
 
     def test_get_object_type(self):
-        pass
+        when(self.api_service).get_object_type(
+            auth_header=self.AUTH_HEADER, ontology_rid=self.rid1, object_type="ObjectType1"
+        ).thenReturn(ObjectType(
+            api_name="ObjectType1",
+            description="description",
+            primary_key=["pk"],
+            properties={"prop": Property(description="", base_type="String")},
+            rid="ri.ontology.main.object-type.1"
+        ))
+        expected = FinalObjectType(
+            api_name="ObjectType1", description="description", primary_key=["pk"],
+            rid=ResourceIdentifier.try_parse("ri.ontology.main.object-type.1"),
+            properties={"prop": {"description": "", "base_type": "String"}}
+        )
+
+        expect(self.client.get_object_type(self.rid1, "ObjectType1")).to(equal(expected))
+        expect(self.client.get_object_type(self.rid1, "ObjectType1")).to(equal(expected))
+        verify(self.api_service, times=1).get_object_type(...)
+        expect(self.client.cache_stats().hits).to(equal(1))
+
+        self.client.invalidate(self.rid1)
+        expect(self.client.get_object_type(self.rid1, "ObjectType1")).to(equal(expected))
+        verify(self.api_service, times=2).get_object_type(...)
+
+    def test_get_object_type_not_found(self):
+        when(self.api_service).get_object_type(...).thenRaise(HTTPError())
+
+        expect(self.client.get_object_type(self.rid1, "Missing")).to(equal(None))
+        expect(self.client.get_object_type(self.rid1, "Missing")).to(equal(None))
+        verify(self.api_service, times=2).get_object_type(...)
+
+    def test_list_ontologies_cached(self):
+        when(self.api_service).list_ontologies(auth_header=self.AUTH_HEADER).thenReturn(
+            ListOntologiesResponse(data=[Ontology(description=self.desc1, display_name=self.disp1, rid=self.rid1)])
+        )
+
+        expect(self.client.list_ontologies()).to(equal(self.client.list_ontologies()))
+        verify(self.api_service, times=1).list_ontologies(...)
+
+        self.client.invalidate()
+        self.client.list_ontologies()
+        verify(self.api_service, times=2).list_ontologies(...)
+
+    def _aircraft(self) -> FinalObjectType:
+        return FinalObjectType(
+            api_name="Aircraft", description="", primary_key=["id"], properties={},
+            rid=ResourceIdentifier.try_parse("ri.ontology.main.object-type.1"), ontology_rid=self.rid1,
+            client=self.client
+        )
+
+    def test_list_objects(self):
+        aircraft = self._aircraft()
+        when(self.api_service).list_objects(
+            auth_header=self.AUTH_HEADER, ontology_rid=self.rid1, object_type="Aircraft", page_size=1,
+            page_token=None, properties=["id"], order_by="properties.id:asc,properties.seats:desc"
+        ).thenReturn(ListObjectsResponse(data=[OntologyObject({"id": "a"})], next_page_token="next"))
+        when(self.api_service).list_objects(
+            auth_header=self.AUTH_HEADER, ontology_rid=self.rid1, object_type="Aircraft", page_size=1,
+            page_token="next", properties=["id"], order_by="properties.id:asc,properties.seats:desc"
+        ).thenReturn(ListObjectsResponse(data=[OntologyObject({"id": "b"})]))
+
+        objects = aircraft.list_objects(
+            properties=["id"], order_by=[("id", OrderTerm.ASCENDING), ("seats", OrderTerm.DESCENDING)], page_size=1
+        )
+
+        expect(list(objects)).to(equal([FinalObject(None, {"id": "a"}), FinalObject(None, {"id": "b"})]))
+
+    def test_list_objects_with_filters(self):
+        aircraft = self._aircraft()
+        when(self.api_service).search_objects(
+            auth_header=self.AUTH_HEADER, ontology_rid=self.rid1, object_type="Aircraft", request={
+                "query": {
+                    "type": "and",
+                    "value": [
+                        {"type": "gt", "field": "properties.seats", "value": 100},
+                        {"type": "isNull", "field": "properties.retired", "value": True},
+                    ],
+                },
+                "orderBy": {"fields": [{"field": "properties.seats", "direction": "desc"}]},
+            }
+        ).thenReturn(ListObjectsResponse(data=[OntologyObject({"id": "a", "seats": 180})]))
+
+        objects = aircraft.list_objects(
+            order_by=[("seats", OrderTerm.DESCENDING)],
+            filters=[
+                PropertyFilter("seats", FilterTerm.GREATER_THAN, 100),
+                PropertyFilter("retired", FilterTerm.IS_NULL, True),
+            ],
+        )
+
+        expect(list(objects)).to(equal([FinalObject(None, {"id": "a", "seats": 180})]))
+
+    def test_object(self):
+        aircraft = self._aircraft()
+        when(self.api_service).get_object(
+            auth_header=self.AUTH_HEADER, ontology_rid=self.rid1, object_type="Aircraft", primary_key="a",
+            properties=None
+        ).thenReturn(OntologyObject({"id": "a"}, rid="ri.phonograph2-objects.main.object.1"))
+        not_found = requests.Response()
+        not_found.status_code = 404
+        when(self.api_service).get_object(
+            auth_header=self.AUTH_HEADER, ontology_rid=self.rid1, object_type="Aircraft", primary_key="missing",
+            properties=None
+        ).thenRaise(HTTPError(response=not_found))
+
+        obj = aircraft.object("a")
+        expect(obj).to(equal(FinalObject(
+            ResourceIdentifier.try_parse("ri.phonograph2-objects.main.object.1"), {"id": "a"}
+        )))
+        expect(obj.primary_key).to(equal("a"))
+        expect(lambda: aircraft.object("missing")).to(raise_error(ValueError))
+
+    def _stub_link(self, object_type: str, link_type: str, target: str, primary_key: str, properties=None):
+        when(self.api_service).get_outgoing_link_type(
+            auth_header=self.AUTH_HEADER, ontology_rid=self.rid1, object_type=object_type, link_type=link_type
+        ).thenReturn(LinkTypeSide(api_name=link_type, object_type_api_name=target))
+        when(self.api_service).get_object_type(
+            auth_header=self.AUTH_HEADER, ontology_rid=self.rid1, object_type=target
+        ).thenReturn(ObjectType(
+            target, "", [primary_key], {name: Property("", base_type) for name, base_type in (properties or {}).items()},
+            f"ri.ontology.main.object-type.{target}"
+        ))
+
+    def test_list_linked_objects_filters_received_objects(self):
+        obj = FinalObject(None, {"id": "a"}, object_type=self._aircraft(), client=self.client)
+        self._stub_link("Aircraft", "flights", "Flight", "number", {"number": "String", "delay": "Integer"})
+        when(self.api_service).list_linked_objects(
+            auth_header=self.AUTH_HEADER, ontology_rid=self.rid1, object_type="Aircraft", primary_key="a",
+            link_type="flights", page_size=None, page_token=None, properties=["number", "delay"], order_by=None
+        ).thenReturn(ListObjectsResponse(data=[
+            OntologyObject({"number": "F1", "delay": 10}),
+            OntologyObject({"number": "F2", "delay": 40}),
+            OntologyObject({"number": "F3"}),
+        ]))
+
+        linked = obj.list_linked_objects(
+            "flights", properties=["number"], filters=[PropertyFilter("delay", FilterTerm.GREATER_THAN_OR_EQUAL, 30)]
+        )
+
+        expect(list(linked)).to(equal([FinalObject(None, {"number": "F2", "delay": 40})]))
+
+    def test_list_linked_objects_compares_typed_values(self):
+        obj = FinalObject(None, {"id": "a"}, object_type=self._aircraft(), client=self.client)
+        self._stub_link(
+            "Aircraft", "flights", "Flight", "number", {"number": "String", "day": "Date", "departure": "Timestamp"}
+        )
+        when(self.api_service).list_linked_objects(
+            auth_header=self.AUTH_HEADER, ontology_rid=self.rid1, object_type="Aircraft", primary_key="a",
+            link_type="flights", page_size=None, page_token=None, properties=None, order_by=None
+        ).thenReturn(ListObjectsResponse(data=[
+            OntologyObject({"number": "F1", "day": "2022-03-01", "departure": "2022-03-01T08:00:00Z"}),
+            OntologyObject({"number": "F2", "day": "2022-03-02", "departure": "2022-03-02T08:00:00Z"}),
+        ]))
+
+        by_day = obj.list_linked_objects(
+            "flights", filters=[PropertyFilter("day", FilterTerm.GREATER_THAN, datetime.date(2022, 3, 1))]
+        )
+        by_departure = obj.list_linked_objects(
+            "flights",
+            filters=[PropertyFilter("departure", FilterTerm.LESS_THAN, datetime.datetime(2022, 3, 1, 12))],
+        )
+
+        expect([o.primary_key for o in by_day]).to(equal(["F2"]))
+        expect([o.primary_key for o in by_departure]).to(equal(["F1"]))
+        expect(lambda: next(obj.list_linked_objects(
+            "flights", filters=[PropertyFilter("delay", FilterTerm.EQUAL, 1)]
+        ))).to(raise_error(ValueError))
+
+    def test_linked_objects_navigate_across_links(self):
+        aircraft = FinalObject(None, {"id": "a"}, object_type=self._aircraft(), client=self.client)
+        self._stub_link("Aircraft", "flights", "Flight", "number")
+        self._stub_link("Flight", "destination", "Airport", "code")
+        when(self.api_service).list_linked_objects(
+            auth_header=self.AUTH_HEADER, ontology_rid=self.rid1, object_type="Aircraft", primary_key="a",
+            link_type="flights", page_size=None, page_token=None, properties=None, order_by=None
+        ).thenReturn(ListObjectsResponse(data=[OntologyObject({"number": "F1"})]))
+        when(self.api_service).get_linked_object(
+            auth_header=self.AUTH_HEADER, ontology_rid=self.rid1, object_type="Flight", primary_key="F1",
+            link_type="destination", linked_object_primary_key="JFK", properties=None
+        ).thenReturn(OntologyObject({"code": "JFK"}))
+
+        flight = next(aircraft.list_linked_objects("flights"))
+        airport = flight.linked_object("destination", "JFK")
+
+        expect(flight.object_type.api_name).to(equal("Flight"))
+        expect(flight.primary_key).to(equal("F1"))
+        expect(airport.object_type.api_name).to(equal("Airport"))
+        expect(airport.primary_key).to(equal("JFK"))
+        flight.linked_object("destination", "JFK")
+        verify(self.api_service, times=2).get_outgoing_link_type(...)
+
+    def test_primary_key_not_returned(self):
+        obj = FinalObject(None, {"seats": 180}, object_type=self._aircraft(), client=self.client)
 
+        expect(lambda: obj.primary_key).to(raise_error(ValueError))
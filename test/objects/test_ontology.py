@@ -73,7 +73,7 @@ class TestOntology:
             yield object_type1
             yield object_type2
 
-        when(self.client).list_object_types(self.ontology_rid).thenReturn(gen())
+        when(self.client).list_object_types(self.ontology_rid, page_size=None).thenReturn(gen())
 
         expect(list(self.ontology.list_object_types())).to(equal([object_type1, object_type2]))
 
@@ -13,12 +13,12 @@
 #  limitations under the License.
 
 import pytest
-from expects import expect, equal, raise_error
+from expects import expect, be, equal, raise_error
 from unittest.mock import patch
 
 from palantir.objects.client import ObjectsClient
 from palantir.objects.core import Ontology
-from palantir.objects import list_ontologies, ontology
+from palantir.objects import list_ontologies, ontology, _objects_client
 from palantir.core.types import ResourceIdentifier, PalantirContext
 
 from palantir.core.config import StaticTokenProvider, StaticHostnameProvider, AuthToken, StaticOntologyRidProvider
@@ -43,7 +43,9 @@ class TestObjects:
             client=None
         )
 
-    def test_list_ontologies_with_no_input(self):
+    def test_list_ontologies_with_no_input(self, monkeypatch):
+        monkeypatch.setenv("PALANTIR_HOSTNAME", "unused")
+        monkeypatch.setenv("PALANTIR_TOKEN", self.AUTH_HEADER)
         with patch.object(
                 ObjectsClient, 'list_ontologies', return_value=[self.ontology1, self.ontology2]
         ) as mocked_method:
@@ -108,3 +110,35 @@ class TestObjects:
             ctx.ontology_rid_provider = StaticOntologyRidProvider("bad_rid")
             expect(lambda: ontology(ctx=ctx)).to(raise_error(ValueError))
 
+    def test_objects_client_shared_per_context(self):
+        ctx: PalantirContext = PalantirContext(
+            StaticHostnameProvider("unused"),
+            StaticTokenProvider(AuthToken(self.AUTH_HEADER))
+        )
+        other: PalantirContext = PalantirContext(
+            StaticHostnameProvider("other"),
+            StaticTokenProvider(AuthToken(self.AUTH_HEADER))
+        )
+
+        client = _objects_client(ctx)
+        expect(client.ctx).to(be(ctx))
+        expect(_objects_client(ctx)).to(be(client))
+        expect(_objects_client(other)).not_to(be(client))
+        expect(_objects_client(other).ctx).to(be(other))
+
+    def test_objects_client_reuses_default_client_until_config_changes(self, monkeypatch):
+        monkeypatch.setenv("PALANTIR_HOSTNAME", "first")
+        monkeypatch.setenv("PALANTIR_TOKEN", self.AUTH_HEADER)
+
+        client = _objects_client()
+        expect(_objects_client()).to(be(client))
+        expect(client.ctx.hostname).to(equal("first"))
+
+        monkeypatch.setenv("PALANTIR_HOSTNAME", "second")
+        changed = _objects_client()
+        expect(changed).not_to(be(client))
+        expect(changed.ctx.hostname).to(equal("second"))
+        expect(_objects_client()).to(be(changed))
+
+        monkeypatch.setenv("PALANTIR_TOKEN", "other-token")
+        expect(_objects_client()).not_to(be(changed))
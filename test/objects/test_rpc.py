@@ -114,6 +114,7 @@ class TestRPC:
             assert mocked_request.call_args.args[1] == self.api_root + f"/ontologies/{self.ontology_rid}/objectTypes"
             assert len(mocked_request.call_args.kwargs) == 3
             assert mocked_request.call_args.kwargs["params"]["pageToken"] is None
+            assert mocked_request.call_args.kwargs["params"]["pageSize"] is None
             assert mocked_request.call_args.kwargs["headers"]["Authorization"] == self.AUTH_HEADER
             assert mocked_request.call_args.kwargs["json"] is None
 
@@ -143,3 +144,38 @@ class TestRPC:
         pass
 
 
+
+    def test_list_objects(self):
+        with patch('conjure_python_client.Service._request') as mocked_request:
+            service = ConjureClient().service(
+                APIService,
+                self.api_root,
+            )
+            mocked_response = MagicMock()
+            mocked_request.return_value = mocked_response
+            mocked_response.json.return_value = {
+                'nextPageToken': "next",
+                'data': [
+                    {'rid': "ri.phonograph2-objects.main.object.1", 'properties': {'id': "a", 'count': 1}},
+                ]
+            }
+
+            output = service.list_objects(
+                auth_header=self.AUTH_HEADER,
+                ontology_rid=self.ontology_rid,
+                object_type="Aircraft",
+                page_size=10,
+                properties=["id", "count"],
+                order_by="properties.count:desc",
+            )
+
+            assert mocked_request.call_args.args[1] == self.api_root + f"/ontologies/{self.ontology_rid}/objects/Aircraft"
+            assert mocked_request.call_args.kwargs["params"] == {
+                "pageSize": 10,
+                "pageToken": None,
+                "properties": ["id", "count"],
+                "orderBy": "properties.count:desc",
+            }
+            assert output.next_page_token == "next"
+            assert output.data[0].rid == "ri.phonograph2-objects.main.object.1"
+            assert output.data[0].properties == {'id': "a", 'count': 1}